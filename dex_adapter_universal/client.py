@@ -7,7 +7,9 @@ through functional modules (wallet, market, swap, lp).
 
 from __future__ import annotations
 
-from typing import Optional, Union, List, TYPE_CHECKING
+import functools
+import threading
+from typing import Any, Dict, Optional, Union, List, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from solders.keypair import Keypair
@@ -78,12 +80,16 @@ class DexClient:
         # Initialize transaction builder
         self._tx_builder = TxBuilder(self._rpc, self._signer, config=tx_config)
 
-        # Lazy-loaded modules
+        # Lazy-loaded modules (guarded so concurrent first access builds one)
+        self._modules_lock = threading.Lock()
         self._wallet: Optional["WalletModule"] = None
         self._market: Optional["MarketModule"] = None
         self._swap: Optional["SwapModule"] = None
         self._lp: Optional["LiquidityModule"] = None
 
+        # Protocol adapters by name (adapters are stateless apart from the RPC client)
+        self._adapter_cache: Dict[str, Any] = {}
+
     @property
     def rpc(self) -> RpcClient:
         """Access to RPC client"""
@@ -112,12 +118,14 @@ class DexClient:
         Provides:
         - balance(token): Get token balance
         - balances(): Get all token balances
+        - balances_for(tokens): Get balances for several tokens in one read
         - sol_balance(): Get SOL balance
         - token_accounts(): List token accounts
         """
         if self._wallet is None:
-            from .modules.wallet import WalletModule
-            self._wallet = WalletModule(self)
+            with self._modules_lock:
+                if self._wallet is None:
+                    self._wallet = _wallet_cls()(self)
         return self._wallet
 
     @property
@@ -132,8 +140,9 @@ class DexClient:
         - price(symbol): Get current price
         """
         if self._market is None:
-            from .modules.market import MarketModule
-            self._market = MarketModule(self)
+            with self._modules_lock:
+                if self._market is None:
+                    self._market = _market_cls()(self)
         return self._market
 
     @property
@@ -147,8 +156,9 @@ class DexClient:
         - swap(from_token, to_token, amount): Quote and execute
         """
         if self._swap is None:
-            from .modules.swap import SwapModule
-            self._swap = SwapModule(self)
+            with self._modules_lock:
+                if self._swap is None:
+                    self._swap = _swap_cls()(self)
         return self._swap
 
     @property
@@ -166,8 +176,9 @@ class DexClient:
         - get_position(id): Get single position
         """
         if self._lp is None:
-            from .modules.liquidity import LiquidityModule
-            self._lp = LiquidityModule(self)
+            with self._modules_lock:
+                if self._lp is None:
+                    self._lp = _liquidity_cls()(self)
         return self._lp
 
     def get_adapter(self, protocol: str):
@@ -178,9 +189,14 @@ class DexClient:
             protocol: Protocol name (e.g., "raydium", "meteora")
 
         Returns:
-            ProtocolAdapter instance
+            ProtocolAdapter instance (cached per client)
         """
-        return ProtocolRegistry.get(protocol, self._rpc)
+        key = protocol.lower()
+        adapter = self._adapter_cache.get(key)
+        if adapter is None:
+            # setdefault keeps a single instance if two threads race here
+            adapter = self._adapter_cache.setdefault(key, ProtocolRegistry.get(protocol, self._rpc))
+        return adapter
 
     def close(self):
         """Close client connections and release resources"""
@@ -202,6 +218,7 @@ class DexClient:
         # Note: LiquidityModule doesn't have a cleanup close() method
         # (its close() method is for closing LP positions)
         self._lp = None
+        self._adapter_cache.clear()
 
         # Close RPC client
         self._rpc.close()
@@ -216,6 +233,32 @@ class DexClient:
         return f"DexClient(endpoint={self._rpc.endpoint}, pubkey={self.pubkey[:8]}...)"
 
 
+# Module classes are imported on first use (once per process) to keep
+# `import dex_adapter_universal` from pulling in every protocol adapter.
+@functools.cache
+def _wallet_cls():
+    from .modules.wallet import WalletModule
+    return WalletModule
+
+
+@functools.cache
+def _market_cls():
+    from .modules.market import MarketModule
+    return MarketModule
+
+
+@functools.cache
+def _swap_cls():
+    from .modules.swap import SwapModule
+    return SwapModule
+
+
+@functools.cache
+def _liquidity_cls():
+    from .modules.liquidity import LiquidityModule
+    return LiquidityModule
+
+
 # Type hints for modules (resolved at runtime)
 if TYPE_CHECKING:
     from .modules.wallet import WalletModule
@@ -91,6 +91,17 @@ class RpcConfig:
     timeout_seconds: float = field(default_factory=lambda: _get_env_float("RPC_TIMEOUT_SECONDS", 30.0))
     max_retries: int = field(default_factory=lambda: _get_env_int("RPC_MAX_RETRIES", 3))
     commitment: str = field(default_factory=lambda: _get_env("RPC_COMMITMENT", "confirmed"))
+    # Short-lived caches for idempotent reads (seconds, 0 disables)
+    blockhash_cache_ttl: float = field(default_factory=lambda: _get_env_float("RPC_BLOCKHASH_CACHE_TTL", 1.0))
+    token_accounts_cache_ttl: float = field(default_factory=lambda: _get_env_float("RPC_TOKEN_ACCOUNTS_CACHE_TTL", 2.0))
+    account_info_cache_ttl: float = field(default_factory=lambda: _get_env_float("RPC_ACCOUNT_INFO_CACHE_TTL", 0.5))
+    # Request base64+zstd account data (needs zstandard; results are returned as base64)
+    prefer_compressed: bool = field(default_factory=lambda: _get_env_bool("RPC_PREFER_COMPRESSED", False))
+    # WebSocket endpoint for signatureSubscribe (empty derives it from url)
+    ws_url: str = field(default_factory=lambda: _get_env("SOLANA_WS_URL", ""))
+    # Wait for confirmations via signatureSubscribe instead of polling (opt-in;
+    # needs a provider that serves WebSockets)
+    ws_confirm: bool = field(default_factory=lambda: _get_env_bool("RPC_WS_CONFIRM", False))
 
 
 @dataclass
@@ -269,6 +280,16 @@ class LoggingConfig:
         return getattr(logging, self.log_level.upper(), logging.INFO)
 
 
+@dataclass
+class MarketConfig:
+    """Market data configuration"""
+    # Parsed pools are reused for this long (seconds, 0 disables)
+    pool_cache_ttl: float = field(default_factory=lambda: _get_env_float("MARKET_POOL_CACHE_TTL", 2.0))
+    pool_cache_size: int = field(default_factory=lambda: _get_env_int("MARKET_POOL_CACHE_SIZE", 256))
+    # price()/price_usd() results are reused for this long (seconds, 0 disables)
+    price_cache_ttl: float = field(default_factory=lambda: _get_env_float("MARKET_PRICE_CACHE_TTL", 1.0))
+
+
 @dataclass
 class TradingConfig:
     """Default trading parameters"""
@@ -297,6 +318,7 @@ class Config:
     pancakeswap: PancakeSwapConfig = field(default_factory=PancakeSwapConfig)
     uniswap: UniswapConfig = field(default_factory=UniswapConfig)
     trading: TradingConfig = field(default_factory=TradingConfig)
+    market: MarketConfig = field(default_factory=MarketConfig)
     solana: SolanaConfig = field(default_factory=SolanaConfig)
     evm: EVMConfig = field(default_factory=EVMConfig)
     logging: LoggingConfig = field(default_factory=LoggingConfig)
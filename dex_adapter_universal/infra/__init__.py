@@ -6,16 +6,21 @@ Provides:
 - Signer: Transaction signing abstraction (local keypair)
 - TxBuilder: Transaction assembly and sending
 - EVMSigner: EVM transaction signing using web3.py
-- Retry utilities: execute_with_retry, classify_error
+- Retry utilities: execute_with_retry, classify_error, jittered_backoff
+- TtlCache: Thread-safe in-process cache with per-entry expiry
+- RequestCoalescer: Collapses concurrent identical lookups into one call
+- new_http_transport / new_async_http_transport: Shared pooled httpx transports
 """
 
+from .cache import TtlCache, RequestCoalescer
+from .http import new_http_transport, new_async_http_transport
 from .rpc import RpcClient, RpcClientConfig
 from .solana_signer import (
     Signer,
     LocalSigner,
     create_signer,
 )
-from .tx_builder import TxBuilder, TxBuilderConfig
+from .tx_builder import TxBuilder, TxBuilderConfig, reload_tx_defaults
 
 # EVM infrastructure
 from .evm_signer import (
@@ -33,6 +38,7 @@ from .retry import (
     execute_with_retry,
     execute_swap_with_retry,
     classify_error,
+    jittered_backoff,
     CorrelationContext,
     generate_correlation_id,
     get_correlation_id,
@@ -48,6 +54,11 @@ __all__ = [
     "create_signer",
     "TxBuilder",
     "TxBuilderConfig",
+    "reload_tx_defaults",
+    "TtlCache",
+    "RequestCoalescer",
+    "new_http_transport",
+    "new_async_http_transport",
     # EVM infrastructure
     "EVMSigner",
     "NonceManager",
@@ -60,6 +71,7 @@ __all__ = [
     "execute_with_retry",
     "execute_swap_with_retry",
     "classify_error",
+    "jittered_backoff",
     # Correlation ID utilities
     "CorrelationContext",
     "generate_correlation_id",
@@ -0,0 +1,166 @@
+"""
+In-process TTL cache
+
+Provides a small thread-safe cache with per-entry expiry and an optional
+size bound (least recently used entries are evicted first). Used to skip
+repeated RPC round trips for reads that are requested many times within
+a short window.
+
+Also provides RequestCoalescer, which collapses concurrent identical
+lookups into a single call.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+# Sentinel returned by TtlCache.get() on a miss (cached values may be None)
+MISSING = object()
+
+
+class TtlCache:
+    """
+    Thread-safe cache with per-entry time-to-live
+
+    Usage:
+        cache = TtlCache(ttl_seconds=2.0, maxsize=256)
+
+        value = cache.get(key)
+        if value is MISSING:
+            value = fetch()
+            cache.set(key, value)
+
+        # Override TTL for a single entry (ttl <= 0 skips caching)
+        cache.set(key, value, ttl=0.5)
+    """
+
+    def __init__(self, ttl_seconds: float, maxsize: Optional[int] = None):
+        """
+        Initialize cache
+
+        Args:
+            ttl_seconds: Default lifetime of an entry in seconds
+            maxsize: Optional maximum number of entries (LRU eviction)
+        """
+        self._ttl = ttl_seconds
+        self._maxsize = maxsize
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def ttl_seconds(self) -> float:
+        """Default entry lifetime"""
+        return self._ttl
+
+    def get(self, key: Hashable) -> Any:
+        """
+        Get cached value
+
+        Returns:
+            Cached value, or MISSING if absent or expired
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return MISSING
+            expires_at, value = entry
+            if time.monotonic() >= expires_at:
+                del self._entries[key]
+                return MISSING
+            if self._maxsize is not None:
+                self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """
+        Store value
+
+        Args:
+            key: Cache key
+            value: Value to cache (None is allowed)
+            ttl: Optional lifetime override; values <= 0 are not cached
+        """
+        ttl = self._ttl if ttl is None else ttl
+        if ttl <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, value)
+            if self._maxsize is not None:
+                self._entries.move_to_end(key)
+                while len(self._entries) > self._maxsize:
+                    self._entries.popitem(last=False)
+
+    def invalidate(self, key: Hashable) -> None:
+        """Remove a single entry if present"""
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove all entries"""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+
+class RequestCoalescer:
+    """
+    Share one in-flight call between concurrent callers with the same key
+
+    The first caller for a key runs the function; callers arriving while it
+    is running wait for and receive the same result (or exception). Nothing
+    is kept once the call completes, so pair it with a cache if results
+    should outlive the call.
+
+    Usage:
+        coalescer = RequestCoalescer()
+
+        pool = coalescer.run(("raydium", address), lambda: adapter.get_pool(address))
+    """
+
+    def __init__(self):
+        self._inflight: Dict[Hashable, Future] = {}
+        self._lock = threading.Lock()
+
+    def run(self, key: Hashable, fn: Callable[[], Any]) -> Any:
+        """
+        Call fn, or wait for the identical call already in flight
+
+        Args:
+            key: Identity of the request
+            fn: Zero-argument function performing the request
+
+        Returns:
+            Result of fn
+        """
+        with self._lock:
+            future = self._inflight.get(key)
+            leader = future is None
+            if leader:
+                future = self._inflight[key] = Future()
+
+        if not leader:
+            return future.result()
+
+        try:
+            result = fn()
+        except BaseException as e:
+            self._finish(key)
+            future.set_exception(e)
+            raise
+        self._finish(key)
+        future.set_result(result)
+        return result
+
+    def _finish(self, key: Hashable) -> None:
+        """Stop routing new callers to the completed call"""
+        with self._lock:
+            self._inflight.pop(key, None)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._inflight)
@@ -0,0 +1,73 @@
+"""
+Shared HTTP transport setup
+
+Builds the httpx transports used by RpcClient and the REST API clients so
+they agree on HTTP/2, keep-alive and socket options: HTTP/2 when the
+optional h2 package is installed, idle connections kept well past httpx's
+5s default so serial calls do not pay a fresh TLS handshake, and Nagle
+disabled since request bodies are small.
+"""
+
+import socket
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+# HTTP/2 needs the optional h2 package (pip install httpx[http2])
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+SOCKET_OPTIONS = [(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)]
+
+
+def _limits(
+    max_connections: int,
+    max_keepalive_connections: int,
+    keepalive_expiry: float,
+) -> "httpx.Limits":
+    return httpx.Limits(
+        max_connections=max_connections,
+        max_keepalive_connections=max_keepalive_connections,
+        keepalive_expiry=keepalive_expiry,
+    )
+
+
+def new_http_transport(
+    *,
+    max_connections: int = 100,
+    max_keepalive_connections: int = 20,
+    keepalive_expiry: float = 60.0,
+) -> "httpx.HTTPTransport":
+    """
+    Create a pooled sync transport
+
+    Pool sizes default to httpx's own (100 connections, 20 kept alive).
+    Pool options go on the transport (httpx.Client ignores http2/limits
+    when a transport is given). The transport never retries; callers
+    handle retries themselves.
+    """
+    return httpx.HTTPTransport(
+        http2=HTTP2_AVAILABLE,
+        limits=_limits(max_connections, max_keepalive_connections, keepalive_expiry),
+        retries=0,
+        socket_options=SOCKET_OPTIONS,
+    )
+
+
+def new_async_http_transport(
+    *,
+    max_connections: int = 100,
+    max_keepalive_connections: int = 20,
+    keepalive_expiry: float = 60.0,
+) -> "httpx.AsyncHTTPTransport":
+    """Create a pooled async transport (same options as new_http_transport)"""
+    return httpx.AsyncHTTPTransport(
+        http2=HTTP2_AVAILABLE,
+        limits=_limits(max_connections, max_keepalive_connections, keepalive_expiry),
+        retries=0,
+        socket_options=SOCKET_OPTIONS,
+    )
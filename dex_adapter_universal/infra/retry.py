@@ -6,6 +6,7 @@ Includes structured logging with correlation IDs for transaction tracing.
 """
 
 import logging
+import random
 import time
 import uuid
 import contextvars
@@ -128,6 +129,24 @@ SLIPPAGE_KEYWORDS = [
 ]
 
 
+def jittered_backoff(attempt: int, base: float, cap: float = 8.0) -> float:
+    """
+    Full-jitter exponential backoff delay.
+
+    Randomizing the whole interval keeps retries from many workers from
+    hitting a rate-limited endpoint in lockstep.
+
+    Args:
+        attempt: Zero-based retry attempt
+        base: Base delay in seconds
+        cap: Maximum delay in seconds
+
+    Returns:
+        Delay in seconds, uniform in [0, min(cap, base * 2**attempt)]
+    """
+    return random.uniform(0, min(cap, base * (2 ** attempt)))
+
+
 def classify_error(error: Exception) -> Tuple[bool, bool, Optional[ErrorCode]]:
     """
     Classify an error to determine if it's recoverable or slippage-related.
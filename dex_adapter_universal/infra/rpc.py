@@ -6,15 +6,20 @@ Provides unified JSON-RPC interface with:
 - Retry logic
 - Rate limit handling
 - Request timeout management
+- Batch and async calls for overlapping independent requests
 """
 
 from __future__ import annotations
 
+import asyncio
+import binascii
+import functools
 import json
 import logging
 import time
 import threading
-from typing import Any, Dict, List, Optional, Union
+from base64 import b64encode as _b64e_raw
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 from dataclasses import dataclass
 
 try:
@@ -22,11 +27,130 @@ try:
 except ImportError:
     httpx = None
 
-from ..errors import RpcError, ConfigurationError
+try:
+    from solders.signature import Signature
+except ImportError:
+    Signature = None
+
+# orjson is several times faster than stdlib json for large account payloads
+try:
+    import orjson
+
+    _dumps = orjson.dumps
+    _loads = orjson.loads
+except ImportError:
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+    _loads = json.loads
+
+# websockets (pulled in by the solana package) enables push-based confirmation
+try:
+    from websockets.sync.client import connect as _ws_connect
+except ImportError:
+    _ws_connect = None
+
+# zstandard enables base64+zstd account encoding (smaller responses)
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+from .cache import TtlCache, MISSING
+from .http import new_http_transport, new_async_http_transport
+from .retry import jittered_backoff
+from ..errors import RpcError, ConfigurationError, ErrorCode
 from ..config import config as global_config
 
 logger = logging.getLogger(__name__)
 
+# Keep idle connections well past httpx's 5s default so serial calls do not
+# pay a fresh TLS handshake
+_KEEPALIVE_EXPIRY = 60.0
+
+
+# Budget for opening the signatureSubscribe WebSocket. Kept short so an
+# HTTP-only or firewalled provider falls back to polling almost at once
+# instead of spending the confirmation window on the connect.
+_WS_CONNECT_TIMEOUT = 2.0
+
+# getMultipleAccounts accepts at most 100 addresses per request
+_MAX_MULTIPLE_ACCOUNTS = 100
+# getSignatureStatuses limit on signatures per request
+_MAX_SIGNATURE_STATUSES = 256
+
+
+def _chunks(items: List[Any], size: int) -> List[List[Any]]:
+    """Split a list into consecutive chunks of at most size items"""
+    return [items[i:i + size] for i in range(0, len(items), size)]
+
+
+def _flatten_account_values(results: List[Any]) -> List[Optional[Dict[str, Any]]]:
+    """Concatenate per-chunk getMultipleAccounts results in order"""
+    values: List[Optional[Dict[str, Any]]] = []
+    for result in results:
+        if result:
+            values.extend(result.get("value", []))
+    return values
+
+
+# Upper bound on a rate-limit wait (matches the jittered_backoff cap)
+_RETRY_MAX_DELAY = 8.0
+
+# HTTP statuses that will not change on retry against the same endpoint
+_NON_RETRYABLE_STATUS = frozenset({400, 401, 403})
+
+
+def _is_retryable(error: Exception) -> bool:
+    """Whether a failed attempt is worth retrying on the same endpoint"""
+    if isinstance(error, httpx.HTTPStatusError):
+        return error.response.status_code not in _NON_RETRYABLE_STATUS
+    return True
+
+
+def _b64e(data: bytes) -> str:
+    """Base64-encode bytes straight to str (RPC wire format)"""
+    return _b64e_raw(data).decode("ascii")
+
+
+# Transaction option dicts are shared between calls and must not be mutated
+# (params are only serialized). Few distinct combinations occur in practice.
+@functools.lru_cache(maxsize=16)
+def _send_opts(skip_preflight: bool, commitment: str, max_retries: Optional[int]) -> Dict[str, Any]:
+    """sendTransaction options"""
+    opts: Dict[str, Any] = {
+        "skipPreflight": skip_preflight,
+        "preflightCommitment": commitment,
+        "encoding": "base64",
+    }
+    if max_retries is not None:
+        opts["maxRetries"] = max_retries
+    return opts
+
+
+@functools.lru_cache(maxsize=16)
+def _simulate_opts(commitment: str) -> Dict[str, Any]:
+    """simulateTransaction options"""
+    return {
+        "commitment": commitment,
+        "encoding": "base64",
+        "sigVerify": False,
+        "replaceRecentBlockhash": True,
+    }
+
+
+def _decompress_account(value: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """Rewrite base64+zstd account data in place as plain base64"""
+    if value:
+        data = value.get("data")
+        if isinstance(data, list) and len(data) == 2 and data[1] == "base64+zstd":
+            # Stream decompression: frames need not carry the content size
+            raw = zstandard.ZstdDecompressor().decompressobj().decompress(
+                binascii.a2b_base64(data[0])
+            )
+            value["data"] = [_b64e(raw), "base64"]
+    return value
+
 
 @dataclass
 class RpcClientConfig:
@@ -48,6 +172,12 @@ class RpcClientConfig:
     max_retries: Optional[int] = None
     retry_delay_seconds: Optional[float] = None
     commitment: Optional[str] = None
+    blockhash_cache_ttl: Optional[float] = None
+    token_accounts_cache_ttl: Optional[float] = None
+    account_info_cache_ttl: Optional[float] = None
+    prefer_compressed: Optional[bool] = None
+    ws_url: Optional[str] = None
+    ws_confirm: Optional[bool] = None
 
     def __post_init__(self):
         """Apply defaults from global config for any unset values"""
@@ -59,6 +189,18 @@ class RpcClientConfig:
             self.retry_delay_seconds = global_config.tx.retry_delay
         if self.commitment is None:
             self.commitment = global_config.rpc.commitment
+        if self.blockhash_cache_ttl is None:
+            self.blockhash_cache_ttl = global_config.rpc.blockhash_cache_ttl
+        if self.token_accounts_cache_ttl is None:
+            self.token_accounts_cache_ttl = global_config.rpc.token_accounts_cache_ttl
+        if self.account_info_cache_ttl is None:
+            self.account_info_cache_ttl = global_config.rpc.account_info_cache_ttl
+        if self.prefer_compressed is None:
+            self.prefer_compressed = global_config.rpc.prefer_compressed
+        if self.ws_url is None:
+            self.ws_url = global_config.rpc.ws_url
+        if self.ws_confirm is None:
+            self.ws_confirm = global_config.rpc.ws_confirm
 
 
 class RpcClient:
@@ -86,6 +228,9 @@ class RpcClient:
 
         # Custom RPC call
         result = rpc.call("getSlot", [])
+
+        # Async call (overlap independent requests with asyncio.gather)
+        slot = await rpc.acall("getSlot", [])
     """
 
     def __init__(
@@ -103,14 +248,28 @@ class RpcClient:
         if httpx is None:
             raise RuntimeError("httpx is required for RPC calls. Install with: pip install httpx")
 
-        self._endpoints = [endpoint] if isinstance(endpoint, str) else list(endpoint)
-        if not self._endpoints:
+        # Endpoints are fixed for the client's lifetime; rotation only moves the index
+        self._endpoints: Tuple[str, ...] = (endpoint,) if isinstance(endpoint, str) else tuple(endpoint)
+        self._n_endpoints = len(self._endpoints)
+        if not self._n_endpoints:
             raise ConfigurationError.missing("RPC endpoint")
 
         self._config = config or RpcClientConfig()
         self._current_endpoint_idx = 0
-        self._client: Optional[httpx.Client] = None
-        self._lock = threading.Lock()  # Protects _client and _current_endpoint_idx
+        self._client = self._new_client()
+        self._async_client: Optional[httpx.AsyncClient] = None
+        self._async_client_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._lock = threading.Lock()  # Protects _async_client and _current_endpoint_idx
+
+        # Shared params object for the common "default commitment only" case.
+        # Never mutated: call() serializes params without modifying them.
+        self._default_commitment_cfg: Dict[str, str] = {"commitment": self._config.commitment}
+
+        # Short-lived cache for idempotent reads (per-method TTLs from config)
+        self._cache = TtlCache(ttl_seconds=0.0)
+        # Blockhashes are kept separately: sending a transaction does not
+        # make a recent blockhash stale, so bursts of sends can share one
+        self._blockhash_cache = TtlCache(ttl_seconds=0.0)
 
     @property
     def endpoint(self) -> str:
@@ -122,58 +281,154 @@ class RpcClient:
         """Default commitment level"""
         return self._config.commitment
 
-    def _get_client(self) -> httpx.Client:
-        """Get or create HTTP client (thread-safe)"""
-        if self._client is None:
+    @property
+    def ws_url(self) -> str:
+        """WebSocket endpoint (configured, or derived from the current endpoint)"""
+        if self._config.ws_url:
+            return self._config.ws_url
+        endpoint = self.endpoint
+        if endpoint.startswith("https://"):
+            return "wss://" + endpoint[len("https://"):]
+        if endpoint.startswith("http://"):
+            return "ws://" + endpoint[len("http://"):]
+        return endpoint
+
+    def _new_client(self) -> httpx.Client:
+        """
+        Create the sync HTTP client
+
+        Constructing the client does no network I/O, so it is built up front
+        rather than behind a lock on first use. In forked worker processes,
+        call close() after the fork so the child does not share sockets.
+        """
+        # Retries are handled by _post, so the transport never retries
+        transport = new_http_transport(
+            max_keepalive_connections=10,
+            keepalive_expiry=_KEEPALIVE_EXPIRY,
+        )
+        return httpx.Client(
+            timeout=self._config.timeout_seconds,
+            headers={"Content-Type": "application/json"},
+            transport=transport,
+        )
+
+    def _get_async_client(self) -> httpx.AsyncClient:
+        """
+        Get or create the async HTTP client for the running event loop
+
+        The client multiplexes concurrent requests over pooled HTTP/2
+        connections when h2 is installed. A client is bound to the loop
+        it was first used on, so a new one is created if called from a
+        different loop (e.g. successive asyncio.run() calls).
+        """
+        loop = asyncio.get_running_loop()
+        if self._async_client is None or self._async_client_loop is not loop:
             with self._lock:
-                # Double-check after acquiring lock
-                if self._client is None:
-                    self._client = httpx.Client(
+                if self._async_client is None or self._async_client_loop is not loop:
+                    transport = new_async_http_transport(
+                        max_connections=100,
+                        max_keepalive_connections=50,
+                        keepalive_expiry=_KEEPALIVE_EXPIRY,
+                    )
+                    self._async_client = httpx.AsyncClient(
                         timeout=self._config.timeout_seconds,
                         headers={"Content-Type": "application/json"},
+                        transport=transport,
                     )
-        return self._client
+                    self._async_client_loop = loop
+        return self._async_client
+
+    def _commitment_cfg(self, commitment: Optional[str]) -> Dict[str, str]:
+        """Return {"commitment": ...} params, reusing the shared default object"""
+        if commitment is None:
+            commitment = self._config.commitment
+        default_cfg = self._default_commitment_cfg
+        if default_cfg["commitment"] == commitment:
+            return default_cfg
+        return {"commitment": commitment}
+
+    def _wire_encoding(self, encoding: str) -> str:
+        """Encoding to request: base64+zstd in place of base64 when preferred"""
+        if encoding == "base64" and self._config.prefer_compressed and zstandard is not None:
+            return "base64+zstd"
+        return encoding
+
+    def invalidate_cache(self) -> None:
+        """
+        Drop cached account and balance reads
+
+        Called automatically after sending a transaction, since any write
+        may change balances and account data. The cached blockhash is kept
+        (see invalidate_blockhash).
+        """
+        self._cache.clear()
+
+    def invalidate_blockhash(self) -> None:
+        """Drop the cached blockhash so the next get_latest_blockhash refetches"""
+        self._blockhash_cache.clear()
 
     def _rotate_endpoint(self):
         """Rotate to next endpoint on failure (thread-safe)"""
-        if len(self._endpoints) > 1:
+        if self._n_endpoints > 1:
             with self._lock:
-                self._current_endpoint_idx = (self._current_endpoint_idx + 1) % len(self._endpoints)
+                self._current_endpoint_idx = (self._current_endpoint_idx + 1) % self._n_endpoints
                 new_endpoint = self._endpoints[self._current_endpoint_idx]
             logger.info(f"Rotating to RPC endpoint: {new_endpoint}")
 
-    def call(
+    def _build_body(
         self,
         method: str,
         params: List[Any],
+        request_id: int = 1,
+    ) -> Dict[str, Any]:
+        """Build a single JSON-RPC 2.0 request object"""
+        return {
+            "jsonrpc": "2.0",
+            "id": request_id,
+            "method": method,
+            "params": params,
+        }
+
+    @staticmethod
+    def _raise_rpc_error(error: Dict[str, Any], endpoint: str):
+        """Raise RpcError from a JSON-RPC error object, preserving code and data"""
+        error_msg = error.get("message", str(error))
+        rpc_error = RpcError(
+            f"RPC error: {error_msg}",
+            endpoint=endpoint,
+        )
+        # Preserve RPC error code in details for debugging
+        if rpc_error.details is None:
+            rpc_error.details = {}
+        rpc_error.details["rpc_error_code"] = error.get("code")
+        rpc_error.details["rpc_error_data"] = error.get("data")
+        raise rpc_error
+
+    def _post(
+        self,
+        body: Union[Dict[str, Any], List[Dict[str, Any]]],
         timeout: Optional[float] = None,
     ) -> Any:
         """
-        Make JSON-RPC call
+        POST a JSON-RPC payload with retry and endpoint fallback
 
         Args:
-            method: RPC method name
-            params: RPC parameters
+            body: Single request object or batch array
             timeout: Optional timeout override
 
         Returns:
-            RPC result
+            Decoded JSON response (dict for single request, list for batch)
 
         Raises:
-            RpcError: On RPC failure
+            RpcError: When all endpoints and retries are exhausted
         """
-        client = self._get_client()
-        request_id = 1
-        body = {
-            "jsonrpc": "2.0",
-            "id": request_id,
-            "method": method,
-            "params": params,
-        }
+        client = self._client
 
-        last_error: Optional[Exception] = None
+        # (kind, exception, endpoint, timeout) of the latest failed attempt;
+        # the RpcError itself is only built if every attempt fails
+        last_failure: Optional[Tuple[str, Exception, str, float]] = None
         endpoints_tried = 0
-        max_endpoints = len(self._endpoints)
+        max_endpoints = self._n_endpoints
 
         while endpoints_tried < max_endpoints:
             for attempt in range(self._config.max_retries):
@@ -182,75 +437,285 @@ class RpcClient:
 
                     response = client.post(
                         self.endpoint,
-                        json=body,
+                        content=_dumps(body),
                         timeout=timeout_val,
                     )
 
                     # Handle rate limiting
                     if response.status_code == 429:
-                        logger.warning(f"Rate limited by {self.endpoint}")
-                        time.sleep(self._config.retry_delay_seconds * (attempt + 1))
+                        logger.warning("Rate limited by %s", self.endpoint)
+                        # After the last attempt the next step is another endpoint
+                        if attempt < self._config.max_retries - 1:
+                            time.sleep(self._rate_limit_delay(response, attempt))
                         continue
 
                     response.raise_for_status()
-                    result = response.json()
-
-                    # Check for RPC error
-                    if "error" in result:
-                        error = result["error"]
-                        error_msg = error.get("message", str(error))
-                        error_code = error.get("code")
-                        rpc_error = RpcError(
-                            f"RPC error: {error_msg}",
-                            endpoint=self.endpoint,
-                        )
-                        # Preserve RPC error code in details for debugging
-                        if rpc_error.details is None:
-                            rpc_error.details = {}
-                        rpc_error.details["rpc_error_code"] = error_code
-                        rpc_error.details["rpc_error_data"] = error.get("data")
-                        raise rpc_error
-
-                    return result.get("result")
-
-                except httpx.TimeoutException as e:
-                    last_error = RpcError.timeout(self.endpoint, timeout_val)
-                    logger.warning(f"RPC timeout (attempt {attempt + 1}): {self.endpoint}")
-
-                except httpx.HTTPStatusError as e:
-                    if e.response.status_code == 429:
-                        last_error = RpcError.rate_limited(self.endpoint)
-                    else:
-                        last_error = RpcError(
-                            f"HTTP error {e.response.status_code}",
-                            endpoint=self.endpoint,
-                        )
-                    logger.warning(f"RPC HTTP error (attempt {attempt + 1}): {e}")
+                    return _loads(response.content)
 
-                except httpx.RequestError as e:
-                    last_error = RpcError.connection_failed(self.endpoint, e)
-                    logger.warning(f"RPC connection error (attempt {attempt + 1}): {e}")
+                except Exception as e:
+                    kind = self._log_request_error(e, attempt)
+                    last_failure = (kind, e, self.endpoint, timeout_val)
+                    if not _is_retryable(e):
+                        # Deterministic rejection: move straight to the next endpoint
+                        break
 
-                except RpcError:
-                    raise
+                # Wait before retry
+                if attempt < self._config.max_retries - 1:
+                    time.sleep(jittered_backoff(attempt, self._config.retry_delay_seconds))
 
-                except Exception as e:
-                    last_error = RpcError(
-                        f"Unexpected error: {e}",
-                        endpoint=self.endpoint,
-                        original_error=e,
+            # All retries failed, try next endpoint
+            self._rotate_endpoint()
+            endpoints_tried += 1
+
+        # All endpoints failed
+        if last_failure is not None:
+            raise self._build_request_error(*last_failure)
+        raise RpcError("All RPC endpoints failed")
+
+    async def _apost(
+        self,
+        body: Union[Dict[str, Any], List[Dict[str, Any]]],
+        timeout: Optional[float] = None,
+    ) -> Any:
+        """
+        Async counterpart of _post (same retry and endpoint fallback policy)
+
+        Args:
+            body: Single request object or batch array
+            timeout: Optional timeout override
+
+        Returns:
+            Decoded JSON response (dict for single request, list for batch)
+
+        Raises:
+            RpcError: When all endpoints and retries are exhausted
+        """
+        client = self._get_async_client()
+
+        # (kind, exception, endpoint, timeout) of the latest failed attempt;
+        # the RpcError itself is only built if every attempt fails
+        last_failure: Optional[Tuple[str, Exception, str, float]] = None
+        endpoints_tried = 0
+        max_endpoints = self._n_endpoints
+
+        while endpoints_tried < max_endpoints:
+            for attempt in range(self._config.max_retries):
+                try:
+                    timeout_val = timeout or self._config.timeout_seconds
+
+                    response = await client.post(
+                        self.endpoint,
+                        content=_dumps(body),
+                        timeout=timeout_val,
                     )
 
+                    # Handle rate limiting
+                    if response.status_code == 429:
+                        logger.warning("Rate limited by %s", self.endpoint)
+                        # After the last attempt the next step is another endpoint
+                        if attempt < self._config.max_retries - 1:
+                            await asyncio.sleep(self._rate_limit_delay(response, attempt))
+                        continue
+
+                    response.raise_for_status()
+                    return _loads(response.content)
+
+                except Exception as e:
+                    kind = self._log_request_error(e, attempt)
+                    last_failure = (kind, e, self.endpoint, timeout_val)
+                    if not _is_retryable(e):
+                        # Deterministic rejection: move straight to the next endpoint
+                        break
+
                 # Wait before retry
                 if attempt < self._config.max_retries - 1:
-                    time.sleep(self._config.retry_delay_seconds * (attempt + 1))
+                    await asyncio.sleep(jittered_backoff(attempt, self._config.retry_delay_seconds))
 
             # All retries failed, try next endpoint
             self._rotate_endpoint()
             endpoints_tried += 1
 
         # All endpoints failed
-        raise last_error or RpcError("All RPC endpoints failed")
+        if last_failure is not None:
+            raise self._build_request_error(*last_failure)
+        raise RpcError("All RPC endpoints failed")
+
+    def _rate_limit_delay(self, response: Any, attempt: int) -> float:
+        """
+        Delay before retrying a 429: Retry-After if given, else jittered backoff
+
+        Never more than _RETRY_MAX_DELAY, so a provider asking for minutes
+        cannot stall the call past its timeout.
+        """
+        delay = jittered_backoff(attempt, self._config.retry_delay_seconds)
+        try:
+            retry_after = float(response.headers.get("Retry-After", 0))
+        except (TypeError, ValueError):
+            # HTTP-date form (or malformed header) - fall back to backoff
+            retry_after = 0.0
+        return min(max(retry_after, delay), _RETRY_MAX_DELAY)
+
+    def _log_request_error(self, error: Exception, attempt: int) -> str:
+        """Classify a transport exception from one attempt and log it"""
+        if isinstance(error, httpx.TimeoutException):
+            kind = "timeout"
+        elif isinstance(error, httpx.HTTPStatusError):
+            kind = "rate_limited" if error.response.status_code == 429 else "http"
+        elif isinstance(error, httpx.RequestError):
+            kind = "connection"
+        else:
+            return "unexpected"
+
+        # Lazy %-formatting: nothing is rendered when WARNING is filtered
+        logger.warning("RPC %s error (attempt %d) on %s: %s", kind, attempt + 1, self.endpoint, error)
+        return kind
+
+    @staticmethod
+    def _build_request_error(
+        kind: str,
+        error: Exception,
+        endpoint: str,
+        timeout_val: float,
+    ) -> RpcError:
+        """Materialize the RpcError for the final failed attempt"""
+        if kind == "timeout":
+            return RpcError.timeout(endpoint, timeout_val)
+        if kind == "rate_limited":
+            return RpcError.rate_limited(endpoint)
+        if kind == "http":
+            return RpcError(
+                f"HTTP error {error.response.status_code}",
+                endpoint=endpoint,
+            )
+        if kind == "connection":
+            return RpcError.connection_failed(endpoint, error)
+        return RpcError(
+            f"Unexpected error: {error}",
+            endpoint=endpoint,
+            original_error=error,
+        )
+
+    def call(
+        self,
+        method: str,
+        params: List[Any],
+        timeout: Optional[float] = None,
+    ) -> Any:
+        """
+        Make JSON-RPC call
+
+        Args:
+            method: RPC method name
+            params: RPC parameters
+            timeout: Optional timeout override
+
+        Returns:
+            RPC result
+
+        Raises:
+            RpcError: On RPC failure
+        """
+        result = self._post(self._build_body(method, params), timeout)
+
+        # Check for RPC error
+        if "error" in result:
+            self._raise_rpc_error(result["error"], self.endpoint)
+
+        return result.get("result")
+
+    async def acall(
+        self,
+        method: str,
+        params: List[Any],
+        timeout: Optional[float] = None,
+    ) -> Any:
+        """
+        Make JSON-RPC call without blocking the event loop
+
+        Independent calls can be overlapped with asyncio.gather():
+
+            balance, slot = await asyncio.gather(
+                rpc.aget_balance(address),
+                rpc.acall("getSlot", []),
+            )
+
+        Args:
+            method: RPC method name
+            params: RPC parameters
+            timeout: Optional timeout override
+
+        Returns:
+            RPC result
+
+        Raises:
+            RpcError: On RPC failure
+        """
+        result = await self._apost(self._build_body(method, params), timeout)
+
+        if "error" in result:
+            self._raise_rpc_error(result["error"], self.endpoint)
+
+        return result.get("result")
+
+    def call_batch(
+        self,
+        calls: List[Tuple[str, List[Any]]],
+        timeout: Optional[float] = None,
+    ) -> List[Any]:
+        """
+        Make several JSON-RPC calls in a single HTTP request
+
+        Sends a JSON-RPC 2.0 batch array and matches responses back to
+        requests by id, so results are returned in request order regardless
+        of the order the server answers in.
+
+        Args:
+            calls: List of (method, params) tuples
+            timeout: Optional timeout override
+
+        Returns:
+            List of RPC results, one per call, in request order
+
+        Raises:
+            RpcError: On transport failure or if any call returns an error
+
+        Example:
+            slot, height = rpc.call_batch([
+                ("getSlot", []),
+                ("getBlockHeight", []),
+            ])
+        """
+        if not calls:
+            return []
+
+        body = [
+            self._build_body(method, params, request_id)
+            for request_id, (method, params) in enumerate(calls, start=1)
+        ]
+        payload = self._post(body, timeout)
+
+        # Some endpoints reject batches with a single top-level error object
+        if isinstance(payload, dict):
+            if "error" in payload:
+                self._raise_rpc_error(payload["error"], self.endpoint)
+            payload = [payload]
+
+        responses = {entry.get("id"): entry for entry in payload if isinstance(entry, dict)}
+
+        results = []
+        for request_id, (method, _) in enumerate(calls, start=1):
+            entry = responses.get(request_id)
+            if entry is None:
+                raise RpcError(
+                    f"Missing response for batch request {request_id} ({method})",
+                    ErrorCode.RPC_INVALID_RESPONSE,
+                    endpoint=self.endpoint,
+                )
+            if "error" in entry:
+                self._raise_rpc_error(entry["error"], self.endpoint)
+            results.append(entry.get("result"))
+
+        return results
 
     def get_account_info(
         self,
@@ -269,15 +734,26 @@ class RpcClient:
         Returns:
             Account info or None if not found
         """
+        commitment = commitment or self.commitment
+        cache_key = ("getAccountInfo", address, encoding, commitment)
+        cached = self._cache.get(cache_key)
+        if cached is not MISSING:
+            return cached
+
+        wire_encoding = self._wire_encoding(encoding)
         params = [
             address,
             {
-                "encoding": encoding,
-                "commitment": commitment or self.commitment,
+                "encoding": wire_encoding,
+                "commitment": commitment,
             },
         ]
         result = self.call("getAccountInfo", params)
-        return result.get("value") if result else None
+        value = result.get("value") if result else None
+        if wire_encoding != encoding:
+            value = _decompress_account(value)
+        self._cache.set(cache_key, value, ttl=self._config.account_info_cache_ttl)
+        return value
 
     def get_multiple_accounts(
         self,
@@ -288,6 +764,9 @@ class RpcClient:
         """
         Get multiple account information in one call
 
+        Lists longer than the RPC's 100-address limit are split into chunks
+        sent as one batch request; results keep the order of addresses.
+
         Args:
             addresses: List of account addresses
             encoding: Data encoding
@@ -296,15 +775,122 @@ class RpcClient:
         Returns:
             List of account info (None for accounts not found)
         """
-        params = [
-            addresses,
-            {
-                "encoding": encoding,
-                "commitment": commitment or self.commitment,
-            },
+        wire_encoding = self._wire_encoding(encoding)
+        cfg = {
+            "encoding": wire_encoding,
+            "commitment": commitment or self.commitment,
+        }
+        if len(addresses) <= _MAX_MULTIPLE_ACCOUNTS:
+            result = self.call("getMultipleAccounts", [addresses, cfg])
+            values = result.get("value", []) if result else []
+        else:
+            # Over the per-request cap: one batch request, one entry per chunk
+            results = self.call_batch([
+                ("getMultipleAccounts", [chunk, cfg])
+                for chunk in _chunks(addresses, _MAX_MULTIPLE_ACCOUNTS)
+            ])
+            values = _flatten_account_values(results)
+
+        if wire_encoding != encoding:
+            values = [_decompress_account(v) for v in values]
+        return values
+
+    def prefetch_accounts(
+        self,
+        addresses: List[str],
+        encoding: str = "base64",
+        commitment: Optional[str] = None,
+    ) -> None:
+        """
+        Load accounts into the get_account_info() cache with one call
+
+        Addresses already cached are skipped. Lets callers turn several
+        upcoming get_account_info() round trips into a single
+        getMultipleAccounts request.
+
+        Args:
+            addresses: Account addresses (base58)
+            encoding: Encoding the later get_account_info() calls will use
+            commitment: Commitment level
+        """
+        commitment = commitment or self.commitment
+        ttl = self._config.account_info_cache_ttl
+        if ttl <= 0:
+            return
+
+        missing = [
+            address for address in dict.fromkeys(addresses)
+            if self._cache.get(("getAccountInfo", address, encoding, commitment)) is MISSING
         ]
-        result = self.call("getMultipleAccounts", params)
-        return result.get("value", []) if result else []
+        if not missing:
+            return
+
+        values = self.get_multiple_accounts(missing, encoding=encoding, commitment=commitment)
+        for address, value in zip(missing, values):
+            self._cache.set(("getAccountInfo", address, encoding, commitment), value, ttl=ttl)
+
+    @staticmethod
+    def decode_account_data(
+        values: List[Optional[Dict[str, Any]]],
+    ) -> List[Optional[bytes]]:
+        """
+        Decode base64 account data from get_multiple_accounts results
+
+        Args:
+            values: Account infos as returned by get_multiple_accounts
+                    (encoding="base64")
+
+        Returns:
+            Raw account data per entry (None for accounts not found)
+        """
+        # binascii is the C routine behind base64.b64decode, minus its wrapper
+        decode = binascii.a2b_base64
+        return [
+            (decode(v["data"][0]) if isinstance(v["data"], list) else decode(v["data"]))
+            if v else None
+            for v in values
+        ]
+
+    @staticmethod
+    def decode_program_accounts(
+        accounts: List[Dict[str, Any]],
+    ) -> List[Tuple[str, bytes]]:
+        """
+        Decode base64 account data from get_program_accounts results
+
+        Args:
+            accounts: Entries as returned by get_program_accounts
+                      (encoding="base64")
+
+        Returns:
+            List of (pubkey, raw account data) tuples
+        """
+        decode = binascii.a2b_base64
+        return [
+            (entry["pubkey"], decode(entry["account"]["data"][0]))
+            for entry in accounts
+        ]
+
+    async def aget_multiple_accounts(
+        self,
+        addresses: List[str],
+        encoding: str = "base64",
+        commitment: Optional[str] = None,
+    ) -> List[Optional[Dict[str, Any]]]:
+        """Async version of get_multiple_accounts"""
+        wire_encoding = self._wire_encoding(encoding)
+        cfg = {
+            "encoding": wire_encoding,
+            "commitment": commitment or self.commitment,
+        }
+        results = await asyncio.gather(*(
+            self.acall("getMultipleAccounts", [chunk, cfg])
+            for chunk in _chunks(addresses, _MAX_MULTIPLE_ACCOUNTS)
+        ))
+        values = _flatten_account_values(results)
+        if wire_encoding != encoding:
+            values = [_decompress_account(v) for v in values]
+        return values
 
     def get_latest_blockhash(
         self,
@@ -315,10 +901,22 @@ class RpcClient:
 
         Returns:
             Dict with blockhash and lastValidBlockHeight
+
+        Note:
+            Cached for RpcClientConfig.blockhash_cache_ttl seconds (well under
+            the ~60s blockhash validity window). Not invalidated by
+            send_transaction; call invalidate_blockhash() to force a refetch.
         """
-        params = [{"commitment": commitment or self.commitment}]
+        commitment = commitment or self.commitment
+        cached = self._blockhash_cache.get(commitment)
+        if cached is not MISSING:
+            return cached
+
+        params = [self._commitment_cfg(commitment)]
         result = self.call("getLatestBlockhash", params)
-        return result.get("value", {})
+        value = result.get("value", {})
+        self._blockhash_cache.set(commitment, value, ttl=self._config.blockhash_cache_ttl)
+        return value
 
     def get_balance(
         self,
@@ -334,10 +932,20 @@ class RpcClient:
         Returns:
             Balance in lamports
         """
-        params = [address, {"commitment": commitment or self.commitment}]
+        params = [address, self._commitment_cfg(commitment)]
         result = self.call("getBalance", params)
         return result.get("value", 0)
 
+    async def aget_balance(
+        self,
+        address: str,
+        commitment: Optional[str] = None,
+    ) -> int:
+        """Async version of get_balance"""
+        params = [address, self._commitment_cfg(commitment)]
+        result = await self.acall("getBalance", params)
+        return result.get("value", 0)
+
     def get_token_account_balance(
         self,
         token_account: str,
@@ -352,7 +960,7 @@ class RpcClient:
         Returns:
             Balance info with amount, decimals, uiAmount
         """
-        params = [token_account, {"commitment": commitment or self.commitment}]
+        params = [token_account, self._commitment_cfg(commitment)]
         result = self.call("getTokenAccountBalance", params)
         return result.get("value", {})
 
@@ -376,6 +984,44 @@ class RpcClient:
         Returns:
             List of token account info
         """
+        cache_key, params = self._token_accounts_query(owner, mint, program_id, encoding, commitment)
+        cached = self._cache.get(cache_key)
+        if cached is not MISSING:
+            return cached
+
+        result = self.call("getTokenAccountsByOwner", params)
+        value = result.get("value", [])
+        self._cache.set(cache_key, value, ttl=self._config.token_accounts_cache_ttl)
+        return value
+
+    async def aget_token_accounts_by_owner(
+        self,
+        owner: str,
+        mint: Optional[str] = None,
+        program_id: Optional[str] = None,
+        encoding: str = "jsonParsed",
+        commitment: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """Async version of get_token_accounts_by_owner (shares its cache)"""
+        cache_key, params = self._token_accounts_query(owner, mint, program_id, encoding, commitment)
+        cached = self._cache.get(cache_key)
+        if cached is not MISSING:
+            return cached
+
+        result = await self.acall("getTokenAccountsByOwner", params)
+        value = result.get("value", [])
+        self._cache.set(cache_key, value, ttl=self._config.token_accounts_cache_ttl)
+        return value
+
+    def _token_accounts_query(
+        self,
+        owner: str,
+        mint: Optional[str],
+        program_id: Optional[str],
+        encoding: str,
+        commitment: Optional[str],
+    ) -> Tuple[Tuple, List[Any]]:
+        """Cache key and params for getTokenAccountsByOwner"""
         filter_param = {}
         if mint:
             filter_param["mint"] = mint
@@ -385,16 +1031,23 @@ class RpcClient:
             # Default to SPL Token program
             filter_param["programId"] = "TokenkegQfeZyiNwAJbNbGKPFXCWuBvf9Ss623VQ5DA"
 
+        commitment = commitment or self.commitment
+        cache_key = (
+            "getTokenAccountsByOwner",
+            owner,
+            tuple(filter_param.items()),
+            encoding,
+            commitment,
+        )
         params = [
             owner,
             filter_param,
             {
                 "encoding": encoding,
-                "commitment": commitment or self.commitment,
+                "commitment": commitment,
             },
         ]
-        result = self.call("getTokenAccountsByOwner", params)
-        return result.get("value", [])
+        return cache_key, params
 
     def send_transaction(
         self,
@@ -415,23 +1068,84 @@ class RpcClient:
         Returns:
             Transaction signature (base58)
         """
-        import base64 as b64
-
         # Always use base64 encoding (standard for Solana RPC)
-        tx_data = b64.b64encode(transaction).decode("ascii")
+        tx_data = _b64e(transaction)
 
         params = [
             tx_data,
-            {
-                "skipPreflight": skip_preflight,
-                "preflightCommitment": preflight_commitment or self.commitment,
-                "encoding": "base64",
-            },
+            _send_opts(skip_preflight, preflight_commitment or self.commitment, max_retries),
         ]
-        if max_retries is not None:
-            params[1]["maxRetries"] = max_retries
 
-        return self.call("sendTransaction", params)
+        try:
+            return self.call("sendTransaction", params)
+        finally:
+            # Cached blockhash/balances/accounts may be stale after a write
+            self.invalidate_cache()
+
+    def send_and_confirm(
+        self,
+        transaction: bytes,
+        skip_preflight: bool = False,
+        preflight_commitment: Optional[str] = None,
+        max_retries: Optional[int] = None,
+        timeout_seconds: float = 60.0,
+    ) -> Tuple[str, Optional[bool]]:
+        """
+        Send a signed transaction and wait for its confirmation
+
+        With ws_confirm enabled, the signatureSubscribe is opened before
+        sendTransaction, so the confirmation arrives as a single push
+        notification with no status polling. Opening the subscription is
+        bounded by a short budget; if it is not ready in time (or WebSockets
+        are off) this is send_transaction followed by confirm_transaction.
+
+        Args:
+            transaction: Signed transaction bytes
+            skip_preflight: Skip preflight simulation
+            preflight_commitment: Preflight commitment level
+            max_retries: Max send retries
+            timeout_seconds: Max wait time for confirmation
+
+        Returns:
+            Tuple of (signature, confirmed) where confirmed is True if
+            confirmed, False if failed on-chain, None on timeout
+
+        Raises:
+            RpcError: If sendTransaction is rejected
+        """
+        state = {"signature": None, "submitted": False}
+
+        def submit():
+            state["submitted"] = True
+            state["signature"] = self.send_transaction(
+                transaction,
+                skip_preflight=skip_preflight,
+                preflight_commitment=preflight_commitment,
+                max_retries=max_retries,
+            )
+
+        if self._config.ws_confirm and _ws_connect is not None and Signature is not None:
+            # Fee payer signature is the first one after the shortvec count
+            # byte; a transaction never carries 128+ signatures.
+            signature = str(Signature.from_bytes(transaction[1:65]))
+            deadline = time.monotonic() + timeout_seconds
+            try:
+                confirmed = self._wait_signature_ws(signature, deadline, submit=submit)
+                return state["signature"] or signature, confirmed
+            except Exception as e:
+                if state["submitted"] and state["signature"] is None:
+                    # sendTransaction itself failed - nothing to confirm
+                    raise
+                logger.debug(f"WebSocket confirmation unavailable, falling back to polling: {e}")
+                timeout_seconds = max(deadline - time.monotonic(), 0.0)
+
+        if not state["submitted"]:
+            submit()
+        return state["signature"], self.confirm_transactions(
+            [state["signature"]],
+            commitment=preflight_commitment,
+            timeout_seconds=timeout_seconds,
+        )[0]
 
     def simulate_transaction(
         self,
@@ -448,20 +1162,10 @@ class RpcClient:
         Returns:
             Simulation result
         """
-        import base64 as b64
-
         # Always use base64 encoding (standard for Solana RPC)
-        tx_data = b64.b64encode(transaction).decode("ascii")
+        tx_data = _b64e(transaction)
 
-        params = [
-            tx_data,
-            {
-                "commitment": commitment or self.commitment,
-                "encoding": "base64",
-                "sigVerify": False,
-                "replaceRecentBlockhash": True,
-            },
-        ]
+        params = [tx_data, _simulate_opts(commitment or self.commitment)]
         return self.call("simulateTransaction", params)
 
     def confirm_transaction(
@@ -473,6 +1177,10 @@ class RpcClient:
         """
         Wait for transaction confirmation
 
+        Waits on a signatureSubscribe notification when ws_confirm is
+        enabled and WebSockets are available, otherwise polls
+        getSignatureStatuses with backoff.
+
         Args:
             signature: Transaction signature
             commitment: Commitment level
@@ -483,34 +1191,225 @@ class RpcClient:
             False if transaction failed on-chain (has error)
             None if timeout (transaction never landed or status unknown)
         """
+        if self._config.ws_confirm and _ws_connect is not None:
+            deadline = time.monotonic() + timeout_seconds
+            try:
+                return self._wait_signature_ws(signature, deadline)
+            except Exception as e:
+                logger.debug(f"WebSocket confirmation unavailable, falling back to polling: {e}")
+                timeout_seconds = max(deadline - time.monotonic(), 0.0)
+
+        return self.confirm_transactions(
+            [signature],
+            commitment=commitment,
+            timeout_seconds=timeout_seconds,
+        )[0]
+
+    @staticmethod
+    def _status_outcome(signature: str, status: Optional[Dict[str, Any]]) -> Optional[bool]:
+        """
+        Interpret a getSignatureStatuses entry
+
+        Returns:
+            True if confirmed, False if failed on-chain, None if still pending
+        """
+        if not status:
+            return None
+        if status.get("err"):
+            logger.warning(f"Transaction {signature} failed on-chain: {status.get('err')}")
+            return False
+        if status.get("confirmationStatus") in ("confirmed", "finalized"):
+            return True
+        return None
+
+    def _wait_signature_ws(
+        self,
+        signature: str,
+        deadline: float,
+        submit: Optional[Callable[[], Any]] = None,
+    ) -> Optional[bool]:
+        """
+        Wait for a signature via signatureSubscribe
+
+        Raises on any WebSocket/subscription failure so the caller can fall
+        back to polling.
+
+        Args:
+            signature: Transaction signature
+            deadline: time.monotonic() deadline
+            submit: Optional callback that sends the transaction once the
+                    subscription is active (so the notification cannot be missed)
+
+        Returns:
+            True if confirmed, False if failed on-chain, None on timeout
+        """
+        connect_timeout = min(_WS_CONNECT_TIMEOUT, self._config.timeout_seconds)
+        # Connect and subscription ack share one short budget: submit waits on
+        # both, and a stalled endpoint must not hold the transaction back
+        setup_deadline = min(time.monotonic() + connect_timeout, deadline)
+        with _ws_connect(self.ws_url, open_timeout=connect_timeout) as ws:
+            # "confirmed" matches what polling accepts (confirmed or finalized)
+            ws.send(json.dumps({
+                "jsonrpc": "2.0",
+                "id": 1,
+                "method": "signatureSubscribe",
+                "params": [signature, {"commitment": "confirmed"}],
+            }))
+            ack = json.loads(ws.recv(timeout=max(setup_deadline - time.monotonic(), 0.0)))
+            if "error" in ack:
+                self._raise_rpc_error(ack["error"], self.ws_url)
+
+            if submit is not None:
+                submit()
+            else:
+                # The transaction may have landed before the subscription was active
+                outcome = self._signature_status(signature)
+                if outcome is not None:
+                    return outcome
+
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    message = json.loads(ws.recv(timeout=remaining))
+                except TimeoutError:
+                    break
+                if message.get("method") != "signatureNotification":
+                    continue
+                value = message["params"]["result"]["value"]
+                if value.get("err"):
+                    logger.warning(f"Transaction {signature} failed on-chain: {value.get('err')}")
+                    return False
+                return True
+
+        # A missed or late notification must not report a landed transaction as timed out
+        outcome = self._signature_status(signature)
+        if outcome is None:
+            logger.warning(f"Transaction {signature} timeout waiting for confirmation notification")
+        return outcome
+
+    def _signature_status(self, signature: str) -> Optional[bool]:
+        """
+        Check a signature once with getSignatureStatuses
+
+        Returns:
+            True if confirmed, False if failed on-chain, None if still pending
+        """
+        result = self.call("getSignatureStatuses", [[signature]])
+        values = result.get("value") if result else None
+        return self._status_outcome(signature, values[0] if values else None)
+
+    def confirm_transactions(
+        self,
+        signatures: List[str],
+        commitment: Optional[str] = None,
+        timeout_seconds: float = 60.0,
+    ) -> List[Optional[bool]]:
+        """
+        Wait for confirmation of several transactions at once
+
+        Pending signatures are checked with one getSignatureStatuses call
+        per poll, split into requests of at most 256 (the RPC limit).
+
+        Args:
+            signatures: Transaction signatures
+            commitment: Commitment level
+            timeout_seconds: Max wait time for the whole batch
+
+        Returns:
+            List aligned with signatures, each entry:
+            True if confirmed successfully
+            False if transaction failed on-chain (has error)
+            None if timeout (transaction never landed or status unknown)
+        """
+        outcomes: List[Optional[bool]] = [None] * len(signatures)
+        last_statuses: List[Optional[Dict[str, Any]]] = [None] * len(signatures)
+        pending = list(range(len(signatures)))
+
         start_time = time.time()
+        attempt = 0
+
+        while pending and time.time() - start_time < timeout_seconds:
+            still_pending = []
+            for chunk in _chunks(pending, _MAX_SIGNATURE_STATUSES):
+                try:
+                    result = self.call(
+                        "getSignatureStatuses",
+                        [[signatures[i] for i in chunk]],
+                    )
+                except RpcError as e:
+                    logger.debug(f"Error checking transaction status: {e}")
+                    still_pending.extend(chunk)
+                    continue
+                values = result.get("value") if result else None
+                if not values:
+                    still_pending.extend(chunk)
+                    continue
+                for i, status in zip(chunk, values):
+                    if status:
+                        last_statuses[i] = status
+                    outcome = self._status_outcome(signatures[i], status)
+                    if outcome is None:
+                        still_pending.append(i)
+                    else:
+                        outcomes[i] = outcome
+            pending = still_pending
+
+            if pending:
+                time.sleep(min(1.0 * 1.5 ** attempt, 5.0))
+                attempt += 1
+
+        # Timeout - transaction never landed or didn't reach confirmation
+        for i in pending:
+            last_status = last_statuses[i]
+            if last_status is None:
+                logger.warning(
+                    f"Transaction {signatures[i]} was never seen on chain (dropped/expired)"
+                )
+            else:
+                logger.warning(
+                    f"Transaction {signatures[i]} timeout. Last status: {last_status.get('confirmationStatus', 'unknown')}"
+                )
+
+        return outcomes
+
+    async def aconfirm_transaction(
+        self,
+        signature: str,
+        commitment: Optional[str] = None,
+        timeout_seconds: float = 60.0,
+    ) -> Optional[bool]:
+        """
+        Async version of confirm_transaction
+
+        Polls with asyncio.sleep (backing off up to 5s) so other tasks keep
+        running while waiting.
+
+        Returns:
+            True if confirmed, False if failed on-chain, None on timeout
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout_seconds
         last_status = None
+        attempt = 0
 
-        while time.time() - start_time < timeout_seconds:
+        while loop.time() < deadline:
             try:
-                result = self.call(
-                    "getSignatureStatuses",
-                    [[signature]],
-                )
+                result = await self.acall("getSignatureStatuses", [[signature]])
                 if result and result.get("value"):
                     status = result["value"][0]
                     if status:
                         last_status = status
-                        if status.get("err"):
-                            # Transaction failed on-chain
-                            logger.warning(
-                                f"Transaction {signature} failed on-chain: {status.get('err')}"
-                            )
-                            return False
-                        conf = status.get("confirmationStatus")
-                        if conf in ("confirmed", "finalized"):
-                            return True
+                    outcome = self._status_outcome(signature, status)
+                    if outcome is not None:
+                        return outcome
             except RpcError as e:
                 logger.debug(f"Error checking transaction status: {e}")
 
-            time.sleep(1.0)
+            await asyncio.sleep(min(1.0 * 1.5 ** attempt, 5.0))
+            attempt += 1
 
-        # Timeout - transaction never landed or didn't reach confirmation
         if last_status is None:
             logger.warning(
                 f"Transaction {signature} was never seen on chain (dropped/expired)"
@@ -561,18 +1460,18 @@ class RpcClient:
         Returns:
             List of account info with address and amount
         """
-        params = [mint, {"commitment": commitment or self.commitment}]
+        params = [mint, self._commitment_cfg(commitment)]
         result = self.call("getTokenLargestAccounts", params)
         return result.get("value", []) if result else []
 
     def get_slot(self, commitment: Optional[str] = None) -> int:
         """Get current slot"""
-        params = [{"commitment": commitment or self.commitment}]
+        params = [self._commitment_cfg(commitment)]
         return self.call("getSlot", params)
 
     def get_block_height(self, commitment: Optional[str] = None) -> int:
         """Get current block height"""
-        params = [{"commitment": commitment or self.commitment}]
+        params = [self._commitment_cfg(commitment)]
         return self.call("getBlockHeight", params)
 
     def get_program_accounts(
@@ -582,6 +1481,7 @@ class RpcClient:
         encoding: str = "base64",
         commitment: Optional[str] = None,
         with_context: bool = False,
+        data_slice: Optional[Tuple[int, int]] = None,
     ) -> List[Dict[str, Any]]:
         """
         Get all accounts owned by a program
@@ -592,6 +1492,8 @@ class RpcClient:
             encoding: Data encoding ("base64", "jsonParsed", etc.)
             commitment: Commitment level
             with_context: Include context in response
+            data_slice: Optional (offset, length) to return only part of
+                        each account's data (truncated server-side)
 
         Returns:
             List of account info dicts with pubkey and account fields
@@ -610,6 +1512,8 @@ class RpcClient:
             config["filters"] = filters
         if with_context:
             config["withContext"] = True
+        if data_slice is not None:
+            config["dataSlice"] = {"offset": data_slice[0], "length": data_slice[1]}
 
         params = [program_id, config]
         result = self.call("getProgramAccounts", params)
@@ -620,9 +1524,27 @@ class RpcClient:
 
     def close(self):
         """Close HTTP client"""
-        if self._client:
-            self._client.close()
-            self._client = None
+        # Swap in a fresh (unconnected) client so the RpcClient stays usable
+        client, self._client = self._client, self._new_client()
+        client.close()
+        # The async client can only be closed from its event loop (see aclose);
+        # dropping the reference lets its connections be garbage collected.
+        self._async_client = None
+        self._async_client_loop = None
+
+    async def aclose(self):
+        """Close both HTTP clients (call from the event loop that used acall)"""
+        if self._async_client is not None:
+            await self._async_client.aclose()
+            self._async_client = None
+            self._async_client_loop = None
+        self.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.aclose()
 
     def __enter__(self):
         return self
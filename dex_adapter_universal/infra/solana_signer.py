@@ -8,14 +8,17 @@ from __future__ import annotations
 
 import logging
 import os
-from typing import Optional, Protocol, Tuple, runtime_checkable
+from typing import List, Optional, Protocol, Tuple, runtime_checkable
 
 try:
     from solders.keypair import Keypair
+    from solders.message import MessageV0, to_bytes_versioned
     from solders.signature import Signature
     from solders.transaction import VersionedTransaction
 except ImportError:
     Keypair = None
+    MessageV0 = None
+    to_bytes_versioned = None
     Signature = None
     VersionedTransaction = None
 
@@ -24,6 +27,33 @@ from ..config import config as global_config
 
 logger = logging.getLogger(__name__)
 
+# Placeholder for unsigned signature slots (immutable, safe to share)
+_NULL_SIG = Signature.default() if Signature is not None else None
+
+
+def _splice_signatures(message_bytes: bytes, signatures: List["Signature"]) -> bytes:
+    """
+    Assemble signed transaction wire bytes
+
+    The wire format is shortvec(len(signatures)) || signatures || message,
+    so the bytes that were signed can be reused as-is instead of going
+    through VersionedTransaction.populate().
+
+    Args:
+        message_bytes: Serialized message as signed (0x80-prefixed for v0)
+        signatures: Signature per required signer, in account order
+
+    Returns:
+        Signed transaction bytes
+    """
+    n = len(signatures)
+    prefix = bytearray()
+    while n >= 0x80:
+        prefix.append((n & 0x7F) | 0x80)
+        n >>= 7
+    prefix.append(n)
+    return b"".join([bytes(prefix), *map(bytes, signatures), message_bytes])
+
 
 @runtime_checkable
 class Signer(Protocol):
@@ -89,11 +119,13 @@ class LocalSigner:
             raise RuntimeError("solders is required for LocalSigner. Install with: pip install solders")
 
         self._keypair = keypair
+        # Encoded once: pubkey is read on every build and sign
+        self._pubkey_str = str(keypair.pubkey())
 
     @property
     def pubkey(self) -> str:
         """Public key as base58 string"""
-        return str(self._keypair.pubkey())
+        return self._pubkey_str
 
     def sign(self, message: bytes) -> bytes:
         """Sign message bytes"""
@@ -115,17 +147,24 @@ class LocalSigner:
 
         # Parse unsigned transaction
         tx = VersionedTransaction.from_bytes(unsigned_tx)
-        message = tx.message
+        return self.sign_message(tx.message)
 
+    def sign_message(self, message: "MessageV0") -> Tuple[bytes, str]:
+        """
+        Sign a compiled message as the transaction's only local signer
+
+        Args:
+            message: Compiled message (MessageV0 or legacy Message)
+
+        Returns:
+            (signed_tx_bytes, signature_base58)
+        """
         # Get message bytes for signing
         # For MessageV0 (versioned transactions), we need to include the version prefix (0x80)
         # The raw transaction format is: [sig_count][signatures][version_prefix][message]
         # We need to sign [version_prefix][message], not just [message]
-        from solders.message import MessageV0
-        message_bytes = bytes(message)
-        if isinstance(message, MessageV0):
-            # Include version prefix 0x80 for MessageV0
-            message_bytes = bytes([0x80]) + message_bytes
+        # (to_bytes_versioned emits the prefix in the same buffer)
+        message_bytes = to_bytes_versioned(message)
 
         signature = self._keypair.sign_message(message_bytes)
 
@@ -134,40 +173,28 @@ class LocalSigner:
 
         # Find which signer slot corresponds to our public key
         # The first num_required_signatures accounts in account_keys are signers
-        from solders.pubkey import Pubkey
         our_pubkey = self._keypair.pubkey()
-
-        # Get account keys from message (handles both legacy and v0 messages)
-        if hasattr(message, 'account_keys'):
-            # Legacy message
-            account_keys = message.account_keys
-        else:
-            # MessageV0 - static account keys are the signers
-            account_keys = message.account_keys
+        signer_keys = message.account_keys[:num_required_signatures]
 
         # Find our position in the signer list
         signer_index = None
-        for i in range(num_required_signatures):
-            if i < len(account_keys) and account_keys[i] == our_pubkey:
+        for i, key in enumerate(signer_keys):
+            if key == our_pubkey:
                 signer_index = i
                 break
 
         if signer_index is None:
             raise SignerError(
                 f"Wallet {our_pubkey} is not in the required signers list. "
-                f"Expected signers: {[str(account_keys[i]) for i in range(min(num_required_signatures, len(account_keys)))]}"
+                f"Expected signers: {[str(key) for key in signer_keys]}"
             )
 
         # Create signature list with our signature at the correct position
         # and null signatures for other required signers
-        null_sig = Signature.default()
-        signatures = [null_sig] * num_required_signatures
+        signatures = [_NULL_SIG] * num_required_signatures
         signatures[signer_index] = signature
 
-        # Build the signed transaction
-        signed_tx = VersionedTransaction.populate(message, signatures)
-
-        return bytes(signed_tx), str(signature)
+        return _splice_signatures(message_bytes, signatures), str(signature)
 
     @classmethod
     def from_bytes(cls, secret_key: bytes) -> "LocalSigner":
@@ -182,9 +209,8 @@ class LocalSigner:
         """Create signer from base58 secret key"""
         if Keypair is None:
             raise RuntimeError("solders is required")
-        import base58
-        secret_bytes = base58.b58decode(secret_key)
-        return cls.from_bytes(secret_bytes)
+        # solders decodes natively; no pure-Python base58 round trip
+        return cls(Keypair.from_base58_string(secret_key))
 
     @classmethod
     def from_file(cls, path: str) -> "LocalSigner":
@@ -200,18 +226,20 @@ class LocalSigner:
         with open(path, "rb") as f:
             content = f.read()
 
-        # Try JSON format first
-        try:
-            data = json.loads(content.decode("utf-8"))
+        # Raw bytes: a JSON keypair is always far longer than 64 bytes
+        if len(content) == 64:
+            return cls.from_bytes(content)
+
+        # JSON array: only attempt a parse when it can be one
+        content = content.strip()
+        if content[:1] == b"[":
+            try:
+                data = json.loads(content)
+            except ValueError:
+                data = None
             if isinstance(data, list):
                 secret_bytes = bytes(data)
                 return cls.from_bytes(secret_bytes)
-        except (json.JSONDecodeError, UnicodeDecodeError):
-            pass
-
-        # Try raw bytes
-        if len(content) == 64:
-            return cls.from_bytes(content)
 
         raise ConfigurationError.invalid("keypair_file", f"Cannot parse keypair file: {path}")
 
@@ -11,7 +11,9 @@ from __future__ import annotations
 
 import base64
 import logging
+import random
 import time
+from functools import lru_cache
 from dataclasses import dataclass, field
 from typing import List, Optional, Any, Tuple
 
@@ -20,8 +22,9 @@ try:
     from solders.hash import Hash
     from solders.instruction import Instruction, AccountMeta
     from solders.keypair import Keypair
-    from solders.message import MessageV0
+    from solders.message import MessageV0, to_bytes_versioned
     from solders.pubkey import Pubkey
+    from solders.signature import Signature
     from solders.transaction import VersionedTransaction
 except ImportError:
     set_compute_unit_limit = None
@@ -31,17 +34,57 @@ except ImportError:
     AccountMeta = None
     Keypair = None
     MessageV0 = None
+    to_bytes_versioned = None
     Pubkey = None
+    Signature = None
     VersionedTransaction = None
 
 from .rpc import RpcClient
-from .solana_signer import Signer
+from .solana_signer import Signer, LocalSigner, _splice_signatures
 from ..types import TxResult, TxStatus
 from ..errors import TransactionError, RpcError
 from ..config import config as global_config
 
 logger = logging.getLogger(__name__)
 
+# Placeholder for unsigned signature slots (immutable, safe to share)
+_NULL_SIG = Signature.default() if Signature is not None else None
+
+# Largest serialized transaction the network accepts (bytes)
+PACKET_DATA_SIZE = 1232
+
+# Any well-formed blockhash gives the same size estimate
+_PLACEHOLDER_BLOCKHASH = str(Hash.default()) if Hash is not None else None
+
+
+@lru_cache(maxsize=4096)
+def _pubkey_from_string(address: str) -> "Pubkey":
+    """Parse a base58 pubkey, memoized (program ids and accounts recur across builds)"""
+    return Pubkey.from_string(address)
+
+
+# Compute budget instructions are immutable and take few distinct values
+@lru_cache(maxsize=256)
+def _cu_limit_ix(units: int) -> "Instruction":
+    """SetComputeUnitLimit instruction, memoized"""
+    return set_compute_unit_limit(units)
+
+
+@lru_cache(maxsize=256)
+def _cu_price_ix(micro_lamports: int) -> "Instruction":
+    """SetComputeUnitPrice instruction, memoized"""
+    return set_compute_unit_price(micro_lamports)
+
+
+@lru_cache(maxsize=8192)
+def _account_meta(address: str, is_signer: bool, is_writable: bool) -> "AccountMeta":
+    """AccountMeta for an address, memoized (the same pool/ATA metas recur every build)"""
+    return AccountMeta(
+        pubkey=_pubkey_from_string(address),
+        is_signer=is_signer,
+        is_writable=is_writable,
+    )
+
 
 @dataclass
 class TxBuilderConfig:
@@ -69,20 +112,42 @@ class TxBuilderConfig:
 
     def __post_init__(self):
         """Apply defaults from global config for any unset values"""
-        if self.compute_units is None:
-            self.compute_units = global_config.tx.compute_units
-        if self.compute_unit_price is None:
-            self.compute_unit_price = global_config.tx.compute_unit_price
-        if self.skip_preflight is None:
-            self.skip_preflight = global_config.tx.skip_preflight
-        if self.preflight_commitment is None:
-            self.preflight_commitment = global_config.tx.preflight_commitment
-        if self.max_retries is None:
-            self.max_retries = global_config.tx.swap_max_retries
-        if self.confirmation_timeout is None:
-            self.confirmation_timeout = global_config.tx.confirmation_timeout
-        if self.retry_delay is None:
-            self.retry_delay = global_config.tx.retry_delay
+        for name, default in _tx_defaults:
+            if getattr(self, name) is None:
+                setattr(self, name, default)
+
+
+# TxBuilderConfig field -> global TxConfig attribute
+_TX_DEFAULT_SOURCES = (
+    ("compute_units", "compute_units"),
+    ("compute_unit_price", "compute_unit_price"),
+    ("skip_preflight", "skip_preflight"),
+    ("preflight_commitment", "preflight_commitment"),
+    ("max_retries", "swap_max_retries"),
+    ("confirmation_timeout", "confirmation_timeout"),
+    ("retry_delay", "retry_delay"),
+)
+
+_tx_defaults: Tuple[Tuple[str, Any], ...] = ()
+_DEFAULT_CONFIG: Optional[TxBuilderConfig] = None
+
+
+def reload_tx_defaults() -> None:
+    """
+    Re-read TxBuilderConfig defaults from the global config
+
+    Defaults are snapshotted at import; call this after changing
+    config.tx at runtime.
+    """
+    global _tx_defaults, _DEFAULT_CONFIG
+    _tx_defaults = tuple(
+        (name, getattr(global_config.tx, source)) for name, source in _TX_DEFAULT_SOURCES
+    )
+    # Shared by builders created without a config (never mutated)
+    _DEFAULT_CONFIG = TxBuilderConfig()
+
+
+reload_tx_defaults()
 
 
 class TxBuilder:
@@ -123,7 +188,7 @@ class TxBuilder:
         """
         self._rpc = rpc
         self._signer = signer
-        self._config = config or TxBuilderConfig()
+        self._config = config or _DEFAULT_CONFIG
 
         if VersionedTransaction is None:
             raise RuntimeError("solders is required for TxBuilder")
@@ -133,6 +198,10 @@ class TxBuilder:
         """Signer's public key"""
         return self._signer.pubkey
 
+    def invalidate_blockhash(self) -> None:
+        """Force the next build() to fetch a fresh blockhash"""
+        self._rpc.invalidate_blockhash()
+
     def build(
         self,
         instructions: List["Instruction"],
@@ -154,6 +223,24 @@ class TxBuilder:
         Returns:
             Unsigned transaction bytes
         """
+        message = self._compile_message(
+            instructions,
+            payer=payer,
+            compute_units=compute_units,
+            compute_unit_price=compute_unit_price,
+            recent_blockhash=recent_blockhash,
+        )
+        return self._unsigned_tx_bytes(message)
+
+    def _compile_message(
+        self,
+        instructions: List["Instruction"],
+        payer: Optional[str] = None,
+        compute_units: Optional[int] = None,
+        compute_unit_price: Optional[int] = None,
+        recent_blockhash: Optional[str] = None,
+    ) -> "MessageV0":
+        """Compile instructions (plus compute budget) into a MessageV0"""
         # Add compute budget instructions at the beginning
         all_instructions = []
 
@@ -161,14 +248,15 @@ class TxBuilder:
         cu_price = compute_unit_price or self._config.compute_unit_price
 
         if cu_limit > 0:
-            all_instructions.append(set_compute_unit_limit(cu_limit))
+            all_instructions.append(_cu_limit_ix(cu_limit))
 
         if cu_price > 0:
-            all_instructions.append(set_compute_unit_price(cu_price))
+            all_instructions.append(_cu_price_ix(cu_price))
 
         all_instructions.extend(instructions)
 
-        # Get blockhash if not provided
+        # Get blockhash if not provided (briefly cached by the RPC client,
+        # so bursts of builds share one fetch)
         if recent_blockhash is None:
             blockhash_info = self._rpc.get_latest_blockhash()
             recent_blockhash = blockhash_info.get("blockhash")
@@ -177,19 +265,54 @@ class TxBuilder:
             raise TransactionError.send_failed("Failed to get recent blockhash")
 
         # Build message
-        payer_pubkey = Pubkey.from_string(payer or self.pubkey)
-        message = MessageV0.try_compile(
+        payer_pubkey = _pubkey_from_string(payer or self.pubkey)
+        return MessageV0.try_compile(
             payer_pubkey,
             all_instructions,
             [],  # Address lookup tables
             Hash.from_string(recent_blockhash),
         )
 
-        # Create unsigned transaction with placeholder signatures
+    def estimate_size(
+        self,
+        instructions: List["Instruction"],
+        payer: Optional[str] = None,
+        compute_units: Optional[int] = None,
+        compute_unit_price: Optional[int] = None,
+    ) -> int:
+        """
+        Serialized size of the signed transaction these instructions would build
+
+        Lets callers decide whether instructions fit in one transaction
+        (see PACKET_DATA_SIZE) without fetching a blockhash.
+
+        Returns:
+            Size in bytes
+        """
+        message = self._compile_message(
+            instructions,
+            payer=payer,
+            compute_units=compute_units,
+            compute_unit_price=compute_unit_price,
+            recent_blockhash=_PLACEHOLDER_BLOCKHASH,
+        )
+        return len(self._unsigned_tx_bytes(message))
+
+    @staticmethod
+    def _check_size(signed_tx: bytes) -> None:
+        """Reject transactions the network would refuse, before any RPC"""
+        if len(signed_tx) > PACKET_DATA_SIZE:
+            raise TransactionError(
+                f"Transaction too large: {len(signed_tx)} bytes (max {PACKET_DATA_SIZE})",
+                recoverable=False,
+            )
+
+    @staticmethod
+    def _unsigned_tx_bytes(message: "MessageV0") -> bytes:
+        """Serialize a message as a transaction with placeholder signatures"""
         # VersionedTransaction requires signatures array to match num_required_signatures
-        from solders.signature import Signature
         num_signers = message.header.num_required_signatures
-        null_signatures = [Signature.default()] * num_signers
+        null_signatures = [_NULL_SIG] * num_signers
         tx = VersionedTransaction.populate(message, null_signatures)
 
         return bytes(tx)
@@ -209,49 +332,83 @@ class TxBuilder:
         Returns:
             (signed_tx_bytes, signature_base58)
         """
+        # The wallet signs anyway; passing its keypair again needs no multi-signer path
+        additional_signers = self._extra_signers(additional_signers)
         if not additional_signers:
             return self._signer.sign_transaction(unsigned_tx)
 
-        # For multi-signer transactions, we need to handle signing carefully
-        from solders.signature import Signature
-
         # Parse the unsigned transaction to get the message
         tx = VersionedTransaction.from_bytes(unsigned_tx)
-        message = tx.message
+        return self._sign_message(tx.message, additional_signers, unsigned_tx)
+
+    def _extra_signers(self, additional_signers: Optional[List["Keypair"]]) -> List["Keypair"]:
+        """Additional signers other than the wallet itself"""
+        if not additional_signers:
+            return []
+        wallet_pubkey = _pubkey_from_string(self._signer.pubkey)
+        return [kp for kp in additional_signers if kp.pubkey() != wallet_pubkey]
+
+    def _sign_message(
+        self,
+        message: "MessageV0",
+        additional_signers: Optional[List["Keypair"]] = None,
+        unsigned_tx: Optional[bytes] = None,
+    ) -> Tuple[bytes, str]:
+        """
+        Sign a compiled message directly
+
+        Lets build_and_send sign the message it just compiled instead of
+        serializing it to transaction bytes and parsing them back.
+
+        Args:
+            message: Compiled message
+            additional_signers: Optional list of additional keypairs to sign with
+            unsigned_tx: Unsigned transaction bytes if already serialized
+                         (only needed for signers without raw sign())
+
+        Returns:
+            (signed_tx_bytes, signature_base58)
+        """
+        additional_signers = self._extra_signers(additional_signers)
+        if not additional_signers and isinstance(self._signer, LocalSigner):
+            # Sole local signer: sign the compiled message in one pass
+            return self._signer.sign_message(message)
 
         # Get message bytes for signing
-        # For MessageV0, we need to include the version prefix (0x80)
-        message_bytes = bytes(message)
-        if isinstance(message, MessageV0):
-            message_bytes = bytes([0x80]) + message_bytes
-
-        # Get account keys from the message
-        # The message header tells us how many signers are required
-        account_keys = list(message.account_keys)
+        # For MessageV0, we need to include the version prefix (0x80);
+        # to_bytes_versioned serializes it in a single buffer
+        message_bytes = to_bytes_versioned(message)
+
+        # The message header tells us how many signers are required; they are
+        # the leading account keys. solders builds a fresh list on every
+        # account_keys access, so read it once and keep only the signers.
         num_required_signatures = message.header.num_required_signatures
+        signer_keys = message.account_keys[:num_required_signatures]
 
-        logger.debug(f"Transaction requires {num_required_signatures} signatures")
-        logger.debug(f"First {num_required_signatures} account keys (signers): {[str(k) for k in account_keys[:num_required_signatures]]}")
+        # Guarded: the key list costs a base58 encode per signer even when dropped
+        debug = logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            logger.debug(f"Transaction requires {num_required_signatures} signatures")
+            logger.debug(f"First {num_required_signatures} account keys (signers): {[str(k) for k in signer_keys]}")
 
         # Create a list of null signatures for all required signers
-        null_sig = Signature.default()
+        null_sig = _NULL_SIG
         signatures = [null_sig] * num_required_signatures
 
+        # Map each required signer to its signature slot once; lookups by
+        # Pubkey avoid a base58 encode per candidate
+        signer_index = {key: i for i, key in enumerate(signer_keys)}
+
         # Find the wallet's signer index
         signer_pubkey_str = self._signer.pubkey
-        wallet_signer_index = None
-        for i in range(num_required_signatures):
-            # Compare as strings to avoid Pubkey object comparison issues
-            if str(account_keys[i]) == signer_pubkey_str:
-                wallet_signer_index = i
-                break
+        wallet_signer_index = signer_index.get(_pubkey_from_string(signer_pubkey_str))
 
         if wallet_signer_index is None:
             # Log available signers for debugging
-            available = [str(account_keys[i]) for i in range(num_required_signatures)]
+            available = [str(key) for key in signer_keys]
             logger.error(f"Wallet pubkey {signer_pubkey_str} not in signers: {available}")
             raise TransactionError.send_failed(
-                f"Wallet pubkey {self._signer.pubkey} not found in transaction signers. "
+                f"Wallet pubkey {signer_pubkey_str} not found in transaction signers. "
                 f"Required signers: {available}"
             )
 
@@ -265,6 +422,8 @@ class TxBuilder:
         except NotImplementedError:
             # RemoteSigner only supports sign_transaction
             # Call sign_transaction and extract the signature from the result
+            if unsigned_tx is None:
+                unsigned_tx = self._unsigned_tx_bytes(message)
             signed_tx_bytes, sig_str = self._signer.sign_transaction(unsigned_tx)
 
             # Parse the signed transaction to get the wallet's signature
@@ -301,24 +460,19 @@ class TxBuilder:
         # Sign with additional signers (these are local keypairs)
         for keypair in additional_signers:
             kp_pubkey = keypair.pubkey()
-            kp_pubkey_str = str(kp_pubkey)
-            found = False
-            for i in range(num_required_signatures):
-                # Compare as strings to avoid Pubkey object comparison issues
-                if str(account_keys[i]) == kp_pubkey_str:
-                    sig = keypair.sign_message(message_bytes)
-                    signatures[i] = sig
-                    found = True
-                    logger.debug(f"Additional signer {kp_pubkey_str[:16]}... signed at index {i}")
-                    break
-            if not found:
-                logger.warning(f"Additional signer {kp_pubkey_str} not found in required signers")
+            i = signer_index.get(kp_pubkey)
+            if i is None:
+                logger.warning(f"Additional signer {kp_pubkey} not found in required signers")
+                continue
+            signatures[i] = keypair.sign_message(message_bytes)
+            if debug:
+                logger.debug(f"Additional signer {str(kp_pubkey)[:16]}... signed at index {i}")
 
         # Verify all signatures are present
         missing_signers = []
         for i, sig in enumerate(signatures):
             if sig == null_sig:
-                missing_signers.append(str(account_keys[i]))
+                missing_signers.append(str(signer_keys[i]))
 
         if missing_signers:
             raise TransactionError(
@@ -326,10 +480,8 @@ class TxBuilder:
                 signature=None,
             )
 
-        # Build the signed transaction with all signatures
-        signed_tx = VersionedTransaction.populate(message, signatures)
-
-        return bytes(signed_tx), str(wallet_signature)
+        # Assemble the signed transaction around the bytes that were signed
+        return _splice_signatures(message_bytes, signatures), str(wallet_signature)
 
     def send(
         self,
@@ -355,21 +507,17 @@ class TxBuilder:
         skip = skip_preflight if skip_preflight is not None else self._config.skip_preflight
 
         try:
-            signature = self._rpc.send_transaction(
-                signed_tx,
-                skip_preflight=skip,
-                preflight_commitment=self._config.preflight_commitment,
-            )
-
-            logger.info(f"Transaction sent: {signature}")
-
             if wait_confirmation:
-                confirmed = self._rpc.confirm_transaction(
-                    signature,
-                    commitment=self._config.preflight_commitment,
+                # Subscribes for the confirmation before submitting
+                signature, confirmed = self._rpc.send_and_confirm(
+                    signed_tx,
+                    skip_preflight=skip,
+                    preflight_commitment=self._config.preflight_commitment,
                     timeout_seconds=self._config.confirmation_timeout,
                 )
 
+                logger.info(f"Transaction sent: {signature}")
+
                 if confirmed is True:
                     # Fetch actual transaction fee
                     fee_lamports = 0
@@ -391,6 +539,14 @@ class TxBuilder:
                     # confirmed is None - timeout/dropped
                     return TxResult.timeout(signature)
             else:
+                signature = self._rpc.send_transaction(
+                    signed_tx,
+                    skip_preflight=skip,
+                    preflight_commitment=self._config.preflight_commitment,
+                )
+
+                logger.info(f"Transaction sent: {signature}")
+
                 return TxResult(
                     status=TxStatus.PENDING,
                     signature=signature,
@@ -447,26 +603,33 @@ class TxBuilder:
         """
         last_error: Optional[Exception] = None
 
+        # Every attempt may wait out a full confirmation window; retries stop
+        # once that overall budget is spent instead of sleeping past it
+        deadline = time.monotonic() + self._config.confirmation_timeout * self._config.max_retries
+
         for attempt in range(self._config.max_retries):
             try:
-                # Build unsigned transaction with FRESH blockhash on each attempt
-                unsigned_tx = self.build(
+                # Build message with FRESH blockhash on each attempt
+                message = self._compile_message(
                     instructions,
                     compute_units=compute_units,
                     compute_unit_price=compute_unit_price,
-                    # Don't pass blockhash - let build() fetch a fresh one
+                    # Don't pass blockhash - let it fetch a fresh one
                 )
+                unsigned_tx = None
 
                 # Optional simulation (only on first attempt to save RPC calls)
                 if simulate_first and attempt == 0:
+                    unsigned_tx = self._unsigned_tx_bytes(message)
                     sim_result = self.simulate(unsigned_tx)
                     if sim_result.get("value", {}).get("err"):
                         error_msg = str(sim_result["value"]["err"])
                         logs = sim_result.get("value", {}).get("logs", [])
                         raise TransactionError.simulation_failed(error_msg, logs)
 
-                # Sign (with additional signers if provided)
-                signed_tx, signature = self.sign(unsigned_tx, additional_signers)
+                # Sign the compiled message (with additional signers if provided)
+                signed_tx, signature = self._sign_message(message, additional_signers, unsigned_tx)
+                self._check_size(signed_tx)
 
                 # Send (single attempt - no internal retry)
                 result = self.send(
@@ -485,8 +648,8 @@ class TxBuilder:
                         f"Transaction {result.status.value} (attempt {attempt + 1}/{self._config.max_retries}), "
                         f"retrying with fresh blockhash..."
                     )
-                    time.sleep(self._config.retry_delay)
-                    continue
+                    if self._retry_pause(deadline):
+                        continue
 
                 return result
 
@@ -509,10 +672,10 @@ class TxBuilder:
                     logger.warning(
                         f"Recoverable error (attempt {attempt + 1}/{self._config.max_retries}): {e}"
                     )
-                    time.sleep(self._config.retry_delay)
-                    continue
+                    if self._retry_pause(deadline):
+                        continue
 
-                # Non-recoverable or max retries reached
+                # Non-recoverable, max retries or deadline reached
                 raise
 
             except Exception as e:
@@ -524,6 +687,147 @@ class TxBuilder:
             raise last_error
         raise TransactionError.send_failed("Max retries exceeded")
 
+    def _retry_pause(self, deadline: float) -> bool:
+        """
+        Sleep before the next build_and_send attempt
+
+        The delay is jittered around retry_delay so parallel builders do not
+        retry in lockstep, and never runs past the deadline.
+
+        Returns:
+            False if the deadline has passed (caller should stop retrying)
+        """
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return False
+        self.invalidate_blockhash()
+        time.sleep(min(remaining, self._config.retry_delay * (0.5 + random.random())))
+        return True
+
+    def build_many(
+        self,
+        instructions_list: List[List["Instruction"]],
+        payer: Optional[str] = None,
+        compute_units: Optional[int] = None,
+        compute_unit_price: Optional[int] = None,
+    ) -> List[bytes]:
+        """
+        Build several unsigned transactions against one blockhash
+
+        Args:
+            instructions_list: One list of instructions per transaction
+            payer: Fee payer pubkey (defaults to signer)
+            compute_units: Compute unit limit
+            compute_unit_price: Priority fee in microlamports per CU
+
+        Returns:
+            Unsigned transaction bytes, one per instruction list
+        """
+        recent_blockhash = self._rpc.get_latest_blockhash().get("blockhash")
+        return [
+            self._unsigned_tx_bytes(self._compile_message(
+                instructions,
+                payer=payer,
+                compute_units=compute_units,
+                compute_unit_price=compute_unit_price,
+                recent_blockhash=recent_blockhash,
+            ))
+            for instructions in instructions_list
+        ]
+
+    def build_and_send_many(
+        self,
+        instructions_list: List[List["Instruction"]],
+        compute_units: Optional[int] = None,
+        compute_unit_price: Optional[int] = None,
+        skip_preflight: Optional[bool] = None,
+        wait_confirmation: bool = True,
+        additional_signers: Optional[List["Keypair"]] = None,
+    ) -> List[TxResult]:
+        """
+        Build, sign, and send several independent transactions.
+
+        All transactions share one blockhash and are sent back to back;
+        confirmations are then awaited together. There is no retry: callers
+        that need it should resubmit the timed-out entries (or use
+        build_and_send() per transaction).
+
+        Args:
+            instructions_list: One list of instructions per transaction
+            compute_units: Compute unit limit
+            compute_unit_price: Priority fee
+            skip_preflight: Skip simulation
+            wait_confirmation: Wait for confirmation
+            additional_signers: Optional list of additional keypairs to sign with
+
+        Returns:
+            TxResult per instruction list, in order
+        """
+        skip = skip_preflight if skip_preflight is not None else self._config.skip_preflight
+        recent_blockhash = self._rpc.get_latest_blockhash().get("blockhash")
+
+        signatures = []
+        for instructions in instructions_list:
+            message = self._compile_message(
+                instructions,
+                compute_units=compute_units,
+                compute_unit_price=compute_unit_price,
+                recent_blockhash=recent_blockhash,
+            )
+            signed_tx, _ = self._sign_message(message, additional_signers)
+            self._check_size(signed_tx)
+            try:
+                signature = self._rpc.send_transaction(
+                    signed_tx,
+                    skip_preflight=skip,
+                    preflight_commitment=self._config.preflight_commitment,
+                )
+            except RpcError as e:
+                raise TransactionError.send_failed(str(e))
+            logger.info(f"Transaction sent: {signature}")
+            signatures.append(signature)
+
+        if not wait_confirmation:
+            return [TxResult(status=TxStatus.PENDING, signature=sig) for sig in signatures]
+
+        outcomes = self._rpc.confirm_transactions(
+            signatures,
+            timeout_seconds=self._config.confirmation_timeout,
+        )
+        confirmed = [sig for sig, ok in zip(signatures, outcomes) if ok is True]
+        fees = self._fetch_fees(confirmed)
+
+        results = []
+        for signature, ok in zip(signatures, outcomes):
+            if ok is True:
+                results.append(TxResult.success(signature, fee_lamports=fees.get(signature, 0)))
+            elif ok is False:
+                results.append(TxResult.failed(
+                    "Transaction failed on-chain (check explorer for details)",
+                    signature=signature,
+                ))
+            else:
+                results.append(TxResult.timeout(signature))
+        return results
+
+    def _fetch_fees(self, signatures: List[str]) -> dict:
+        """Fee in lamports per signature, fetched in one batch (best effort)"""
+        if not signatures:
+            return {}
+        opts = {"commitment": self._rpc.commitment, "maxSupportedTransactionVersion": 0}
+        try:
+            details = self._rpc.call_batch(
+                [("getTransaction", [sig, opts]) for sig in signatures]
+            )
+        except Exception as e:
+            logger.warning(f"Failed to fetch tx fees: {e}")
+            return {}
+        return {
+            sig: (detail.get("meta") or {}).get("fee", 0)
+            for sig, detail in zip(signatures, details)
+            if detail
+        }
+
 
 def create_instruction(
     program_id: str,
@@ -548,16 +852,16 @@ def create_instruction(
         raise RuntimeError("solders is required")
 
     account_metas = [
-        AccountMeta(
-            pubkey=Pubkey.from_string(acc["pubkey"]),
-            is_signer=acc.get("is_signer", False),
-            is_writable=acc.get("is_writable", False),
+        _account_meta(
+            acc["pubkey"],
+            bool(acc.get("is_signer", False)),
+            bool(acc.get("is_writable", False)),
         )
         for acc in accounts
     ]
 
     return Instruction(
-        program_id=Pubkey.from_string(program_id),
+        program_id=_pubkey_from_string(program_id),
         accounts=account_metas,
         data=data,
     )
@@ -3,12 +3,13 @@ Functional modules for DexClient
 
 Provides high-level operations:
 - WalletModule: Balance queries, token accounts
+- AsyncWalletModule: Asyncio Solana balance queries
 - MarketModule: Pool information, prices
 - SwapModule: Multi-chain token swaps (Solana/Jupiter, ETH/BSC via 1inch)
 - LiquidityModule: LP operations
 """
 
-from .wallet import WalletModule, Chain
+from .wallet import WalletModule, AsyncWalletModule, Chain
 from .market import MarketModule
 from .swap import SwapModule
 from .liquidity import LiquidityModule
@@ -16,6 +17,7 @@ from .liquidity import LiquidityModule
 __all__ = [
     # Core modules
     "WalletModule",
+    "AsyncWalletModule",
     "MarketModule",
     "SwapModule",
     "LiquidityModule",
@@ -5,17 +5,19 @@ Provides LP position operations with full result information for structured logg
 """
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from decimal import Decimal
-from typing import List, Optional, Union, TYPE_CHECKING
+from typing import Dict, List, Optional, Tuple, Union, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from ..client import DexClient
 
 from ..types import Pool, Position, PriceRange, TxResult, OpenPositionResult, ClosePositionResult
-from ..protocols import ProtocolRegistry
+from ..protocols import ProtocolRegistry, ProtocolAdapter
 from ..errors import PositionNotFound, ConfigurationError
 from ..config import config
+from ..infra.cache import RequestCoalescer
 from ..infra.retry import execute_with_retry
 
 logger = logging.getLogger(__name__)
@@ -33,6 +35,19 @@ class LiquidityModule:
     - Query positions
     """
 
+    # Fixed attributes live in slots; __dict__ is kept so tests and callers
+    # can still patch methods on an instance
+    __slots__ = (
+        "_client",
+        "_rpc",
+        "_tx_builder",
+        "_position_requests",
+        "_position_protocols",
+        "_adapters",
+        "_protocols_snapshot",
+        "__dict__",
+    )
+
     def __init__(self, client: "DexClient"):
         """
         Initialize liquidity module
@@ -44,6 +59,51 @@ class LiquidityModule:
         self._rpc = client.rpc
         self._tx_builder = client.tx_builder
 
+        # Concurrent lookups of the same position share one fetch
+        self._position_requests = RequestCoalescer()
+
+        # Protocol that last resolved each position ID (tried first next time)
+        self._position_protocols: Dict[str, str] = {}
+
+        # Protocol adapters by name, built once per module
+        self._adapters: Dict[str, ProtocolAdapter] = {}
+
+        # Registered protocol names, keyed by registry generation
+        self._protocols_snapshot: Tuple[Optional[int], Tuple[str, ...]] = (None, ())
+
+    def _adapter(self, dex: str) -> ProtocolAdapter:
+        """Get the protocol adapter for dex (created on first use)"""
+        adapter = self._adapters.get(dex)
+        if adapter is None:
+            # setdefault keeps a single instance if two threads race here
+            adapter = self._adapters.setdefault(dex, ProtocolRegistry.get(dex, self._rpc))
+        return adapter
+
+    def _protocols(self) -> Tuple[str, ...]:
+        """Registered protocol names (snapshot refreshed when the registry changes)"""
+        generation, protocols = self._protocols_snapshot
+        if generation != ProtocolRegistry.generation():
+            protocols = tuple(ProtocolRegistry.list())
+            # Read the generation after list(), which may lazily register adapters
+            self._protocols_snapshot = (ProtocolRegistry.generation(), protocols)
+        return protocols
+
+    def clear_adapters(self) -> None:
+        """Drop cached protocol adapters (next use creates fresh ones)"""
+        self._adapters.clear()
+
+    def _resolve_pool(self, pool: Union[Pool, str]) -> Pool:
+        """Return pool, fetching it first when given an address"""
+        if isinstance(pool, str):
+            return self._client.market.pool(pool)
+        return pool
+
+    def _resolve_position(self, position: Union[Position, str]) -> Position:
+        """Return position, fetching it first when given an ID"""
+        if isinstance(position, str):
+            return self.get_position(position)
+        return position
+
     @property
     def owner(self) -> str:
         """Owner wallet address"""
@@ -72,29 +132,37 @@ class LiquidityModule:
         Returns:
             OpenPositionResult with transaction result and position details
         """
-        # Resolve pool
-        if isinstance(pool, str):
-            pool = self._client.market.pool(pool)
+        pool = self._resolve_pool(pool)
 
         # Use config default if not specified
         if slippage_bps is None:
             slippage_bps = config.trading.default_lp_slippage_bps
 
         # Get adapter
-        adapter = ProtocolRegistry.get(pool.dex, self._rpc)
+        adapter = self._adapter(pool.dex)
 
-        # Calculate amounts if not provided
-        if amount0 is None or amount1 is None:
-            if amount_usd is None:
-                raise ConfigurationError.missing("amount0/amount1 or amount_usd")
+        if (amount0 is None or amount1 is None) and amount_usd is None:
+            raise ConfigurationError.missing("amount0/amount1 or amount_usd")
 
-            amount0, amount1 = adapter.calculate_amounts_for_range(
-                pool, price_range, amount_usd
-            )
+        # Warm the accounts and blockhash the build/send steps read while the
+        # amounts are calculated (best effort: failures resurface on the real reads)
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            executor.submit(adapter.prefetch_for_open, pool)
+            executor.submit(self._rpc.get_latest_blockhash)
+
+            # Calculate amounts if not provided
+            if amount0 is None or amount1 is None:
+                amount0, amount1 = adapter.calculate_amounts_for_range(
+                    pool, price_range, amount_usd
+                )
 
         # Record start time to identify new position
         start_time = datetime.now(timezone.utc)
 
+        # Read once; build_and_execute runs again on every retry
+        compute_units = config.tx.lp_compute_units
+        compute_unit_price = config.tx.lp_compute_unit_price
+
         def build_and_execute():
             # Build instructions (returns tuple of instructions and additional signers)
             instructions, additional_signers = adapter.build_open_position(
@@ -110,8 +178,8 @@ class LiquidityModule:
             return self._tx_builder.build_and_send(
                 instructions,
                 additional_signers=additional_signers,
-                compute_units=config.tx.lp_compute_units,
-                compute_unit_price=config.tx.lp_compute_unit_price,
+                compute_units=compute_units,
+                compute_unit_price=compute_unit_price,
             )
 
         tx_result = execute_with_retry(
@@ -163,15 +231,17 @@ class LiquidityModule:
         """
         # If position is provided, close single position
         if position is not None:
-            if isinstance(position, str):
-                position = self.get_position(position)
+            position = self._resolve_position(position)
 
-            adapter = ProtocolRegistry.get(position.pool.dex, self._rpc)
+            adapter = self._adapter(position.pool.dex)
 
             # Record state before closing
             fees_before = position.unclaimed_fees.copy() if position.unclaimed_fees else {}
             rewards_before = position.unclaimed_rewards.copy() if position.unclaimed_rewards else {}
 
+            compute_units = config.tx.lp_compute_units
+            compute_unit_price = config.tx.lp_compute_unit_price
+
             def build_and_execute():
                 instructions = adapter.build_close_position(
                     position=position,
@@ -179,14 +249,16 @@ class LiquidityModule:
                 )
                 return self._tx_builder.build_and_send(
                     instructions,
-                    compute_units=config.tx.lp_compute_units,
-                    compute_unit_price=config.tx.lp_compute_unit_price,
+                    compute_units=compute_units,
+                    compute_unit_price=compute_unit_price,
                 )
 
             tx_result = execute_with_retry(
                 build_and_execute,
                 f"close_position({position.id})",
             )
+            if tx_result.is_success:
+                self._position_protocols.pop(position.id, None)
 
             # Note: Actual received amounts would need to be calculated from
             # transaction logs or balance changes. Here we use position amounts
@@ -230,5 +302,95 @@ class LiquidityModule:
 
         raise ConfigurationError.missing("position or dex")
 
-    # Keep other methods (add, remove, claim, positions, get_position) as is
+    def positions(
+        self,
+        pool: Optional[str] = None,
+        dex: Optional[str] = None,
+        owner: Optional[str] = None,
+    ) -> List[Position]:
+        """
+        List LP positions
+
+        Without a dex filter every registered protocol is queried
+        concurrently; a protocol that fails is logged and skipped.
+
+        Args:
+            pool: Optional pool address filter
+            dex: Optional protocol filter
+            owner: Owner address (defaults to wallet)
+
+        Returns:
+            List of positions
+        """
+        owner = owner or self.owner
+
+        def fetch(protocol: str) -> List[Position]:
+            adapter = self._adapter(protocol)
+            return adapter.get_positions_batch([owner], [pool] if pool else None)
+
+        if dex is not None:
+            return list(fetch(dex))
+
+        protocols = self._protocols()
+        positions: List[Position] = []
+        if not protocols:
+            return positions
+
+        # Each protocol is an independent set of RPC round trips
+        with ThreadPoolExecutor(max_workers=len(protocols)) as executor:
+            futures = [(protocol, executor.submit(fetch, protocol)) for protocol in protocols]
+            for protocol, future in futures:
+                try:
+                    positions.extend(future.result())
+                except Exception as e:
+                    logger.debug(f"Failed to query positions from {protocol}: {e}", exc_info=True)
+
+        return positions
+
+    def get_position(self, position_id: str, dex: Optional[str] = None) -> Position:
+        """
+        Get single position by ID
+
+        Args:
+            position_id: Position identifier (NFT mint for Raydium, address for Meteora)
+            dex: Protocol name (each registered protocol is tried if not provided)
+
+        Returns:
+            Position information
+
+        Raises:
+            PositionNotFound: If no protocol has the position
+        """
+        return self._position_requests.run(
+            (dex, position_id),
+            lambda: self._fetch_position(position_id, dex),
+        )
+
+    def _fetch_position(self, position_id: str, dex: Optional[str]) -> Position:
+        """Fetch position from its protocol adapter"""
+        if dex is not None:
+            return self._adapter(dex).get_position(position_id)
+
+        known = self._position_protocols.get(position_id)
+        if known is not None:
+            try:
+                return self._adapter(known).get_position(position_id)
+            except Exception as e:
+                logger.debug(f"Protocol {known} no longer has position {position_id}: {e}")
+                self._position_protocols.pop(position_id, None)
+
+        for protocol in self._protocols():
+            if protocol == known:
+                continue
+            try:
+                position = self._adapter(protocol).get_position(position_id)
+            except Exception as e:
+                logger.debug(f"Protocol {protocol} has no position {position_id}: {e}")
+                continue
+            self._position_protocols[position_id] = protocol
+            return position
+
+        raise PositionNotFound.not_found(position_id)
+
+    # Keep other methods (add, remove, claim) as is
     # They can be copied from the original file if needed
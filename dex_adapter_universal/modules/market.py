@@ -8,8 +8,10 @@ Provides pool and price queries across multiple chains:
 """
 
 import logging
+import re
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from decimal import Decimal
-from typing import List, Optional, Union, TYPE_CHECKING
+from typing import Dict, List, Optional, Tuple, Union, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from ..client import DexClient
@@ -19,10 +21,11 @@ if TYPE_CHECKING:
 from ..types import Pool
 from ..types.solana_tokens import SOLANA_TOKEN_MINTS, resolve_token_mint
 from ..types.evm_tokens import resolve_token_address
-from ..types.pool import KNOWN_POOLS
-from ..protocols import ProtocolRegistry
+from ..types.pool import get_pool_address
+from ..protocols import ProtocolRegistry, ProtocolAdapter
 from ..errors import PoolUnavailable, ConfigurationError, OperationNotSupported
 from ..config import config
+from ..infra.cache import TtlCache, RequestCoalescer, MISSING
 from .wallet import Chain
 
 logger = logging.getLogger(__name__)
@@ -34,6 +37,15 @@ DEFAULT_DEX_BY_CHAIN = {
     Chain.BSC: "pancakeswap",
 }
 
+# Solana address: base58 alphabet (no 0, O, I, l), 32-44 characters
+_BASE58_ADDR = re.compile(r"^[1-9A-HJ-NP-Za-km-z]{32,44}$")
+
+# Symbol normalization: upper-case ASCII letters and use "/" as the pair separator
+_SYMBOL_TRANS = str.maketrans({"-": "/", **{c: c.upper() for c in "abcdefghijklmnopqrstuvwxyz"}})
+
+# Quote tokens tried by price_usd(), in order
+USD_STABLES = ("USDC", "USDT")
+
 # Valid DEX protocols per chain
 VALID_DEX_BY_CHAIN = {
     Chain.SOLANA: {"raydium", "meteora"},
@@ -68,6 +80,21 @@ class MarketModule:
         price = client.market.price("BNB/USDT", chain="bsc")
     """
 
+    # Fixed attributes live in slots; __dict__ is kept so tests and callers
+    # can still patch methods on an instance
+    __slots__ = (
+        "_client",
+        "_rpc",
+        "_uniswap_adapter",
+        "_pancakeswap_adapter",
+        "_pool_cache",
+        "_pool_requests",
+        "_price_cache",
+        "_adapters",
+        "_protocols_snapshot",
+        "__dict__",
+    )
+
     def __init__(self, client: "DexClient"):
         """
         Initialize market module
@@ -82,11 +109,26 @@ class MarketModule:
         self._uniswap_adapter: Optional["UniswapAdapter"] = None
         self._pancakeswap_adapter: Optional["PancakeSwapAdapter"] = None
 
+        # Parsed pools, briefly reused; concurrent misses share one fetch
+        self._pool_cache = TtlCache(
+            ttl_seconds=config.market.pool_cache_ttl,
+            maxsize=config.market.pool_cache_size,
+        )
+        self._pool_requests = RequestCoalescer()
+        self._price_cache = TtlCache(ttl_seconds=config.market.price_cache_ttl, maxsize=512)
+
+        # Protocol adapters by name, built once per module
+        self._adapters: Dict[str, ProtocolAdapter] = {}
+
+        # Registered protocol names, keyed by registry generation
+        self._protocols_snapshot: Tuple[Optional[int], Tuple[str, ...]] = (None, ())
+
     def pool(
         self,
         pool_address: str,
         dex: Optional[str] = None,
         chain: Union[str, Chain] = Chain.SOLANA,
+        refresh: bool = False,
     ) -> Pool:
         """
         Get pool by address
@@ -95,6 +137,7 @@ class MarketModule:
             pool_address: Pool address
             dex: Protocol name (auto-detected if not provided for Solana)
             chain: Blockchain ("solana", "eth", "bsc" or Chain enum)
+            refresh: Bypass the pool cache and fetch fresh state
 
         Returns:
             Pool information
@@ -108,23 +151,39 @@ class MarketModule:
         # Validate chain/dex combination
         self._validate_chain_dex(resolved_chain, dex)
 
-        if resolved_chain == Chain.SOLANA:
-            adapter = ProtocolRegistry.get(dex, self._rpc)
-            pool = adapter.get_pool(pool_address)
-        elif resolved_chain == Chain.ETH:
-            adapter = self._get_uniswap_adapter()
-            pool = adapter.get_pool_by_address(pool_address)
-        elif resolved_chain == Chain.BSC:
-            adapter = self._get_pancakeswap_adapter()
-            pool = adapter.get_pool_by_address(pool_address)
-        else:
-            raise OperationNotSupported(f"Unsupported chain: {resolved_chain}")
+        key = (resolved_chain, dex, pool_address)
+        if not refresh:
+            pool = self._pool_cache.get(key)
+            if pool is not MISSING:
+                return pool
+
+        def fetch() -> Optional[Pool]:
+            fetched = self._fetch_pool(pool_address, dex, resolved_chain)
+            if fetched is not None:
+                self._pool_cache.set(key, fetched)
+            return fetched
+
+        pool = self._pool_requests.run(key, fetch)
 
         if pool is None:
             raise PoolUnavailable.not_found(pool_address)
 
         return pool
 
+    def _fetch_pool(self, pool_address: str, dex: str, chain: Chain) -> Optional[Pool]:
+        """Fetch pool from the chain's adapter"""
+        if chain == Chain.SOLANA:
+            adapter = self._adapter(dex)
+            return adapter.get_pool(pool_address)
+        elif chain == Chain.ETH:
+            adapter = self._get_uniswap_adapter()
+            return adapter.get_pool_by_address(pool_address)
+        elif chain == Chain.BSC:
+            adapter = self._get_pancakeswap_adapter()
+            return adapter.get_pool_by_address(pool_address)
+        else:
+            raise OperationNotSupported(f"Unsupported chain: {chain}")
+
     def pool_by_symbol(
         self,
         symbol: str,
@@ -154,20 +213,12 @@ class MarketModule:
         self._validate_chain_dex(resolved_chain, dex)
 
         # Normalize symbol
-        symbol = symbol.upper().replace("-", "/")
-
-        # Check known pools first
-        if dex in KNOWN_POOLS:
-            if symbol in KNOWN_POOLS[dex]:
-                pool_address = KNOWN_POOLS[dex][symbol]
-                return self.pool(pool_address, dex, chain=resolved_chain)
-            # Try reversed symbol
-            parts = symbol.split("/")
-            if len(parts) == 2:
-                reversed_symbol = f"{parts[1]}/{parts[0]}"
-                if reversed_symbol in KNOWN_POOLS[dex]:
-                    pool_address = KNOWN_POOLS[dex][reversed_symbol]
-                    return self.pool(pool_address, dex, chain=resolved_chain)
+        symbol = symbol.translate(_SYMBOL_TRANS)
+
+        # Check known pools first (either pair order)
+        pool_address = get_pool_address(dex, symbol)
+        if pool_address is not None:
+            return self.pool(pool_address, dex, chain=resolved_chain)
 
         # Parse symbol and resolve to tokens
         parts = symbol.split("/")
@@ -177,12 +228,13 @@ class MarketModule:
         token0_symbol, token1_symbol = parts
 
         if resolved_chain == Chain.SOLANA:
-            # Resolve symbols to mint addresses using Solana registry
-            token0_addr = resolve_token_mint(token0_symbol)
-            token1_addr = resolve_token_mint(token1_symbol)
+            # Resolve symbols to mint addresses using Solana registry (symbols are
+            # already upper-case, so known tokens are a direct dict hit)
+            token0_addr = SOLANA_TOKEN_MINTS.get(token0_symbol) or resolve_token_mint(token0_symbol)
+            token1_addr = SOLANA_TOKEN_MINTS.get(token1_symbol) or resolve_token_mint(token1_symbol)
 
             # Try adapter lookup with mints
-            adapter = ProtocolRegistry.get(dex, self._rpc)
+            adapter = self._adapter(dex)
             pool = adapter.get_pool_by_tokens(token0_addr, token1_addr)
 
             if pool is None:
@@ -238,7 +290,7 @@ class MarketModule:
         resolved_chain = self._resolve_chain(chain)
 
         if resolved_chain == Chain.SOLANA:
-            return resolve_token_mint(token)
+            return SOLANA_TOKEN_MINTS.get(token) or resolve_token_mint(token)
         else:
             return resolve_token_address(token, resolved_chain.chain_id)
 
@@ -272,22 +324,25 @@ class MarketModule:
 
         pools: List[Pool] = []
 
-        protocols = [dex] if dex else ProtocolRegistry.list()
+        protocols = (dex,) if dex else self._protocols()
 
         # Resolve token symbol to mint address if provided
         token_mint = self.resolve_token(token, chain=resolved_chain) if token else None
-
-        for protocol in protocols:
-            try:
-                adapter = ProtocolRegistry.get(protocol, self._rpc)
-                if token_mint:
-                    protocol_pools = adapter.get_pools_by_token(token_mint)
-                else:
-                    protocol_pools = []  # Would need indexer
-                pools.extend(protocol_pools)
-            except Exception as e:
-                logger.debug(f"Failed to query pools from {protocol}: {e}", exc_info=True)
-                continue
+        if not token_mint or not protocols:
+            return pools  # Listing without a token filter would need an indexer
+
+        def fetch(protocol: str) -> List[Pool]:
+            adapter = self._adapter(protocol)
+            return adapter.get_pools_by_token(token_mint)
+
+        # Protocols are queried concurrently; results keep protocol order
+        with ThreadPoolExecutor(max_workers=len(protocols)) as executor:
+            futures = [(protocol, executor.submit(fetch, protocol)) for protocol in protocols]
+            for protocol, future in futures:
+                try:
+                    pools.extend(future.result())
+                except Exception as e:
+                    logger.debug(f"Failed to query pools from {protocol}: {e}", exc_info=True)
 
         return pools
 
@@ -316,10 +371,15 @@ class MarketModule:
         if dex is None:
             dex = self._get_default_dex(resolved_chain)
 
+        key = ("price", resolved_chain, dex, pool_or_symbol, fee)
+        cached = self._price_cache.get(key)
+        if cached is not MISSING:
+            return cached
+
         # Determine if it's a pool address or symbol
-        # Solana: base58, ~44 chars; EVM: hex, 42 chars starting with 0x
+        # Solana: base58, 32-44 chars; EVM: hex, 42 chars starting with 0x
         is_address = (
-            (resolved_chain == Chain.SOLANA and len(pool_or_symbol) > 30)
+            (resolved_chain == Chain.SOLANA and _BASE58_ADDR.match(pool_or_symbol) is not None)
             or (resolved_chain.is_evm and pool_or_symbol.startswith("0x"))
         )
 
@@ -330,6 +390,7 @@ class MarketModule:
             if not pool:
                 raise PoolUnavailable.not_found(pool_or_symbol)
 
+        self._price_cache.set(key, pool.price)
         return pool.price
 
     def price_usd(
@@ -355,39 +416,66 @@ class MarketModule:
         if dex is None:
             dex = self._get_default_dex(resolved_chain)
 
-        # Try to find a stablecoin pool
-        stables = ["USDC", "USDT"]
+        key = ("usd", resolved_chain, dex, token.upper())
+        cached = self._price_cache.get(key)
+        if cached is not MISSING:
+            return cached
 
-        for stable in stables:
+        # Try to find a stablecoin pool
+        price = None
+        for stable in USD_STABLES:
             try:
                 pool = self.pool_by_symbol(f"{token}/{stable}", dex=dex, chain=resolved_chain)
                 if pool:
-                    return pool.price
+                    price = pool.price
+                    break
             except Exception as e:
                 logger.debug(f"Failed to get price for {token}/{stable}: {e}", exc_info=True)
                 continue
 
-        return None
+        if price is not None:
+            self._price_cache.set(key, price)
+        return price
 
     def _detect_protocol(self, pool_address: str) -> str:
         """
         Auto-detect protocol for a pool address
 
-        Tries each registered protocol until one succeeds.
+        Probes every registered protocol concurrently and returns the first
+        that parses the pool, without waiting for the slower probes.
 
         Raises:
             PoolUnavailable: If no protocol can parse the pool
         """
+        # Registered protocols are Solana programs; skip the RPC probes for
+        # anything that cannot be a Solana account address
+        if not _BASE58_ADDR.match(pool_address):
+            raise PoolUnavailable(
+                f"Could not detect protocol for pool {pool_address}: not a Solana address",
+                pool_address=pool_address,
+            )
+
+        def probe(protocol: str) -> str:
+            adapter = self._adapter(protocol)
+            adapter.get_pool(pool_address)
+            return protocol
+
+        protocols = self._protocols()
         errors = []
-        for protocol in ProtocolRegistry.list():
+        if protocols:
+            executor = ThreadPoolExecutor(max_workers=len(protocols))
             try:
-                adapter = ProtocolRegistry.get(protocol, self._rpc)
-                adapter.get_pool(pool_address)
-                return protocol
-            except Exception as e:
-                errors.append(f"{protocol}: {e}")
-                logger.debug(f"Protocol {protocol} failed for pool {pool_address}: {e}")
-                continue
+                futures = {executor.submit(probe, protocol): protocol for protocol in protocols}
+                for future in as_completed(futures):
+                    protocol = futures[future]
+                    try:
+                        return future.result()
+                    except Exception as e:
+                        errors.append(f"{protocol}: {e}")
+                        logger.debug(f"Protocol {protocol} failed for pool {pool_address}: {e}")
+            finally:
+                # Don't wait for probes still in flight once one has succeeded
+                executor.shutdown(wait=False, cancel_futures=True)
 
         # Raise error instead of silently defaulting to raydium
         raise PoolUnavailable(
@@ -395,10 +483,42 @@ class MarketModule:
             pool_address=pool_address,
         )
 
+    def invalidate(self) -> None:
+        """
+        Drop cached RPC reads so the next query hits the chain
+
+        Useful after state changes made outside this client (e.g. another
+        process trading the same wallet).
+        """
+        self._pool_cache.clear()
+        self._price_cache.clear()
+        self._rpc.invalidate_cache()
+
     # =========================================================================
     # Helper Methods
     # =========================================================================
 
+    def _adapter(self, dex: str) -> ProtocolAdapter:
+        """Get the protocol adapter for dex (created on first use)"""
+        adapter = self._adapters.get(dex)
+        if adapter is None:
+            # setdefault keeps a single instance if two threads race here
+            adapter = self._adapters.setdefault(dex, ProtocolRegistry.get(dex, self._rpc))
+        return adapter
+
+    def _protocols(self) -> Tuple[str, ...]:
+        """Registered protocol names (snapshot refreshed when the registry changes)"""
+        generation, protocols = self._protocols_snapshot
+        if generation != ProtocolRegistry.generation():
+            protocols = tuple(ProtocolRegistry.list())
+            # Read the generation after list(), which may lazily register adapters
+            self._protocols_snapshot = (ProtocolRegistry.generation(), protocols)
+        return protocols
+
+    def clear_adapters(self) -> None:
+        """Drop cached protocol adapters (next use creates fresh ones)"""
+        self._adapters.clear()
+
     def _resolve_chain(self, chain: Union[str, Chain, None]) -> Chain:
         """Resolve chain parameter to Chain enum"""
         if chain is None:
@@ -441,6 +561,7 @@ class MarketModule:
 
     def close(self):
         """Clean up EVM adapters"""
+        self.clear_adapters()
         if self._uniswap_adapter is not None:
             self._uniswap_adapter.close()
             self._uniswap_adapter = None
@@ -9,9 +9,12 @@ Supports:
 - BSC: BNB and BEP20 tokens
 """
 
+import asyncio
+import functools
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from decimal import Decimal
-from typing import Dict, List, Optional, Union, TYPE_CHECKING
+from typing import Any, Dict, List, Optional, Tuple, Union, TYPE_CHECKING
 from dataclasses import dataclass
 from enum import Enum
 
@@ -84,6 +87,144 @@ class TokenAccount:
 
 
 from ..types.solana_tokens import SOLANA_TOKEN_MINTS, resolve_token_mint
+from ..infra.cache import RequestCoalescer
+
+# Decimal is immutable, so one shared zero serves every default/empty balance
+_ZERO = Decimal(0)
+
+# Mint the native SOL balance is reported under by balances()
+_WSOL_MINT = SOLANA_TOKEN_MINTS["WSOL"]
+
+
+@functools.lru_cache(maxsize=32)
+def _scale(decimals: int) -> Decimal:
+    """10 ** decimals as a Decimal (divisor from raw to UI amounts)"""
+    return Decimal(10) ** decimals
+
+
+def _classify_token(token: str) -> Tuple[bool, Optional[str]]:
+    """
+    Classify a Solana balance query
+
+    Not memoized, so tokens added to SOLANA_TOKEN_MINTS at runtime resolve.
+
+    Returns:
+        (True, None) for native SOL, otherwise (False, mint address)
+    """
+    if token.upper() == "SOL":
+        return True, None
+    return False, resolve_token_mint(token)
+
+
+# SPL Token program and the associated token account program
+_TOKEN_PROGRAM_ID = "TokenkegQfeZyiNwAJbNbGKPFXCWuBvf9Ss623VQ5DA"
+_ASSOCIATED_TOKEN_PROGRAM_ID = "ATokenGPvbdGVxr1b2hvZbsiqW5xWH25efTNsLJA8knL"
+
+
+@functools.lru_cache(maxsize=256)
+def _associated_token_address(owner: str, mint: str) -> Optional[str]:
+    """
+    SPL Token associated token account address for (owner, mint)
+
+    Returns:
+        ATA address, or None if owner or mint is not a valid address
+    """
+    from solders.pubkey import Pubkey
+
+    try:
+        owner_key = Pubkey.from_string(owner)
+        mint_key = Pubkey.from_string(mint)
+    except ValueError:
+        return None
+
+    address, _ = Pubkey.find_program_address(
+        [bytes(owner_key), bytes(Pubkey.from_string(_TOKEN_PROGRAM_ID)), bytes(mint_key)],
+        Pubkey.from_string(_ASSOCIATED_TOKEN_PROGRAM_ID),
+    )
+    return str(address)
+
+
+def _parse_token_account(
+    account: Dict[str, Any],
+) -> Optional[Tuple[Optional[str], Optional[str], int, Optional[str], Optional[str]]]:
+    """
+    Fields of a jsonParsed token account entry
+
+    Returns:
+        (mint, raw amount string, decimals, account pubkey, owner),
+        or None if the entry has no parsed info. Entries without a
+        tokenAmount report (amount None, decimals 0).
+    """
+    try:
+        info = account["account"]["data"]["parsed"]["info"]
+        token_amount = info.get("tokenAmount")
+        if token_amount is None:
+            amount, decimals = None, 0
+        else:
+            amount, decimals = token_amount.get("amount"), token_amount.get("decimals", 0)
+        return (
+            info.get("mint"),
+            amount,
+            decimals,
+            account.get("pubkey"),
+            info.get("owner"),
+        )
+    except (KeyError, TypeError, AttributeError):
+        return None
+
+
+def _aggregate_balances(lamports: int, accounts: List[Dict[str, Any]]) -> Dict[str, Decimal]:
+    """
+    Per-mint UI balances from a SOL balance and the wallet's token accounts
+
+    Native SOL is reported under the WRAPPED_SOL mint; empty accounts are skipped.
+    """
+    # Raw amounts per mint (scaled to UI units once at the end)
+    raw: Dict[str, int] = {_WSOL_MINT: lamports}
+    decimals_by_mint: Dict[str, int] = {_WSOL_MINT: 9}
+
+    for account in accounts:
+        parsed = _parse_token_account(account)
+        if parsed is None:
+            continue
+        mint, amount_str, decimals = parsed[:3]
+        if not (mint and amount_str):
+            continue
+        try:
+            amount = int(amount_str)
+        except ValueError as e:
+            logger.warning(f"Skipping token account due to parse error: {e}")
+            continue
+        if amount > 0:
+            raw[mint] = raw.get(mint, 0) + amount
+            decimals_by_mint[mint] = decimals
+
+    return {
+        mint: Decimal(amount) / _scale(decimals_by_mint[mint])
+        for mint, amount in raw.items()
+    }
+
+
+def _sum_token_amounts(accounts: List[Dict[str, Any]]) -> Tuple[int, int]:
+    """
+    Total raw amount and decimals across token accounts of one mint
+
+    Returns:
+        (raw total, decimals)
+    """
+    total = 0
+    decimals = 0
+    for account in accounts:
+        parsed = _parse_token_account(account)
+        if parsed is None:
+            continue
+        _, amount_str, account_decimals = parsed[:3]
+        if amount_str is None:
+            continue
+        decimals = account_decimals
+        if amount_str:
+            total += int(amount_str)
+    return total, decimals
 
 
 class WalletModule:
@@ -115,7 +256,7 @@ class WalletModule:
     """
 
     # Common Solana token addresses (from centralized registry)
-    WRAPPED_SOL = SOLANA_TOKEN_MINTS["WSOL"]
+    WRAPPED_SOL = _WSOL_MINT
     USDC = SOLANA_TOKEN_MINTS["USDC"]
     USDT = SOLANA_TOKEN_MINTS["USDT"]
 
@@ -129,13 +270,31 @@ class WalletModule:
         self._client = client
         self._rpc = client.rpc
 
+        # Bound once; the signer (and so the address) is fixed per client
+        self._address: str = client.pubkey
+        self._get_balance = self._rpc.get_balance
+        self._get_token_accounts = self._rpc.get_token_accounts_by_owner
+
         # EVM configuration
         self._evm_address: Optional[str] = None
 
+        # Concurrent token account lookups for the same mint share one RPC
+        self._account_requests = RequestCoalescer()
+
+        # Runs independent reads side by side (created on first use)
+        self._executor: Optional[ThreadPoolExecutor] = None
+
     @property
     def address(self) -> str:
         """Solana wallet address"""
-        return self._client.pubkey
+        return self._address
+
+    def refresh(self) -> None:
+        """Re-read the wallet address and RPC handles from the client"""
+        self._rpc = self._client.rpc
+        self._address = self._client.pubkey
+        self._get_balance = self._rpc.get_balance
+        self._get_token_accounts = self._rpc.get_token_accounts_by_owner
 
     @property
     def evm_address(self) -> Optional[str]:
@@ -218,6 +377,34 @@ class WalletModule:
         """
         return resolve_token_mint(token)
 
+    def _fetch_accounts(self, mint: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Get the wallet's token accounts (optionally for one mint)
+
+        Repeat reads within RpcConfig.token_accounts_cache_ttl are served by
+        the RPC client's cache; concurrent callers share one request.
+
+        Args:
+            mint: Optional mint filter
+
+        Returns:
+            List of token account info
+        """
+        owner = self._address
+        return self._account_requests.run(
+            (owner, mint),
+            lambda: self._get_token_accounts(owner, mint=mint),
+        )
+
+    def invalidate(self) -> None:
+        """
+        Drop cached RPC reads so the next query hits the chain
+
+        Sends through this client already do this; call it after balance
+        changes made elsewhere (e.g. another process using the same wallet).
+        """
+        self._rpc.invalidate_cache()
+
     # =========================================================================
     # Solana Balance Methods
     # =========================================================================
@@ -232,34 +419,21 @@ class WalletModule:
         Returns:
             Token balance in UI units
         """
-        # Handle native SOL explicitly
-        if token.upper() == "SOL":
-            lamports = self._rpc.get_balance(self.address)
-            return Decimal(lamports) / Decimal(10 ** 9)
-
-        # Resolve symbol to mint address
-        mint = self._resolve_mint(token)
+        # Handle native SOL explicitly, otherwise resolve symbol to mint address
+        is_native, mint = _classify_token(token)
+        if is_native:
+            lamports = self._get_balance(self._address)
+            return Decimal(lamports) / _scale(9)
 
         # Get token accounts for this mint
-        accounts = self._rpc.get_token_accounts_by_owner(
-            self.address,
-            mint=mint,
-        )
+        accounts = self._fetch_accounts(mint)
 
         if not accounts:
-            return Decimal(0)
+            return _ZERO
 
-        # Sum balances from all accounts for this mint
-        total = Decimal(0)
-        for account in accounts:
-            info = account.get("account", {}).get("data", {}).get("parsed", {}).get("info", {})
-            token_amount = info.get("tokenAmount", {})
-            amount_str = token_amount.get("amount")
-            decimals = token_amount.get("decimals", 0)
-            if amount_str:
-                total += Decimal(amount_str) / Decimal(10 ** decimals)
-
-        return total
+        # Sum raw amounts from all accounts for this mint, then scale once
+        total, decimals = _sum_token_amounts(accounts)
+        return Decimal(total) / _scale(decimals)
 
     def _solana_balance_raw(self, token: str) -> int:
         """
@@ -271,28 +445,16 @@ class WalletModule:
         Returns:
             Raw balance (lamports for SOL, smallest units for tokens)
         """
-        if token.upper() == "SOL":
-            return self._rpc.get_balance(self.address)
-
-        mint = self._resolve_mint(token)
+        is_native, mint = _classify_token(token)
+        if is_native:
+            return self._get_balance(self._address)
 
-        accounts = self._rpc.get_token_accounts_by_owner(
-            self.address,
-            mint=mint,
-        )
+        accounts = self._fetch_accounts(mint)
 
         if not accounts:
             return 0
 
-        total = 0
-        for account in accounts:
-            info = account.get("account", {}).get("data", {}).get("parsed", {}).get("info", {})
-            token_amount = info.get("tokenAmount", {})
-            amount = token_amount.get("amount")
-            if amount:
-                total += int(amount)
-
-        return total
+        return _sum_token_amounts(accounts)[0]
 
     # =========================================================================
     # EVM Balance Methods
@@ -333,7 +495,7 @@ class WalletModule:
             token_address if not is_native_token(token_address) else None,
         )
 
-        return Decimal(raw_balance) / Decimal(10 ** decimals)
+        return Decimal(raw_balance) / _scale(decimals)
 
     def _evm_balance_raw(self, token: str, chain_id: int) -> int:
         """
@@ -431,35 +593,72 @@ class WalletModule:
             Dict mapping mint address to balance.
             Native SOL is included under WRAPPED_SOL mint address.
         """
-        balances: Dict[str, Decimal] = {}
+        # SOL balance and token accounts are independent; fetch them together
+        lamports_future = self._get_executor().submit(self._get_balance, self._address)
+        accounts = self._fetch_accounts()
+
+        return _aggregate_balances(lamports_future.result(), accounts)
+
+    def balances_for(self, tokens: List[str], all_accounts: bool = True) -> Dict[str, Decimal]:
+        """
+        Get Solana balances for several tokens in one account read
 
-        # Add native SOL balance under WRAPPED_SOL key
-        lamports = self._rpc.get_balance(self.address)
-        balances[self.WRAPPED_SOL] = Decimal(lamports) / Decimal(10 ** 9)
+        Reads each token's associated token account (ATA) with a single
+        getMultipleAccounts call instead of one getTokenAccountsByOwner
+        per token. Tokens without a classic SPL Token ATA (Token-2022 mints,
+        balances held only in auxiliary accounts) are then looked up with
+        the owner scan used by balance().
 
-        # Get all token accounts
-        accounts = self._rpc.get_token_accounts_by_owner(self.address)
+        Args:
+            tokens: Token symbols (e.g., "SOL", "USDC") or mint addresses
+            all_accounts: Scan the owner's token accounts for tokens without
+                          an ATA (one extra RPC per such token). Pass False
+                          to read ATAs only; such tokens then report 0.
 
-        for account in accounts:
+        Returns:
+            Dict mapping each requested token (as given) to its balance
+            in UI units
+        """
+        lamports_future = None
+        mint_by_token: Dict[str, str] = {}
+        for token in tokens:
+            is_native, mint = _classify_token(token)
+            if is_native:
+                if lamports_future is None:
+                    lamports_future = self._get_executor().submit(self._get_balance, self._address)
+            else:
+                mint_by_token[token] = mint
+
+        # One ATA per distinct mint, read together
+        atas: Dict[str, str] = {}
+        for mint in dict.fromkeys(mint_by_token.values()):
+            ata = _associated_token_address(self._address, mint)
+            if ata is not None:
+                atas[mint] = ata
+        values = self._rpc.get_multiple_accounts(list(atas.values()), encoding="jsonParsed") if atas else []
+
+        by_mint: Dict[str, Decimal] = {}
+        for mint, value in zip(atas, values):
             try:
-                info = account.get("account", {}).get("data", {}).get("parsed", {}).get("info", {})
-                mint = info.get("mint")
-                token_amount = info.get("tokenAmount", {})
-
-                amount_str = token_amount.get("amount")
-                decimals = token_amount.get("decimals", 0)
-
-                if mint and amount_str:
-                    amount = Decimal(amount_str) / Decimal(10 ** decimals)
-                    if amount > 0:
-                        current = balances.get(mint, Decimal(0))
-                        balances[mint] = current + amount
-            except (KeyError, TypeError, ValueError) as e:
-                logger.warning(f"Skipping token account due to parse error: {e}")
-                logger.debug("Token account parse error details", exc_info=True)
+                token_amount = value["data"]["parsed"]["info"]["tokenAmount"]
+                by_mint[mint] = Decimal(int(token_amount["amount"])) / _scale(token_amount.get("decimals", 0))
+            except (KeyError, TypeError, ValueError):
                 continue
 
-        return balances
+        result: Dict[str, Decimal] = {}
+        for token in tokens:
+            mint = mint_by_token.get(token)
+            if mint is None:
+                result[token] = Decimal(lamports_future.result()) / _scale(9)
+                continue
+            if mint not in by_mint:
+                if all_accounts:
+                    total, decimals = _sum_token_amounts(self._fetch_accounts(mint))
+                    by_mint[mint] = Decimal(total) / _scale(decimals)
+                else:
+                    by_mint[mint] = _ZERO
+            result[token] = by_mint[mint]
+        return result
 
     def token_accounts(self) -> List[TokenAccount]:
         """
@@ -470,35 +669,29 @@ class WalletModule:
         """
         accounts_list: List[TokenAccount] = []
 
-        accounts = self._rpc.get_token_accounts_by_owner(self.address)
+        accounts = self._fetch_accounts()
 
         for account in accounts:
+            parsed = _parse_token_account(account)
+            if parsed is None:
+                continue
+            mint, amount_str, decimals, pubkey, owner = parsed
+            if not (pubkey and mint):
+                continue
             try:
-                pubkey = account.get("pubkey")
-                info = account.get("account", {}).get("data", {}).get("parsed", {}).get("info", {})
-
-                mint = info.get("mint")
-                owner = info.get("owner")
-                token_amount = info.get("tokenAmount", {})
-
-                amount_str = token_amount.get("amount", "0")
-                decimals = token_amount.get("decimals", 0)
-                balance = Decimal(amount_str) / Decimal(10 ** decimals) if amount_str else Decimal(0)
-
-                if pubkey and mint:
-                    accounts_list.append(TokenAccount(
-                        address=pubkey,
-                        mint=mint,
-                        owner=owner or self.address,
-                        balance=balance,
-                        decimals=decimals,
-                    ))
-            except (KeyError, TypeError, ValueError) as e:
-                pubkey = account.get('pubkey', 'unknown')
+                balance = Decimal(amount_str) / _scale(decimals) if amount_str else _ZERO
+            except (ArithmeticError, TypeError) as e:
                 logger.warning(f"Skipping token account {pubkey} due to parse error: {e}")
-                logger.debug("Token account parse error details", exc_info=True)
                 continue
 
+            accounts_list.append(TokenAccount(
+                address=pubkey,
+                mint=mint,
+                owner=owner or self._address,
+                balance=balance,
+                decimals=decimals,
+            ))
+
         return accounts_list
 
     def get_token_account(self, token: str) -> Optional[str]:
@@ -509,14 +702,18 @@ class WalletModule:
             token: Token symbol (e.g., "SOL", "USDC") or mint address
 
         Returns:
-            Token account address or None
+            Token account address (the associated token account if it
+            exists) or None
         """
         mint = self._resolve_mint(token)
 
-        accounts = self._rpc.get_token_accounts_by_owner(
-            self.address,
-            mint=mint,
-        )
+        # Most wallets hold their tokens in the associated token account; a
+        # single getAccountInfo on it avoids the much slower owner scan
+        ata = _associated_token_address(self._address, mint)
+        if ata is not None and self._rpc.get_account_info(ata) is not None:
+            return ata
+
+        accounts = self._fetch_accounts(mint)
 
         if accounts:
             return accounts[0].get("pubkey")
@@ -534,12 +731,90 @@ class WalletModule:
         """
         return self.get_token_account(token) is not None
 
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Get or create the worker pool for concurrent reads"""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="wallet")
+        return self._executor
+
     def close(self) -> None:
-        """No resources to clean up (no caching)"""
-        pass
+        """Shut down the worker pool (recreated if the module is used again)"""
+        executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False)
 
     def __enter__(self):
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         self.close()
+
+
+class AsyncWalletModule:
+    """
+    Asyncio variant of the Solana wallet reads
+
+    Uses the RPC client's async methods, so balances for many wallets can be
+    gathered concurrently on one event loop. Reads share the RPC client's
+    cache with WalletModule.
+
+    Usage:
+        wallets = [AsyncWalletModule(client) for client in clients]
+        results = await asyncio.gather(*(w.balances() for w in wallets))
+    """
+
+    def __init__(self, client: "DexClient"):
+        """
+        Initialize async wallet module
+
+        Args:
+            client: DexClient instance
+        """
+        self._client = client
+        self._rpc = client.rpc
+        self._address: str = client.pubkey
+
+    @property
+    def address(self) -> str:
+        """Solana wallet address"""
+        return self._address
+
+    async def sol_balance(self) -> Decimal:
+        """Get native SOL balance in UI units"""
+        lamports = await self._rpc.aget_balance(self._address)
+        return Decimal(lamports) / _scale(9)
+
+    async def balance(self, token: str) -> Decimal:
+        """
+        Get Solana token balance by symbol or mint address
+
+        Args:
+            token: Token symbol (e.g., "SOL", "USDC") or mint address
+
+        Returns:
+            Token balance in UI units
+        """
+        is_native, mint = _classify_token(token)
+        if is_native:
+            return await self.sol_balance()
+
+        accounts = await self._rpc.aget_token_accounts_by_owner(self._address, mint=mint)
+        if not accounts:
+            return _ZERO
+
+        total, decimals = _sum_token_amounts(accounts)
+        return Decimal(total) / _scale(decimals)
+
+    async def balances(self) -> Dict[str, Decimal]:
+        """
+        Get all Solana token balances
+
+        Returns:
+            Dict mapping mint address to balance.
+            Native SOL is included under WRAPPED_SOL mint address.
+        """
+        lamports, accounts = await asyncio.gather(
+            self._rpc.aget_balance(self._address),
+            self._rpc.aget_token_accounts_by_owner(self._address),
+        )
+        return _aggregate_balances(lamports, accounts)
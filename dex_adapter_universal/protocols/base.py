@@ -13,8 +13,72 @@ if TYPE_CHECKING:
     from solders.instruction import Instruction
     from solders.keypair import Keypair
 
+try:
+    from solders.pubkey import Pubkey
+except ImportError:
+    Pubkey = None
+
 from ..types import Pool, Position, PriceRange, Token
+from ..types.solana_tokens import SOLANA_TOKEN_MINTS
 from ..infra import RpcClient
+from ..infra.cache import TtlCache, MISSING
+
+
+_TOKEN_PROGRAM_ID = "TokenkegQfeZyiNwAJbNbGKPFXCWuBvf9Ss623VQ5DA"
+_TOKEN_2022_PROGRAM_ID = "TokenzQdBNbLqP5VEhdkAS6EPFLC1PHnBqCXEpPxuEb"
+_WRAPPED_SOL_MINT = SOLANA_TOKEN_MINTS["SOL"]
+
+# Returned as-is by detect_token_program_for_mint (Pubkey is immutable), so
+# the base58 IDs are decoded once at import rather than on every call
+if Pubkey is not None:
+    _TOKEN_PROGRAM_PUBKEY = Pubkey.from_string(_TOKEN_PROGRAM_ID)
+    _TOKEN_2022_PROGRAM_PUBKEY = Pubkey.from_string(_TOKEN_2022_PROGRAM_ID)
+
+# (RPC endpoint, mint) -> owned by Token-2022. A mint's token program never
+# changes, so each mint is looked up once per cluster; keying by endpoint
+# keeps devnet and mainnet answers apart. Failed lookups, and clients
+# without an endpoint, are not cached.
+_TOKEN_2022_BY_MINT = TtlCache(ttl_seconds=86400.0, maxsize=4096)
+
+
+def detect_token_program_for_mint(rpc, mint) -> "Pubkey":
+    """
+    Detect which token program owns a mint (Tokenkeg or Token-2022)
+
+    Shared by the protocol instruction builders, which need the mint's own
+    token program for ATAs and transfer accounts.
+
+    Args:
+        rpc: RPC client
+        mint: Mint address (string or Pubkey)
+
+    Returns:
+        Token program ID (Token-2022, or Tokenkeg by default)
+
+    Note:
+        Results are cached per RPC endpoint and mint (failed lookups are
+        retried; clients with no endpoint attribute are never cached).
+    """
+    mint_str = str(mint)
+    endpoint = getattr(rpc, "endpoint", None)
+    key = (endpoint, mint_str)
+    is_token_2022 = _TOKEN_2022_BY_MINT.get(key) if endpoint is not None else MISSING
+    if is_token_2022 is MISSING:
+        is_token_2022 = False
+        # WSOL always uses Tokenkeg
+        if mint_str != _WRAPPED_SOL_MINT:
+            try:
+                account_info = rpc.get_account_info(mint_str, encoding="base64")
+                if account_info:
+                    is_token_2022 = account_info.get("owner") == _TOKEN_2022_PROGRAM_ID
+                    if endpoint is not None:
+                        _TOKEN_2022_BY_MINT.set(key, is_token_2022)
+            except Exception:
+                pass
+
+    if is_token_2022:
+        return _TOKEN_2022_PROGRAM_PUBKEY
+    return _TOKEN_PROGRAM_PUBKEY
 
 
 class ProtocolAdapter(ABC):
@@ -36,6 +100,9 @@ class ProtocolAdapter(ABC):
     # Program ID
     program_id: str = ""
 
+    # Lifetime of cached get_token_info() results (mint decimals never change)
+    token_info_cache_ttl: float = 3600.0
+
     def __init__(self, rpc: RpcClient):
         """
         Initialize adapter with RPC client
@@ -44,6 +111,7 @@ class ProtocolAdapter(ABC):
             rpc: RPC client for blockchain queries
         """
         self._rpc = rpc
+        self._token_cache = TtlCache(ttl_seconds=self.token_info_cache_ttl, maxsize=1024)
 
     @property
     def rpc(self) -> RpcClient:
@@ -113,6 +181,32 @@ class ProtocolAdapter(ABC):
         """
         ...
 
+    def get_positions_batch(
+        self,
+        owners: List[str],
+        pools: Optional[List[str]] = None,
+    ) -> List[Position]:
+        """
+        Get positions for several owners (optionally restricted to pools)
+
+        Default implementation calls get_positions() per owner; adapters
+        that can load many position accounts in one RPC should override it.
+
+        Args:
+            owners: Owner wallet addresses
+            pools: Optional pool address filter
+
+        Returns:
+            List of positions
+        """
+        positions: List[Position] = []
+        pool_filter = pools[0] if pools and len(pools) == 1 else None
+        for owner in owners:
+            for position in self.get_positions(owner, pool_filter):
+                if not pools or position.pool.address in pools:
+                    positions.append(position)
+        return positions
+
     @abstractmethod
     def get_position(self, position_id: str) -> Position:
         """
@@ -144,8 +238,42 @@ class ProtocolAdapter(ABC):
             pool = self.get_pool(position.pool.address)
         return position.check_in_range(pool.price)
 
+    def is_in_range_batch(self, positions: List[Position]) -> List[bool]:
+        """
+        Check several positions against freshly fetched pools
+
+        Each distinct pool is fetched once. Pool accounts are first loaded
+        into the RPC client's account cache with one getMultipleAccounts
+        call, so get_pool() implementations that read the pool through
+        get_account_info(address, encoding="base64") hit the cache.
+
+        Args:
+            positions: Positions to check
+
+        Returns:
+            In-range flags in the order of positions
+        """
+        addresses = list(dict.fromkeys(p.pool.address for p in positions))
+        if not addresses:
+            return []
+
+        self._rpc.prefetch_accounts(addresses)
+        pools = {address: self.get_pool(address) for address in addresses}
+        return [p.check_in_range(pools[p.pool.address].price) for p in positions]
+
     # ========== Instruction Building ==========
 
+    def prefetch_for_open(self, pool: Pool) -> None:
+        """
+        Warm RPC caches for the accounts build_open_position() will read
+
+        Called concurrently with amount calculation when opening a position.
+        Default implementation does nothing.
+
+        Args:
+            pool: Target pool
+        """
+
     @abstractmethod
     def build_open_position(
         self,
@@ -344,20 +472,29 @@ class ProtocolAdapter(ABC):
 
         Returns:
             Token info or None
+
+        Results are cached per adapter for token_info_cache_ttl seconds.
         """
+        cached = self._token_cache.get(mint)
+        if cached is not MISSING:
+            return cached
+
         # Default implementation fetches from RPC
         account = self._rpc.get_account_info(mint, encoding="jsonParsed")
         if not account:
             return None
 
         data = account.get("data", {})
-        if isinstance(data, dict) and data.get("program") == "spl-token":
+        if isinstance(data, dict) and data.get("program") in ("spl-token", "spl-token-2022"):
             parsed = data.get("parsed", {}).get("info", {})
-            return Token(
+            token = Token(
                 mint=mint,
                 symbol="",
                 decimals=parsed.get("decimals", 0),
             )
+            # Only found mints are cached; a missing mint may be created later
+            self._token_cache.set(mint, token)
+            return token
         return None
 
     def estimate_fees(
@@ -4,7 +4,11 @@ Jupiter API Client
 REST API client for Jupiter swap aggregator.
 """
 
+import asyncio
+import json
 import logging
+import threading
+import time
 from decimal import Decimal
 from typing import Optional, Dict, Any, List
 
@@ -13,27 +17,52 @@ try:
 except ImportError:
     httpx = None
 
+# orjson decodes the nested quote/route payloads several times faster
+try:
+    from orjson import loads as _loads
+except ImportError:
+    _loads = json.loads
+
 from ...types import QuoteResult
 from ...config import config as global_config
 from ...errors import RpcError
+from ...infra.http import new_http_transport, new_async_http_transport
+from ...infra.retry import jittered_backoff
 
 logger = logging.getLogger(__name__)
 
+# Quote and swap calls usually come in quick succession; keep connections
+# alive between them so the second call skips the TLS handshake.
+_KEEPALIVE_EXPIRY = 30.0
+
+# Backoff between retries of rate-limited (429) or failed (5xx) requests
+_RETRY_BASE_DELAY = 0.1
+_RETRY_MAX_DELAY = 1.5
+
 
 class JupiterAPI:
     """
     Jupiter REST API client
 
     Provides:
-    - Swap quotes
+    - Swap quotes (single, or several concurrently via aget_quotes)
     - Swap transaction building
 
     Usage:
         api = JupiterAPI()
         quote = api.get_quote("SOL_MINT", "USDC_MINT", 1000000000)
         tx_bytes = api.get_swap_transaction(quote, user_pubkey)
+
+        # Several quotes overlapping on the wire
+        quotes = asyncio.run(api.aget_quotes([
+            {"input_mint": "SOL_MINT", "output_mint": "USDC_MINT", "amount": 10**9},
+            {"input_mint": "SOL_MINT", "output_mint": "USDT_MINT", "amount": 10**9},
+        ]))
     """
 
+    # Concurrent quote requests per aget_quotes() call (avoids flooding the API)
+    MAX_CONCURRENT_QUOTES = 8
+
     def __init__(
         self,
         timeout: float = None,
@@ -62,13 +91,125 @@ class JupiterAPI:
         self._swap_url = swap_url if swap_url is not None else global_config.jupiter.swap_url
         self._token_list_url = token_list_url if token_list_url is not None else global_config.jupiter.token_list_url
         self._client: Optional[httpx.Client] = None
+        self._async_client: Optional[httpx.AsyncClient] = None
+        self._async_client_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._lock = threading.Lock()  # Protects _async_client
 
     def _get_client(self) -> httpx.Client:
-        """Get or create HTTP client"""
+        """
+        Get or create HTTP client
+
+        Uses HTTP/2 when h2 is installed and a keep-alive pool large enough
+        for concurrent quotes. httpx already advertises every response
+        encoding it can decode (gzip/deflate, plus br/zstd when those
+        packages are installed), so no Accept-Encoding override is needed.
+        """
         if self._client is None:
-            self._client = httpx.Client(timeout=self._timeout)
+            transport = new_http_transport(
+                max_keepalive_connections=32,
+                max_connections=64,
+                keepalive_expiry=_KEEPALIVE_EXPIRY,
+            )
+            self._client = httpx.Client(timeout=self._timeout, transport=transport)
         return self._client
 
+    def _get_async_client(self) -> httpx.AsyncClient:
+        """
+        Get or create the async HTTP client for the running event loop
+
+        A client is bound to the loop it was first used on, so a new one is
+        created if called from a different loop (e.g. successive asyncio.run()
+        calls).
+        """
+        loop = asyncio.get_running_loop()
+        if self._async_client is None or self._async_client_loop is not loop:
+            with self._lock:
+                if self._async_client is None or self._async_client_loop is not loop:
+                    transport = new_async_http_transport(
+                        max_keepalive_connections=32,
+                        max_connections=64,
+                        keepalive_expiry=_KEEPALIVE_EXPIRY,
+                    )
+                    self._async_client = httpx.AsyncClient(timeout=self._timeout, transport=transport)
+                    self._async_client_loop = loop
+        return self._async_client
+
+    @staticmethod
+    def _retry_delay(error: "httpx.HTTPStatusError", attempt: int) -> Optional[float]:
+        """
+        Delay before retrying a failed request
+
+        Returns:
+            Seconds to wait (Retry-After if given, else jittered backoff;
+            never more than _RETRY_MAX_DELAY), or None if the status is not
+            worth retrying (4xx other than 429)
+        """
+        status = error.response.status_code
+        if status != 429 and status < 500:
+            return None
+        delay = jittered_backoff(attempt, _RETRY_BASE_DELAY, cap=_RETRY_MAX_DELAY)
+        try:
+            retry_after = float(error.response.headers.get("Retry-After", 0))
+        except (TypeError, ValueError):
+            # HTTP-date form (or malformed header) - fall back to backoff
+            retry_after = 0.0
+        # A long Retry-After must not stall the caller; give up sooner instead
+        return min(max(retry_after, delay), _RETRY_MAX_DELAY)
+
+    @staticmethod
+    def _quote_params(
+        input_mint: str,
+        output_mint: str,
+        amount: int,
+        slippage_bps: int,
+        swap_mode: str,
+        only_direct_routes: bool,
+        as_legacy_transaction: bool,
+    ) -> Dict[str, Any]:
+        """Query parameters for the quote endpoint"""
+        return {
+            "inputMint": input_mint,
+            "outputMint": output_mint,
+            "amount": str(amount),
+            "slippageBps": slippage_bps,
+            "swapMode": swap_mode,
+            "onlyDirectRoutes": str(only_direct_routes).lower(),
+            "asLegacyTransaction": str(as_legacy_transaction).lower(),
+        }
+
+    @staticmethod
+    def _parse_quote(
+        data: Dict[str, Any],
+        input_mint: str,
+        output_mint: str,
+        amount: int,
+        slippage_bps: int,
+    ) -> QuoteResult:
+        """Build QuoteResult from a quote endpoint response"""
+        in_amount = int(data.get("inAmount", amount))
+        out_amount = int(data.get("outAmount", 0))
+        price_impact = Decimal(str(data.get("priceImpactPct", 0)))
+
+        # Get route info
+        route_plan = data.get("routePlan", [])
+        route = [step.get("swapInfo", {}).get("label", "") for step in route_plan]
+
+        # Calculate min output with slippage
+        slippage_factor = Decimal(1) - Decimal(slippage_bps) / Decimal(10000)
+        min_out = int(Decimal(out_amount) * slippage_factor)
+
+        return QuoteResult(
+            from_token=input_mint,
+            to_token=output_mint,
+            from_amount=in_amount,
+            to_amount=out_amount,
+            price_impact=price_impact,
+            route=route,
+            min_to_amount=min_out,
+            slippage_bps=slippage_bps,
+            raw_response=data,  # Store full response for swap transaction
+        )
+
     def get_quote(
         self,
         input_mint: str,
@@ -96,15 +237,10 @@ class JupiterAPI:
         """
         client = self._get_client()
 
-        params = {
-            "inputMint": input_mint,
-            "outputMint": output_mint,
-            "amount": str(amount),
-            "slippageBps": slippage_bps,
-            "swapMode": swap_mode,
-            "onlyDirectRoutes": str(only_direct_routes).lower(),
-            "asLegacyTransaction": str(as_legacy_transaction).lower(),
-        }
+        params = self._quote_params(
+            input_mint, output_mint, amount, slippage_bps,
+            swap_mode, only_direct_routes, as_legacy_transaction,
+        )
 
         last_error: Optional[Exception] = None
 
@@ -112,44 +248,90 @@ class JupiterAPI:
             try:
                 response = client.get(self._quote_url, params=params)
                 response.raise_for_status()
-                data = response.json()
-
-                # Parse response
-                in_amount = int(data.get("inAmount", amount))
-                out_amount = int(data.get("outAmount", 0))
-                price_impact = Decimal(str(data.get("priceImpactPct", 0)))
-
-                # Get route info
-                route_plan = data.get("routePlan", [])
-                route = [step.get("swapInfo", {}).get("label", "") for step in route_plan]
-
-                # Calculate min output with slippage
-                slippage_factor = Decimal(1) - Decimal(slippage_bps) / Decimal(10000)
-                min_out = int(Decimal(out_amount) * slippage_factor)
-
-                return QuoteResult(
-                    from_token=input_mint,
-                    to_token=output_mint,
-                    from_amount=in_amount,
-                    to_amount=out_amount,
-                    price_impact=price_impact,
-                    route=route,
-                    min_to_amount=min_out,
-                    slippage_bps=slippage_bps,
-                    raw_response=data,  # Store full response for swap transaction
-                )
+                return self._parse_quote(_loads(response.content), input_mint, output_mint, amount, slippage_bps)
 
             except httpx.HTTPStatusError as e:
                 logger.warning(f"Jupiter quote failed (attempt {attempt + 1}): {e}")
                 last_error = e
-                if attempt == self._max_retries - 1:
+                delay = self._retry_delay(e, attempt)
+                if delay is None or attempt == self._max_retries - 1:
                     raise
+                time.sleep(delay)
             except Exception as e:
                 logger.error(f"Jupiter quote error: {e}")
                 raise
 
         raise RuntimeError(f"Failed to get Jupiter quote after {self._max_retries} attempts") from last_error
 
+    async def aget_quote(
+        self,
+        input_mint: str,
+        output_mint: str,
+        amount: int,
+        slippage_bps: int = 50,
+        swap_mode: str = "ExactIn",
+        only_direct_routes: bool = False,
+        as_legacy_transaction: bool = False,
+    ) -> QuoteResult:
+        """
+        Async variant of get_quote() (same arguments, retries and result)
+
+        Returns:
+            QuoteResult with swap details
+        """
+        client = self._get_async_client()
+
+        params = self._quote_params(
+            input_mint, output_mint, amount, slippage_bps,
+            swap_mode, only_direct_routes, as_legacy_transaction,
+        )
+
+        last_error: Optional[Exception] = None
+
+        for attempt in range(self._max_retries):
+            try:
+                response = await client.get(self._quote_url, params=params)
+                response.raise_for_status()
+                return self._parse_quote(_loads(response.content), input_mint, output_mint, amount, slippage_bps)
+
+            except httpx.HTTPStatusError as e:
+                logger.warning(f"Jupiter quote failed (attempt {attempt + 1}): {e}")
+                last_error = e
+                delay = self._retry_delay(e, attempt)
+                if delay is None or attempt == self._max_retries - 1:
+                    raise
+                await asyncio.sleep(delay)
+            except Exception as e:
+                logger.error(f"Jupiter quote error: {e}")
+                raise
+
+        raise RuntimeError(f"Failed to get Jupiter quote after {self._max_retries} attempts") from last_error
+
+    async def aget_quotes(self, requests: List[Dict[str, Any]]) -> List[QuoteResult]:
+        """
+        Get several quotes concurrently
+
+        At most MAX_CONCURRENT_QUOTES requests are in flight at once. The
+        first failure is raised once all requests have finished.
+
+        Args:
+            requests: Keyword arguments for aget_quote(), one dict per quote
+
+        Returns:
+            QuoteResults in the order of requests
+        """
+        semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_QUOTES)
+
+        async def one(request: Dict[str, Any]) -> QuoteResult:
+            async with semaphore:
+                return await self.aget_quote(**request)
+
+        results = await asyncio.gather(*(one(r) for r in requests), return_exceptions=True)
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+        return results
+
     def get_swap_transaction(
         self,
         quote: QuoteResult,
@@ -190,7 +372,7 @@ class JupiterAPI:
             }
             quote_response = client.get(self._quote_url, params=quote_params)
             quote_response.raise_for_status()
-            quote_data = quote_response.json()
+            quote_data = _loads(quote_response.content)
 
         # Build swap request
         swap_request = {
@@ -210,7 +392,7 @@ class JupiterAPI:
             try:
                 response = client.post(self._swap_url, json=swap_request)
                 response.raise_for_status()
-                data = response.json()
+                data = _loads(response.content)
 
                 swap_transaction = data.get("swapTransaction")
                 if not swap_transaction:
@@ -221,8 +403,10 @@ class JupiterAPI:
             except httpx.HTTPStatusError as e:
                 logger.warning(f"Jupiter swap tx failed (attempt {attempt + 1}): {e}")
                 last_error = e
-                if attempt == self._max_retries - 1:
+                delay = self._retry_delay(e, attempt)
+                if delay is None or attempt == self._max_retries - 1:
                     raise
+                time.sleep(delay)
             except Exception as e:
                 logger.error(f"Jupiter swap tx error: {e}")
                 raise
@@ -236,7 +420,7 @@ class JupiterAPI:
         try:
             response = client.get(self._token_list_url)
             response.raise_for_status()
-            return response.json()
+            return _loads(response.content)
         except Exception as e:
             logger.error(f"Failed to get token list: {e}")
             return []
@@ -246,6 +430,16 @@ class JupiterAPI:
         if self._client:
             self._client.close()
             self._client = None
+        # The async client can only be closed from its event loop (see aclose);
+        # dropping the reference lets its connections be garbage collected.
+        self._async_client = None
+        self._async_client_loop = None
+
+    async def aclose(self):
+        """Close both HTTP clients (call from the event loop that used aget_quotes)"""
+        if self._async_client is not None:
+            await self._async_client.aclose()
+        self.close()
 
     def __enter__(self):
         return self
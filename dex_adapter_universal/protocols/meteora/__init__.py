@@ -8,6 +8,8 @@ from .adapter import MeteoraAdapter
 from .math import (
     bin_id_to_price,
     price_to_bin_id,
+    bin_ids_to_prices,
+    bin_id_in_range,
     get_active_bin,
     one_bin_range,
 )
@@ -20,6 +22,8 @@ __all__ = [
     "MeteoraAdapter",
     "bin_id_to_price",
     "price_to_bin_id",
+    "bin_ids_to_prices",
+    "bin_id_in_range",
     "get_active_bin",
     "one_bin_range",
     "DLMM_PROGRAM_ID",
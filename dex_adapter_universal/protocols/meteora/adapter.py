@@ -16,6 +16,11 @@ if TYPE_CHECKING:
     from solders.instruction import Instruction
     from solders.keypair import Keypair
 
+try:
+    from solders.pubkey import Pubkey
+except ImportError:
+    Pubkey = None
+
 from ..base import ProtocolAdapter
 from ...types import Pool, Position, PriceRange, RangeMode, Token
 from ...types.common import STABLECOINS
@@ -25,16 +30,19 @@ from ...errors import PoolUnavailable, PositionNotFound, ConfigurationError, Ope
 
 from .constants import (
     DLMM_PROGRAM_ID,
+    DLMM_PROGRAM_ID_BYTES,
     StrategyType,
     ACCOUNT_DISCRIMINATORS,
-    POSITION_LB_PAIR_OFFSET,
     POSITION_OWNER_OFFSET,
     POSITION_LIQUIDITY_SHARES_OFFSET,
     POSITION_LOWER_BIN_ID_OFFSET,
-    POSITION_UPPER_BIN_ID_OFFSET,
+    POSITION_HEADER,
+    POSITION_BIN_RANGE,
+    POSITION_LIQUIDITY_SHARE,
     MAX_POSITION_WIDTH,
 )
 from .math import (
+    bin_id_in_range,
     bin_id_to_price,
     price_to_bin_id,
     one_bin_range,
@@ -76,11 +84,11 @@ class MeteoraAdapter(ProtocolAdapter):
         super().__init__(rpc)
 
     def _get_token_decimals(self, mint: str) -> int:
-        """Fetch token decimals from mint account"""
+        """Fetch token decimals from mint account (cached via get_token_info)"""
         try:
-            account = self._rpc.get_account_info(mint, encoding="jsonParsed")
-            if account and "parsed" in account.get("data", {}):
-                return account["data"]["parsed"]["info"]["decimals"]
+            token = self.get_token_info(mint)
+            if token is not None:
+                return token.decimals
         except Exception:
             pass
 
@@ -446,18 +454,16 @@ class MeteoraAdapter(ProtocolAdapter):
             return None
 
         try:
-            # Parse lb_pair (pool address)
-            lb_pair = self._pubkey_from_bytes(data[POSITION_LB_PAIR_OFFSET:POSITION_LB_PAIR_OFFSET + 32])
-
-            # Parse owner
-            owner = self._pubkey_from_bytes(data[POSITION_OWNER_OFFSET:POSITION_OWNER_OFFSET + 32])
+            # Parse lb_pair (pool address) and owner
+            lb_pair_bytes, owner_bytes = POSITION_HEADER.unpack_from(data)
+            lb_pair = self._pubkey_from_bytes(lb_pair_bytes)
+            owner = self._pubkey_from_bytes(owner_bytes)
 
             # Parse bin IDs
-            lower_bin_id = struct.unpack_from("<i", data, POSITION_LOWER_BIN_ID_OFFSET)[0]
-            upper_bin_id = struct.unpack_from("<i", data, POSITION_UPPER_BIN_ID_OFFSET)[0]
+            lower_bin_id, upper_bin_id = POSITION_BIN_RANGE.unpack_from(data, POSITION_LOWER_BIN_ID_OFFSET)
 
             # Sanity check bin IDs
-            if not (-500000 < lower_bin_id < 500000 and -500000 < upper_bin_id < 500000):
+            if not (bin_id_in_range(lower_bin_id) and bin_id_in_range(upper_bin_id)):
                 logger.warning(f"Position {address} has invalid bin IDs: {lower_bin_id}, {upper_bin_id}")
                 return None
 
@@ -478,13 +484,17 @@ class MeteoraAdapter(ProtocolAdapter):
                     f"{MAX_POSITION_WIDTH}. Liquidity and bin_ids may be incomplete."
                 )
 
-            for i in range(min(position_width, MAX_POSITION_WIDTH)):
-                share_offset = POSITION_LIQUIDITY_SHARES_OFFSET + (i * 16)
-                if share_offset + 16 > len(data):
-                    break
-                # u128 little-endian
-                low = struct.unpack_from("<Q", data, share_offset)[0]
-                high = struct.unpack_from("<Q", data, share_offset + 8)[0]
+            # u128 little-endian shares, limited to what the account holds
+            share_size = POSITION_LIQUIDITY_SHARE.size
+            share_count = min(
+                position_width,
+                MAX_POSITION_WIDTH,
+                (len(data) - POSITION_LIQUIDITY_SHARES_OFFSET) // share_size,
+            )
+            shares_end = POSITION_LIQUIDITY_SHARES_OFFSET + share_count * share_size
+            for low, high in POSITION_LIQUIDITY_SHARE.iter_unpack(
+                memoryview(data)[POSITION_LIQUIDITY_SHARES_OFFSET:shares_end]
+            ):
                 share = low + (high << 64)
                 liquidity_shares.append(share)
                 total_liquidity += share
@@ -557,7 +567,7 @@ class MeteoraAdapter(ProtocolAdapter):
         from solders.pubkey import Pubkey
         import struct as struct_module
 
-        program_id = Pubkey.from_string(DLMM_PROGRAM_ID)
+        program_id = Pubkey(DLMM_PROGRAM_ID_BYTES)
         lb_pair_pubkey = Pubkey.from_string(pool_address)
 
         uninitialized = []
@@ -608,7 +618,7 @@ class MeteoraAdapter(ProtocolAdapter):
         """
         from solders.pubkey import Pubkey
 
-        program_id = Pubkey.from_string(DLMM_PROGRAM_ID)
+        program_id = Pubkey(DLMM_PROGRAM_ID_BYTES)
         lb_pair_pubkey = Pubkey.from_string(pool_address)
 
         # Derive bitmap extension PDA
@@ -1048,5 +1058,5 @@ class MeteoraAdapter(ProtocolAdapter):
 
     def _pubkey_from_bytes(self, data: bytes) -> str:
         """Convert 32 bytes to base58"""
-        import base58
-        return base58.b58encode(data).decode("ascii")
+        # solders encodes in native code (~20x faster than the base58 package)
+        return str(Pubkey.from_bytes(data))
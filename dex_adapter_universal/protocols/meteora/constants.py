@@ -2,6 +2,10 @@
 Meteora DLMM Constants
 """
 
+import struct
+from enum import IntEnum
+from types import MappingProxyType
+
 # Meteora DLMM Program ID (mainnet)
 DLMM_PROGRAM_ID = "LBUZKhRxPF3XUpBCjp4YzTKgLccjZhTSDM9YuVaPwxo"
 
@@ -18,9 +22,38 @@ SYSTEM_PROGRAM_ID = "11111111111111111111111111111111"
 # Rent Sysvar
 RENT_SYSVAR_ID = "SysvarRent111111111111111111111111111111111"
 
+
+_B58_ALPHABET = "123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz"
+
+
+def _b58decode_pubkey(address: str) -> bytes:
+    """Decode a base58 address to its 32 raw bytes (import-time helper)"""
+    n = 0
+    for char in address:
+        n = n * 58 + _B58_ALPHABET.index(char)
+    raw = n.to_bytes(32, "big")
+    assert len(raw) == 32
+    return raw
+
+
+# Raw 32-byte forms, decoded once so instruction builders can construct
+# Pubkey(..._BYTES) without base58-decoding the string on every call
+DLMM_PROGRAM_ID_BYTES = _b58decode_pubkey(DLMM_PROGRAM_ID)
+TOKEN_PROGRAM_ID_BYTES = _b58decode_pubkey(TOKEN_PROGRAM_ID)
+TOKEN_2022_PROGRAM_ID_BYTES = _b58decode_pubkey(TOKEN_2022_PROGRAM_ID)
+ASSOCIATED_TOKEN_PROGRAM_ID_BYTES = _b58decode_pubkey(ASSOCIATED_TOKEN_PROGRAM_ID)
+SYSTEM_PROGRAM_ID_BYTES = _b58decode_pubkey(SYSTEM_PROGRAM_ID)
+RENT_SYSVAR_ID_BYTES = _b58decode_pubkey(RENT_SYSVAR_ID)
+
 # Event authority
 EVENT_AUTHORITY_SEED = b"__event_authority"
 
+# Event authority PDA: find_program_address([EVENT_AUTHORITY_SEED], DLMM_PROGRAM_ID).
+# Fixed for the program, so it is precomputed rather than derived per instruction.
+EVENT_AUTHORITY_ID = "D1ZN9Wj1fRSUQfCjhvnu1hqDMT7hzjzBBpi12nVniYD6"
+EVENT_AUTHORITY_BUMP = 255
+EVENT_AUTHORITY_ID_BYTES = _b58decode_pubkey(EVENT_AUTHORITY_ID)
+
 # Bin array constants
 BIN_ARRAY_BITMAP_SIZE = 512
 MAX_BIN_PER_ARRAY = 70
@@ -30,7 +63,7 @@ MIN_BIN_ID = -443636
 MAX_BIN_ID = 443636
 
 # Common bin steps (basis points)
-BIN_STEPS = {
+BIN_STEPS = MappingProxyType({
     1: "0.01%",
     5: "0.05%",
     10: "0.10%",
@@ -39,10 +72,10 @@ BIN_STEPS = {
     25: "0.25%",
     50: "0.50%",
     100: "1.00%",
-}
+})
 
-# Strategy types for add liquidity
-class StrategyType:
+# Strategy types for add liquidity (u8 on the wire; members are ints)
+class StrategyType(IntEnum):
     SPOT_ONE_SIDE = 0
     CURVE_ONE_SIDE = 1
     BID_ASK_ONE_SIDE = 2
@@ -97,3 +130,11 @@ POSITION_LIQUIDITY_SHARES_OFFSET = 72
 MAX_POSITION_WIDTH = 70  # Still limited to 70 bins
 POSITION_LOWER_BIN_ID_OFFSET = 7912
 POSITION_UPPER_BIN_ID_OFFSET = 7916
+
+# Precompiled position layouts (one C-level unpack per field group)
+# - POSITION_HEADER at offset 0: (lb_pair, owner) raw pubkey bytes
+# - POSITION_BIN_RANGE at POSITION_LOWER_BIN_ID_OFFSET: (lower_bin_id, upper_bin_id)
+# - POSITION_LIQUIDITY_SHARE: one u128 share as (low, high) u64 words
+POSITION_HEADER = struct.Struct("<8x32s32s")
+POSITION_BIN_RANGE = struct.Struct("<ii")
+POSITION_LIQUIDITY_SHARE = struct.Struct("<QQ")
@@ -12,17 +12,17 @@ if TYPE_CHECKING:
     from solders.keypair import Keypair
 
 from .constants import (
-    DLMM_PROGRAM_ID,
-    TOKEN_PROGRAM_ID,
-    TOKEN_2022_PROGRAM_ID,
-    ASSOCIATED_TOKEN_PROGRAM_ID,
-    SYSTEM_PROGRAM_ID,
-    RENT_SYSVAR_ID,
-    EVENT_AUTHORITY_SEED,
+    DLMM_PROGRAM_ID_BYTES,
+    TOKEN_PROGRAM_ID_BYTES,
+    ASSOCIATED_TOKEN_PROGRAM_ID_BYTES,
+    SYSTEM_PROGRAM_ID_BYTES,
+    RENT_SYSVAR_ID_BYTES,
+    EVENT_AUTHORITY_ID_BYTES,
     DISCRIMINATORS,
     StrategyType,
 )
 from .math import get_bin_array_index
+from ..base import detect_token_program_for_mint
 
 
 # Wrapped SOL mint - use centralized registry
@@ -30,38 +30,6 @@ from dex_adapter_universal.types.solana_tokens import SOLANA_TOKEN_MINTS
 WRAPPED_SOL_MINT = SOLANA_TOKEN_MINTS["SOL"]
 
 
-def detect_token_program_for_mint(rpc, mint) -> "Pubkey":
-    """
-    Detect which token program owns a mint (Tokenkeg or Token-2022).
-
-    Args:
-        rpc: RPC client
-        mint: Mint address (string or Pubkey)
-
-    Returns:
-        Token program ID (either Tokenkeg or Token-2022)
-    """
-    from solders.pubkey import Pubkey
-
-    mint_str = str(mint)
-
-    # WSOL always uses Tokenkeg
-    if mint_str == WRAPPED_SOL_MINT:
-        return Pubkey.from_string(TOKEN_PROGRAM_ID)
-
-    try:
-        account_info = rpc.get_account_info(mint_str, encoding="base64")
-        if account_info:
-            owner = account_info.get("owner")
-            if owner == TOKEN_2022_PROGRAM_ID:
-                return Pubkey.from_string(TOKEN_2022_PROGRAM_ID)
-    except Exception:
-        pass
-
-    # Default to Tokenkeg
-    return Pubkey.from_string(TOKEN_PROGRAM_ID)
-
-
 def get_associated_token_address_with_program(
     owner: "Pubkey",
     mint: "Pubkey",
@@ -80,7 +48,7 @@ def get_associated_token_address_with_program(
     """
     from solders.pubkey import Pubkey
 
-    ata_program = Pubkey.from_string(ASSOCIATED_TOKEN_PROGRAM_ID)
+    ata_program = Pubkey(ASSOCIATED_TOKEN_PROGRAM_ID_BYTES)
 
     seeds = [
         bytes(owner),
@@ -115,7 +83,7 @@ def build_initialize_position_instructions(
     from solders.keypair import Keypair
 
     instructions = []
-    program_id = Pubkey.from_string(DLMM_PROGRAM_ID)
+    program_id = Pubkey(DLMM_PROGRAM_ID_BYTES)
     owner_pubkey = Pubkey.from_string(owner)
     lb_pair_pubkey = Pubkey.from_string(lb_pair)
 
@@ -123,11 +91,8 @@ def build_initialize_position_instructions(
     position_kp = Keypair()
     position_pubkey = position_kp.pubkey()
 
-    # Derive event authority
-    event_authority, _ = Pubkey.find_program_address(
-        [EVENT_AUTHORITY_SEED],
-        program_id,
-    )
+    # Event authority PDA (fixed for the program, see constants)
+    event_authority = Pubkey(EVENT_AUTHORITY_ID_BYTES)
 
     # Build instruction data
     data = bytearray(DISCRIMINATORS["initialize_position"])
@@ -139,8 +104,8 @@ def build_initialize_position_instructions(
         AccountMeta(position_pubkey, is_signer=True, is_writable=True),  # position
         AccountMeta(lb_pair_pubkey, is_signer=False, is_writable=False),  # lb_pair
         AccountMeta(owner_pubkey, is_signer=False, is_writable=False),  # owner
-        AccountMeta(Pubkey.from_string(SYSTEM_PROGRAM_ID), is_signer=False, is_writable=False),
-        AccountMeta(Pubkey.from_string(RENT_SYSVAR_ID), is_signer=False, is_writable=False),
+        AccountMeta(Pubkey(SYSTEM_PROGRAM_ID_BYTES), is_signer=False, is_writable=False),
+        AccountMeta(Pubkey(RENT_SYSVAR_ID_BYTES), is_signer=False, is_writable=False),
         AccountMeta(event_authority, is_signer=False, is_writable=False),
         AccountMeta(program_id, is_signer=False, is_writable=False),
     ]
@@ -189,7 +154,7 @@ def build_add_liquidity_by_strategy_instructions(
     from solders.instruction import Instruction, AccountMeta
 
     instructions = []
-    program_id = Pubkey.from_string(DLMM_PROGRAM_ID)
+    program_id = Pubkey(DLMM_PROGRAM_ID_BYTES)
     owner_pubkey = Pubkey.from_string(owner)
     lb_pair_pubkey = Pubkey.from_string(lb_pair)
     position_pubkey = Pubkey.from_string(position)
@@ -205,8 +170,8 @@ def build_add_liquidity_by_strategy_instructions(
         token_program_x = detect_token_program_for_mint(rpc, mint_x)
         token_program_y = detect_token_program_for_mint(rpc, mint_y)
     else:
-        token_program_x = Pubkey.from_string(TOKEN_PROGRAM_ID)
-        token_program_y = Pubkey.from_string(TOKEN_PROGRAM_ID)
+        token_program_x = Pubkey(TOKEN_PROGRAM_ID_BYTES)
+        token_program_y = Pubkey(TOKEN_PROGRAM_ID_BYTES)
 
     user_token_x = _get_associated_token_address(owner_pubkey, mint_x, token_program_x)
     user_token_y = _get_associated_token_address(owner_pubkey, mint_y, token_program_y)
@@ -218,11 +183,8 @@ def build_add_liquidity_by_strategy_instructions(
     # Derive bitmap extension PDA (may or may not exist on-chain)
     bitmap_extension = _derive_bitmap_extension_address(lb_pair_pubkey)
 
-    # Derive event authority
-    event_authority, _ = Pubkey.find_program_address(
-        [EVENT_AUTHORITY_SEED],
-        program_id,
-    )
+    # Event authority PDA (fixed for the program, see constants)
+    event_authority = Pubkey(EVENT_AUTHORITY_ID_BYTES)
 
     # Create token accounts if needed
     instructions.append(_build_create_ata_idempotent_instruction(owner_pubkey, owner_pubkey, mint_x, token_program_x))
@@ -323,7 +285,7 @@ def build_remove_liquidity_instructions(
     from solders.pubkey import Pubkey
     from solders.instruction import Instruction, AccountMeta
 
-    program_id = Pubkey.from_string(DLMM_PROGRAM_ID)
+    program_id = Pubkey(DLMM_PROGRAM_ID_BYTES)
     owner_pubkey = Pubkey.from_string(owner)
     lb_pair_pubkey = Pubkey.from_string(lb_pair)
     position_pubkey = Pubkey.from_string(position)
@@ -338,8 +300,8 @@ def build_remove_liquidity_instructions(
         token_program_x = detect_token_program_for_mint(rpc, mint_x)
         token_program_y = detect_token_program_for_mint(rpc, mint_y)
     else:
-        token_program_x = Pubkey.from_string(TOKEN_PROGRAM_ID)
-        token_program_y = Pubkey.from_string(TOKEN_PROGRAM_ID)
+        token_program_x = Pubkey(TOKEN_PROGRAM_ID_BYTES)
+        token_program_y = Pubkey(TOKEN_PROGRAM_ID_BYTES)
 
     logger.info(f"remove_liquidity: mint_x={mint_x}, token_program_x={token_program_x}")
     logger.info(f"remove_liquidity: mint_y={mint_y}, token_program_y={token_program_y}")
@@ -371,11 +333,8 @@ def build_remove_liquidity_instructions(
     bitmap_extension = _derive_bitmap_extension_address(lb_pair_pubkey)
     logger.info(f"remove_liquidity: bitmap_extension={bitmap_extension}")
 
-    # Derive event authority
-    event_authority, _ = Pubkey.find_program_address(
-        [EVENT_AUTHORITY_SEED],
-        program_id,
-    )
+    # Event authority PDA (fixed for the program, see constants)
+    event_authority = Pubkey(EVENT_AUTHORITY_ID_BYTES)
 
     # Build instruction data using remove_liquidity_by_range
     # This is more efficient for contiguous bin ranges
@@ -437,7 +396,7 @@ def build_close_position_instructions(
     from solders.pubkey import Pubkey
     from solders.instruction import Instruction, AccountMeta
 
-    program_id = Pubkey.from_string(DLMM_PROGRAM_ID)
+    program_id = Pubkey(DLMM_PROGRAM_ID_BYTES)
     owner_pubkey = Pubkey.from_string(owner)
     lb_pair_pubkey = Pubkey.from_string(lb_pair)
     position_pubkey = Pubkey.from_string(position)
@@ -448,11 +407,8 @@ def build_close_position_instructions(
     bin_array_lower = _derive_bin_array_address(lb_pair_pubkey, lower_bin_id)
     bin_array_upper = _derive_bin_array_address(lb_pair_pubkey, upper_bin_id)
 
-    # Derive event authority
-    event_authority, _ = Pubkey.find_program_address(
-        [EVENT_AUTHORITY_SEED],
-        program_id,
-    )
+    # Event authority PDA (fixed for the program, see constants)
+    event_authority = Pubkey(EVENT_AUTHORITY_ID_BYTES)
 
     # Build instruction data
     data = bytearray(DISCRIMINATORS["close_position"])
@@ -503,7 +459,7 @@ def build_claim_fee_instructions(
     from solders.pubkey import Pubkey
     from solders.instruction import Instruction, AccountMeta
 
-    program_id = Pubkey.from_string(DLMM_PROGRAM_ID)
+    program_id = Pubkey(DLMM_PROGRAM_ID_BYTES)
     owner_pubkey = Pubkey.from_string(owner)
     lb_pair_pubkey = Pubkey.from_string(lb_pair)
     position_pubkey = Pubkey.from_string(position)
@@ -518,8 +474,8 @@ def build_claim_fee_instructions(
         token_program_x = detect_token_program_for_mint(rpc, mint_x)
         token_program_y = detect_token_program_for_mint(rpc, mint_y)
     else:
-        token_program_x = Pubkey.from_string(TOKEN_PROGRAM_ID)
-        token_program_y = Pubkey.from_string(TOKEN_PROGRAM_ID)
+        token_program_x = Pubkey(TOKEN_PROGRAM_ID_BYTES)
+        token_program_y = Pubkey(TOKEN_PROGRAM_ID_BYTES)
 
     # Derive ATAs with correct token programs for Token-2022 support
     user_token_x = _get_associated_token_address(owner_pubkey, mint_x, token_program_x)
@@ -531,11 +487,8 @@ def build_claim_fee_instructions(
     bin_array_lower = _derive_bin_array_address(lb_pair_pubkey, lower_bin_id)
     bin_array_upper = _derive_bin_array_address(lb_pair_pubkey, upper_bin_id)
 
-    # Derive event authority
-    event_authority, _ = Pubkey.find_program_address(
-        [EVENT_AUTHORITY_SEED],
-        program_id,
-    )
+    # Event authority PDA (fixed for the program, see constants)
+    event_authority = Pubkey(EVENT_AUTHORITY_ID_BYTES)
 
     # Build instructions list - start with ATA creation
     instructions = []
@@ -545,7 +498,7 @@ def build_claim_fee_instructions(
     instructions.append(_build_create_ata_idempotent_instruction(owner_pubkey, owner_pubkey, mint_y, token_program_y))
 
     # Determine if we need V2 instruction (when token programs differ)
-    use_v2 = str(token_program_x) != str(token_program_y)
+    use_v2 = token_program_x != token_program_y
 
     if use_v2:
         # Use claim_fee2 with separate token programs (15 accounts)
@@ -609,9 +562,9 @@ def _get_associated_token_address(
     """
     from solders.pubkey import Pubkey
 
-    ata_program = Pubkey.from_string(ASSOCIATED_TOKEN_PROGRAM_ID)
+    ata_program = Pubkey(ASSOCIATED_TOKEN_PROGRAM_ID_BYTES)
     if token_program is None:
-        token_program = Pubkey.from_string(TOKEN_PROGRAM_ID)
+        token_program = Pubkey(TOKEN_PROGRAM_ID_BYTES)
 
     seeds = [
         bytes(owner),
@@ -627,7 +580,7 @@ def _derive_bin_array_address(lb_pair: "Pubkey", bin_id: int) -> "Pubkey":
     """Derive bin array PDA"""
     from solders.pubkey import Pubkey
 
-    program_id = Pubkey.from_string(DLMM_PROGRAM_ID)
+    program_id = Pubkey(DLMM_PROGRAM_ID_BYTES)
     bin_array_index = get_bin_array_index(bin_id)
 
     seeds = [
@@ -649,7 +602,7 @@ def _derive_bitmap_extension_address(lb_pair: "Pubkey") -> "Pubkey":
     """
     from solders.pubkey import Pubkey
 
-    program_id = Pubkey.from_string(DLMM_PROGRAM_ID)
+    program_id = Pubkey(DLMM_PROGRAM_ID_BYTES)
 
     seeds = [
         b"bitmap",
@@ -680,10 +633,10 @@ def _build_create_ata_idempotent_instruction(
     from solders.pubkey import Pubkey
     from solders.instruction import Instruction, AccountMeta
 
-    ata_program = Pubkey.from_string(ASSOCIATED_TOKEN_PROGRAM_ID)
+    ata_program = Pubkey(ASSOCIATED_TOKEN_PROGRAM_ID_BYTES)
     if token_program is None:
-        token_program = Pubkey.from_string(TOKEN_PROGRAM_ID)
-    system_program = Pubkey.from_string(SYSTEM_PROGRAM_ID)
+        token_program = Pubkey(TOKEN_PROGRAM_ID_BYTES)
+    system_program = Pubkey(SYSTEM_PROGRAM_ID_BYTES)
 
     ata_address = _get_associated_token_address(owner, mint, token_program)
 
@@ -716,7 +669,7 @@ def _build_wrap_sol_instructions(owner: str, amount_lamports: int) -> List["Inst
     ))
 
     # Transfer SOL
-    system_program = Pubkey.from_string(SYSTEM_PROGRAM_ID)
+    system_program = Pubkey(SYSTEM_PROGRAM_ID_BYTES)
     transfer_accounts = [
         AccountMeta(owner_pubkey, is_signer=True, is_writable=True),
         AccountMeta(wsol_ata, is_signer=False, is_writable=True),
@@ -725,7 +678,7 @@ def _build_wrap_sol_instructions(owner: str, amount_lamports: int) -> List["Inst
     instructions.append(Instruction(system_program, transfer_data, transfer_accounts))
 
     # Sync native
-    token_program = Pubkey.from_string(TOKEN_PROGRAM_ID)
+    token_program = Pubkey(TOKEN_PROGRAM_ID_BYTES)
     sync_accounts = [AccountMeta(wsol_ata, is_signer=False, is_writable=True)]
     instructions.append(Instruction(token_program, bytes([17]), sync_accounts))
 
@@ -750,7 +703,7 @@ def build_unwrap_sol_instruction(owner: str) -> "Instruction":
 
     owner_pubkey = Pubkey.from_string(owner)
     wsol_mint = Pubkey.from_string(WRAPPED_SOL_MINT)
-    token_program = Pubkey.from_string(TOKEN_PROGRAM_ID)
+    token_program = Pubkey(TOKEN_PROGRAM_ID_BYTES)
 
     wsol_ata = _get_associated_token_address(owner_pubkey, wsol_mint)
 
@@ -786,7 +739,7 @@ def build_initialize_bitmap_extension_instructions(
     from solders.pubkey import Pubkey
     from solders.instruction import Instruction, AccountMeta
 
-    program_id = Pubkey.from_string(DLMM_PROGRAM_ID)
+    program_id = Pubkey(DLMM_PROGRAM_ID_BYTES)
     lb_pair_pubkey = Pubkey.from_string(lb_pair)
     funder_pubkey = Pubkey.from_string(funder)
 
@@ -806,8 +759,8 @@ def build_initialize_bitmap_extension_instructions(
         AccountMeta(lb_pair_pubkey, is_signer=False, is_writable=False),
         AccountMeta(bitmap_extension, is_signer=False, is_writable=True),
         AccountMeta(funder_pubkey, is_signer=True, is_writable=True),
-        AccountMeta(Pubkey.from_string(SYSTEM_PROGRAM_ID), is_signer=False, is_writable=False),
-        AccountMeta(Pubkey.from_string(RENT_SYSVAR_ID), is_signer=False, is_writable=False),
+        AccountMeta(Pubkey(SYSTEM_PROGRAM_ID_BYTES), is_signer=False, is_writable=False),
+        AccountMeta(Pubkey(RENT_SYSVAR_ID_BYTES), is_signer=False, is_writable=False),
     ]
 
     instruction = Instruction(program_id, bytes(data), accounts)
@@ -833,7 +786,7 @@ def build_initialize_bin_array_instructions(
     from solders.pubkey import Pubkey
     from solders.instruction import Instruction, AccountMeta
 
-    program_id = Pubkey.from_string(DLMM_PROGRAM_ID)
+    program_id = Pubkey(DLMM_PROGRAM_ID_BYTES)
     lb_pair_pubkey = Pubkey.from_string(lb_pair)
     funder_pubkey = Pubkey.from_string(funder)
 
@@ -855,7 +808,7 @@ def build_initialize_bin_array_instructions(
         AccountMeta(lb_pair_pubkey, is_signer=False, is_writable=False),
         AccountMeta(bin_array, is_signer=False, is_writable=True),
         AccountMeta(funder_pubkey, is_signer=True, is_writable=True),
-        AccountMeta(Pubkey.from_string(SYSTEM_PROGRAM_ID), is_signer=False, is_writable=False),
+        AccountMeta(Pubkey(SYSTEM_PROGRAM_ID_BYTES), is_signer=False, is_writable=False),
     ]
 
     instruction = Instruction(program_id, bytes(data), accounts)
@@ -4,13 +4,17 @@ Meteora DLMM Math Utilities
 Provides bin/price conversion and liquidity calculations.
 """
 
+import functools
 import math
 from decimal import Decimal
-from typing import Tuple
+from typing import List, Tuple
 
 from .constants import MIN_BIN_ID, MAX_BIN_ID, MAX_BIN_PER_ARRAY
 
 
+# Conversions are pure functions of their (hashable) arguments and are called
+# repeatedly for the same bins while scanning ranges and positions.
+@functools.lru_cache(maxsize=8192)
 def bin_id_to_price(
     bin_id: int,
     bin_step: int,
@@ -55,6 +59,7 @@ def bin_id_to_price(
     return Decimal(str(adjusted_price))
 
 
+@functools.lru_cache(maxsize=8192)
 def price_to_bin_id(
     price: Decimal,
     bin_step: int,
@@ -94,6 +99,46 @@ def price_to_bin_id(
     return max(MIN_BIN_ID, min(MAX_BIN_ID, bin_id))
 
 
+def bin_ids_to_prices(
+    lower_bin_id: int,
+    upper_bin_id: int,
+    bin_step: int,
+    decimals_x: int,
+    decimals_y: int,
+) -> List[Decimal]:
+    """
+    Convert a contiguous range of bin IDs to prices
+
+    Args:
+        lower_bin_id: First bin ID (inclusive)
+        upper_bin_id: Last bin ID (inclusive)
+        bin_step: Bin step in basis points
+        decimals_x: Token X decimals
+        decimals_y: Token Y decimals
+
+    Returns:
+        Prices for each bin from lower_bin_id to upper_bin_id,
+        identical to calling bin_id_to_price per bin
+    """
+    return [
+        bin_id_to_price(bin_id, bin_step, decimals_x, decimals_y)
+        for bin_id in range(lower_bin_id, upper_bin_id + 1)
+    ]
+
+
+def bin_id_in_range(bin_id: int) -> bool:
+    """
+    Check a bin ID lies within the program's valid range
+
+    Args:
+        bin_id: Bin ID
+
+    Returns:
+        True if MIN_BIN_ID <= bin_id <= MAX_BIN_ID
+    """
+    return MIN_BIN_ID <= bin_id <= MAX_BIN_ID
+
+
 def get_active_bin(active_id: int) -> Tuple[int, int]:
     """
     Get the single active bin as a range
@@ -42,7 +42,7 @@ from .math import (
 )
 from .pool_parser import fetch_pool_state, pool_state_to_pool
 from .position_parser import (
-    fetch_positions_by_owner,
+    fetch_positions_by_owners,
     fetch_position_by_nft,
     position_state_to_position,
 )
@@ -104,13 +104,26 @@ class RaydiumAdapter(ProtocolAdapter):
         pool: Optional[str] = None,
     ) -> List[Position]:
         """Get all positions owned by address"""
-        position_states = fetch_positions_by_owner(self._rpc, owner, pool)
+        return self.get_positions_batch([owner], [pool] if pool else None)
 
+    def get_positions_batch(
+        self,
+        owners: List[str],
+        pools: Optional[List[str]] = None,
+    ) -> List[Position]:
+        """Get positions for several owners, loading all position accounts in one call"""
+        position_states = fetch_positions_by_owners(self._rpc, owners, pools)
+
+        # Positions often share a pool; fetch each pool once
+        pool_objs = {}
         positions = []
         for state in position_states:
             try:
-                pool_obj = self.get_pool(state["pool_id"])
-                position = position_state_to_position(state, pool_obj, owner)
+                pool_id = state["pool_id"]
+                pool_obj = pool_objs.get(pool_id)
+                if pool_obj is None:
+                    pool_obj = pool_objs[pool_id] = self.get_pool(pool_id)
+                position = position_state_to_position(state, pool_obj, state["owner"])
                 positions.append(position)
             except PoolUnavailable as e:
                 logger.debug(
@@ -180,6 +193,10 @@ class RaydiumAdapter(ProtocolAdapter):
 
     # ========== Instruction Building ==========
 
+    def prefetch_for_open(self, pool: Pool) -> None:
+        """Load pool state and both mints (token program detection) in one RPC"""
+        self._rpc.prefetch_accounts([pool.address, pool.token0.mint, pool.token1.mint])
+
     def build_open_position(
         self,
         pool: Pool,
@@ -37,42 +37,10 @@ from .constants import (
     TICK_ARRAY_SIZE,
     MANUAL_REWARD_OVERRIDES,
 )
+from ..base import detect_token_program_for_mint
 from .math import tick_to_sqrt_price_x64, get_tick_array_start_index
 
 
-def detect_token_program_for_mint(rpc, mint: "Pubkey") -> "Pubkey":
-    """
-    Detect the token program for a given mint by checking its owner.
-
-    This is critical for Token-2022 support - we need to use the correct
-    token program for each mint.
-
-    Args:
-        rpc: RPC client
-        mint: Mint address
-
-    Returns:
-        Token program ID (either Tokenkeg or Token-2022)
-    """
-    from solders.pubkey import Pubkey
-
-    # WSOL always uses Tokenkeg
-    if str(mint) == WRAPPED_SOL_MINT:
-        return Pubkey.from_string(TOKEN_PROGRAM_ID)
-
-    try:
-        account_info = rpc.get_account_info(str(mint), encoding="base64")
-        if account_info:
-            owner = account_info.get("owner")
-            if owner == TOKEN_2022_PROGRAM_ID:
-                return Pubkey.from_string(TOKEN_2022_PROGRAM_ID)
-    except Exception:
-        pass
-
-    # Default to Tokenkeg
-    return Pubkey.from_string(TOKEN_PROGRAM_ID)
-
-
 def get_associated_token_address(
     owner: "Pubkey",
     mint: "Pubkey",
@@ -6,6 +6,7 @@ Provides centralized registration and lookup for protocol adapters.
 
 from typing import Dict, Optional, Type, TYPE_CHECKING
 import logging
+import sys
 
 if TYPE_CHECKING:
     from .base import ProtocolAdapter
@@ -37,6 +38,9 @@ class ProtocolRegistry:
     # Registered adapter classes
     _adapters: Dict[str, Type["ProtocolAdapter"]] = {}
 
+    # Bumped on every register/unregister so callers can cache list() results
+    _generation: int = 0
+
     @classmethod
     def register(cls, name: str, adapter_class: Type["ProtocolAdapter"]):
         """
@@ -46,9 +50,34 @@ class ProtocolRegistry:
             name: Protocol name (e.g., "raydium", "meteora")
             adapter_class: Adapter class (not instance)
         """
-        cls._adapters[name.lower()] = adapter_class
+        # Interned so names handed out by list() are the same objects as the
+        # "raydium"/"meteora" literals adapters put in Pool.dex
+        cls._adapters[sys.intern(name.lower())] = adapter_class
+        cls._generation += 1
         logger.debug(f"Registered protocol adapter: {name}")
 
+    @classmethod
+    def unregister(cls, name: str) -> bool:
+        """
+        Remove a protocol adapter class
+
+        Args:
+            name: Protocol name
+
+        Returns:
+            True if the protocol was registered
+        """
+        if cls._adapters.pop(name.lower(), None) is None:
+            return False
+        cls._generation += 1
+        logger.debug(f"Unregistered protocol adapter: {name}")
+        return True
+
+    @classmethod
+    def generation(cls) -> int:
+        """Counter that changes whenever the set of registered protocols changes"""
+        return cls._generation
+
     @classmethod
     def get(
         cls,
@@ -2,6 +2,7 @@
 Pool type definitions and address registry
 """
 
+import functools
 from dataclasses import dataclass, field
 from decimal import Decimal
 from typing import Dict, Optional
@@ -166,34 +167,40 @@ KNOWN_POOLS: Dict[str, Dict[str, str]] = {
 }
 
 
+@functools.lru_cache(maxsize=256)
+def _reversed_pair(symbol: str) -> Optional[str]:
+    """"B/A" for "A/B" (None if symbol is not a pair); depends only on symbol"""
+    parts = symbol.split("/")
+    if len(parts) != 2:
+        return None
+    return f"{parts[1]}/{parts[0]}"
+
+
 def get_pool_address(dex: str, symbol: str) -> str | None:
     """
     Get pool address for a DEX and trading pair symbol.
 
+    Reads KNOWN_POOLS on every call, so pools registered at runtime are found.
+
     Args:
         dex: DEX name (raydium, meteora, uniswap, pancakeswap)
         symbol: Trading pair symbol (e.g., "SOL/USDC", "ETH/USDC")
 
     Returns:
-        Pool address if found, None otherwise
+        Pool address if found (either pair order; a listed symbol wins over
+        a reversed one), None otherwise
     """
     dex_pools = KNOWN_POOLS.get(dex.lower())
     if dex_pools is None:
         return None
 
-    # Try exact match
     symbol_upper = symbol.upper()
-    if symbol_upper in dex_pools:
-        return dex_pools[symbol_upper]
-
-    # Try reversed symbol
-    parts = symbol_upper.split("/")
-    if len(parts) == 2:
-        reversed_symbol = f"{parts[1]}/{parts[0]}"
-        if reversed_symbol in dex_pools:
-            return dex_pools[reversed_symbol]
-
-    return None
+    address = dex_pools.get(symbol_upper)
+    if address is None:
+        reversed_symbol = _reversed_pair(symbol_upper)
+        if reversed_symbol is not None:
+            address = dex_pools.get(reversed_symbol)
+    return address
 
 
 def list_pools(dex: str) -> list[str]:
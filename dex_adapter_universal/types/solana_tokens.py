@@ -98,6 +98,9 @@ def resolve_token_mint(token: str) -> str:
     """
     Resolve token symbol or mint address to mint address
 
+    Not memoized: SOLANA_TOKEN_MINTS may gain tokens at runtime, and a
+    cached pass-through of a then-unknown symbol would go stale.
+
     Args:
         token: Token symbol (e.g., "SOL", "USDC") or mint address
 
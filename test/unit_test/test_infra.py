@@ -61,6 +61,33 @@ def test_rpc_client_init():
     print("  RpcClient Init: PASSED")
 
 
+def test_http_transports():
+    """Test the shared httpx transport factory"""
+    import asyncio
+    from dex_adapter_universal.infra import new_http_transport, new_async_http_transport
+
+    print("Testing HTTP Transports...")
+
+    transport = new_http_transport(max_keepalive_connections=10, keepalive_expiry=45.0)
+    pool = transport._pool
+    assert pool._max_connections == 100
+    assert pool._max_keepalive_connections == 10
+    assert pool._keepalive_expiry == 45.0
+    assert pool._retries == 0
+    transport.close()
+
+    async def build():
+        t = new_async_http_transport(max_connections=64, max_keepalive_connections=32)
+        await t.aclose()
+        return t
+
+    pool = asyncio.run(build())._pool
+    assert pool._max_connections == 64
+    assert pool._max_keepalive_connections == 32
+
+    print("  HTTP Transports: PASSED")
+
+
 def test_signer_protocol():
     """Test Signer protocol"""
     from dex_adapter_universal.infra import Signer
@@ -113,6 +140,42 @@ def test_create_signer():
         print("  create_signer: SKIPPED (solders not installed)")
 
 
+def test_splice_signatures():
+    """Test hand-assembled signed bytes match VersionedTransaction.populate"""
+    from dex_adapter_universal.infra.solana_signer import _splice_signatures
+
+    print("Testing signature splicing...")
+
+    try:
+        from solders.hash import Hash
+        from solders.keypair import Keypair
+        from solders.message import MessageV0
+        from solders.system_program import transfer, TransferParams
+        from solders.transaction import VersionedTransaction
+
+        a, b = Keypair(), Keypair()
+        ixs = [
+            transfer(TransferParams(from_pubkey=a.pubkey(), to_pubkey=b.pubkey(), lamports=1)),
+            transfer(TransferParams(from_pubkey=b.pubkey(), to_pubkey=a.pubkey(), lamports=1)),
+        ]
+        message = MessageV0.try_compile(a.pubkey(), ixs, [], Hash.default())
+        message_bytes = bytes([0x80]) + bytes(message)
+        sigs = [a.sign_message(message_bytes), b.sign_message(message_bytes)]
+
+        expected = bytes(VersionedTransaction.populate(message, sigs))
+        assert _splice_signatures(message_bytes, sigs) == expected
+
+        # Single-signer path signs the same 0x80-prefixed bytes
+        from dex_adapter_universal.infra import LocalSigner
+        single = MessageV0.try_compile(a.pubkey(), ixs[:1], [], Hash.default())
+        _, signature = LocalSigner(a).sign_message(single)
+        assert signature == str(a.sign_message(bytes([0x80]) + bytes(single)))
+
+        print("  Signature splicing: PASSED")
+    except ImportError:
+        print("  Signature splicing: SKIPPED (solders not installed)")
+
+
 def test_tx_builder_init():
     """Test TxBuilder initialization"""
     from dex_adapter_universal.infra import TxBuilder, RpcClient
@@ -137,6 +200,174 @@ def test_tx_builder_init():
         print("  TxBuilder Init: SKIPPED (solders not installed)")
 
 
+def test_tx_builder_sign_message():
+    """Test signing a compiled message matches signing serialized tx bytes"""
+    from dex_adapter_universal.infra import TxBuilder, RpcClient
+
+    print("Testing TxBuilder sign paths...")
+
+    try:
+        from solders.hash import Hash
+        from solders.keypair import Keypair
+        from solders.system_program import transfer, TransferParams
+        from solders.transaction import VersionedTransaction
+        from dex_adapter_universal.infra import LocalSigner
+
+        rpc = RpcClient("https://api.mainnet-beta.solana.com")
+        wallet = Keypair()
+        other = Keypair()
+        builder = TxBuilder(rpc, LocalSigner(wallet))
+        blockhash = str(Hash.default())
+
+        ix = transfer(TransferParams(from_pubkey=wallet.pubkey(), to_pubkey=other.pubkey(), lamports=1))
+        unsigned_tx = builder.build([ix], recent_blockhash=blockhash)
+        message = builder._compile_message([ix], recent_blockhash=blockhash)
+        assert builder._sign_message(message) == builder.sign(unsigned_tx)
+
+        # Multi-signer: other keypair must also sign
+        ix2 = transfer(TransferParams(from_pubkey=other.pubkey(), to_pubkey=wallet.pubkey(), lamports=1))
+        unsigned_tx = builder.build([ix, ix2], recent_blockhash=blockhash)
+        message = builder._compile_message([ix, ix2], recent_blockhash=blockhash)
+        signed_tx, signature = builder._sign_message(message, [other])
+        assert (signed_tx, signature) == builder.sign(unsigned_tx, [other])
+        assert VersionedTransaction.from_bytes(signed_tx).verify_with_results() == [True, True]
+
+        # Passing the wallet's own keypair takes the single-signer path
+        unsigned_tx = builder.build([ix], recent_blockhash=blockhash)
+        assert builder.sign(unsigned_tx, [wallet]) == builder.sign(unsigned_tx)
+
+        print("  TxBuilder sign paths: PASSED")
+    except ImportError:
+        print("  TxBuilder sign paths: SKIPPED (solders not installed)")
+
+
+def test_tx_builder_build_and_send_many():
+    """Test batched build/send shares one blockhash and one confirmation wait"""
+    from unittest.mock import patch
+    from dex_adapter_universal.infra import TxBuilder, RpcClient
+    from dex_adapter_universal.types import TxStatus
+
+    print("Testing TxBuilder build_and_send_many...")
+
+    try:
+        from solders.hash import Hash
+        from solders.keypair import Keypair
+        from solders.system_program import transfer, TransferParams
+        from solders.transaction import VersionedTransaction
+        from dex_adapter_universal.infra import LocalSigner
+
+        rpc = RpcClient("https://api.mainnet-beta.solana.com")
+        wallet = Keypair()
+        builder = TxBuilder(rpc, LocalSigner(wallet))
+        blockhash = {"blockhash": str(Hash.default()), "lastValidBlockHeight": 1}
+        batches = [
+            [transfer(TransferParams(from_pubkey=wallet.pubkey(), to_pubkey=Keypair().pubkey(), lamports=n))]
+            for n in (1, 2, 3)
+        ]
+
+        with patch.object(rpc, "get_latest_blockhash", return_value=blockhash) as get_bh:
+            unsigned = builder.build_many(batches)
+        assert get_bh.call_count == 1
+        assert len(unsigned) == 3 and len(set(unsigned)) == 3
+
+        sent = []
+
+        def fake_send(tx, **kwargs):
+            sig = str(VersionedTransaction.from_bytes(tx).signatures[0])
+            sent.append(sig)
+            return sig
+
+        with patch.object(rpc, "get_latest_blockhash", return_value=blockhash) as get_bh, \
+             patch.object(rpc, "send_transaction", side_effect=fake_send), \
+             patch.object(rpc, "confirm_transactions", return_value=[True, False, None]) as confirm, \
+             patch.object(rpc, "call_batch", return_value=[{"meta": {"fee": 5000}}]):
+            results = builder.build_and_send_many(batches)
+
+        assert get_bh.call_count == 1
+        assert confirm.call_count == 1
+        assert [r.signature for r in results] == sent
+        assert [r.status for r in results] == [TxStatus.SUCCESS, TxStatus.FAILED, TxStatus.TIMEOUT]
+        assert results[0].fee_lamports == 5000
+
+        print("  TxBuilder build_and_send_many: PASSED")
+    except ImportError:
+        print("  TxBuilder build_and_send_many: SKIPPED (solders not installed)")
+
+
+def test_tx_builder_retry_deadline():
+    """Test build_and_send stops retrying once the overall deadline has passed"""
+    from unittest.mock import patch
+    from dex_adapter_universal.infra import TxBuilder, TxBuilderConfig, RpcClient
+    from dex_adapter_universal.types import TxResult
+
+    print("Testing TxBuilder retry deadline...")
+
+    try:
+        from solders.hash import Hash
+        from solders.keypair import Keypair
+        from dex_adapter_universal.infra import LocalSigner
+
+        rpc = RpcClient("https://api.mainnet-beta.solana.com")
+        config = TxBuilderConfig(max_retries=3, confirmation_timeout=0.0, retry_delay=5.0)
+        builder = TxBuilder(rpc, LocalSigner(Keypair()), config=config)
+        blockhash = {"blockhash": str(Hash.default()), "lastValidBlockHeight": 1}
+
+        with patch.object(rpc, "get_latest_blockhash", return_value=blockhash), \
+             patch.object(builder, "send", return_value=TxResult.timeout("sig")) as send, \
+             patch("time.sleep") as sleep:
+            result = builder.build_and_send([])
+
+        assert result.signature == "sig"
+        assert send.call_count == 1
+        assert not sleep.called
+
+        print("  TxBuilder retry deadline: PASSED")
+    except ImportError:
+        print("  TxBuilder retry deadline: SKIPPED (solders not installed)")
+
+
+def test_tx_builder_estimate_size():
+    """Test size estimate matches the built transaction and oversize is rejected early"""
+    from unittest.mock import patch
+    from dex_adapter_universal.errors import TransactionError
+    from dex_adapter_universal.infra import TxBuilder, RpcClient
+    from dex_adapter_universal.infra.tx_builder import PACKET_DATA_SIZE
+
+    print("Testing TxBuilder estimate_size...")
+
+    try:
+        from solders.hash import Hash
+        from solders.instruction import Instruction
+        from solders.keypair import Keypair
+        from solders.system_program import transfer, TransferParams
+        from dex_adapter_universal.infra import LocalSigner
+
+        rpc = RpcClient("https://api.mainnet-beta.solana.com")
+        wallet = Keypair()
+        builder = TxBuilder(rpc, LocalSigner(wallet))
+
+        ix = transfer(TransferParams(from_pubkey=wallet.pubkey(), to_pubkey=Keypair().pubkey(), lamports=1))
+        built = builder.build([ix], recent_blockhash=str(Hash.default()))
+        assert builder.estimate_size([ix]) == len(built)
+
+        big = Instruction(ix.program_id, bytes(PACKET_DATA_SIZE), ix.accounts)
+        assert builder.estimate_size([big]) > PACKET_DATA_SIZE
+
+        blockhash = {"blockhash": str(Hash.default()), "lastValidBlockHeight": 1}
+        with patch.object(rpc, "get_latest_blockhash", return_value=blockhash), \
+             patch.object(rpc, "send_transaction") as send:
+            try:
+                builder.build_and_send([big])
+                assert False, "Oversized transaction should be rejected"
+            except TransactionError as e:
+                assert "too large" in str(e)
+            assert not send.called
+
+        print("  TxBuilder estimate_size: PASSED")
+    except ImportError:
+        print("  TxBuilder estimate_size: SKIPPED (solders not installed)")
+
+
 def test_tx_config():
     """Test TxBuilderConfig dataclass"""
     from dex_adapter_universal.infra import TxBuilderConfig
@@ -160,6 +391,19 @@ def test_tx_config():
     assert config2.compute_unit_price == 50000, "Custom compute_unit_price should work"
     assert config2.skip_preflight == True, "Custom skip_preflight should work"
 
+    # Defaults are snapshotted; reload_tx_defaults picks up runtime changes
+    from dex_adapter_universal.config import config as global_config
+    from dex_adapter_universal.infra import reload_tx_defaults
+    original = global_config.tx.compute_units
+    try:
+        global_config.tx.compute_units = original + 1
+        reload_tx_defaults()
+        assert TxBuilderConfig().compute_units == original + 1
+    finally:
+        global_config.tx.compute_units = original
+        reload_tx_defaults()
+    assert TxBuilderConfig().compute_units == original
+
     print("  TxBuilderConfig: PASSED")
 
 
@@ -172,10 +416,16 @@ def main():
     tests = [
         test_rpc_config,
         test_rpc_client_init,
+        test_http_transports,
         test_signer_protocol,
         test_local_signer,
         test_create_signer,
+        test_splice_signatures,
         test_tx_builder_init,
+        test_tx_builder_sign_message,
+        test_tx_builder_build_and_send_many,
+        test_tx_builder_retry_deadline,
+        test_tx_builder_estimate_size,
         test_tx_config,
     ]
 
@@ -72,6 +72,31 @@ class TestKnownPoolsStructure:
         assert "USDT/WBNB" in KNOWN_POOLS["pancakeswap"]
         assert "USDC/WBNB" in KNOWN_POOLS["pancakeswap"]
 
+    def test_get_pool_address_either_order(self):
+        """Test known pool lookup accepts both pair orders and any case"""
+        from dex_adapter_universal.types.pool import get_pool_address
+
+        address = KNOWN_POOLS["raydium"]["SOL/USDC"]
+        assert get_pool_address("raydium", "SOL/USDC") == address
+        assert get_pool_address("Raydium", "usdc/sol") == address
+        assert get_pool_address("raydium", "FOO/BAR") is None
+        assert get_pool_address("unknown", "SOL/USDC") is None
+
+    def test_get_pool_address_sees_runtime_registration(self):
+        """Test pools added to KNOWN_POOLS after import are found, like list_pools"""
+        from dex_adapter_universal.types.pool import get_pool_address, list_pools
+
+        address = "NewPoolAddress11111111111111111111111111111"
+        assert get_pool_address("raydium", "BONK/SOL") is None
+        KNOWN_POOLS["raydium"]["BONK/SOL"] = address
+        try:
+            assert "BONK/SOL" in list_pools("raydium")
+            assert get_pool_address("raydium", "BONK/SOL") == address
+            assert get_pool_address("raydium", "sol/bonk") == address
+        finally:
+            del KNOWN_POOLS["raydium"]["BONK/SOL"]
+        assert get_pool_address("raydium", "BONK/SOL") is None
+
     def test_uniswap_pool_addresses_format(self):
         """Test that Uniswap pool addresses are valid EVM addresses"""
         for symbol, address in KNOWN_POOLS["uniswap"].items():
@@ -214,6 +239,13 @@ class TestHelperMethods:
         """Test that _validate_chain_dex method exists"""
         assert hasattr(MarketModule, "_validate_chain_dex")
 
+    def test_symbol_normalization(self):
+        """Test the symbol translation table matches upper() plus dash-to-slash"""
+        from dex_adapter_universal.modules.market import _SYMBOL_TRANS
+
+        for symbol in ["sol/usdc", "SOL-USDC", "wBTC-usdt", "jitoSOL/SOL", "eth_USDC", "SOL/USDC"]:
+            assert symbol.translate(_SYMBOL_TRANS) == symbol.upper().replace("-", "/")
+
 
 class TestMarketModuleWithMock:
     """Tests with mocked client"""
@@ -278,6 +310,148 @@ class TestMarketModuleWithMock:
         with pytest.raises(OperationNotSupported):
             market_module._validate_chain_dex(Chain.SOLANA, "pancakeswap")
 
+    def test_pools_queries_protocols_concurrently(self, market_module):
+        """Test pools() merges every protocol in order and skips failures"""
+        adapters = {
+            "raydium": Mock(get_pools_by_token=Mock(return_value=["r1", "r2"])),
+            "meteora": Mock(get_pools_by_token=Mock(side_effect=RuntimeError("down"))),
+            "other": Mock(get_pools_by_token=Mock(return_value=["o1"])),
+        }
+        with patch("dex_adapter_universal.modules.market.ProtocolRegistry") as registry:
+            registry.list.return_value = list(adapters)
+            registry.get.side_effect = lambda name, rpc: adapters[name]
+            pools = market_module.pools(token="So11111111111111111111111111111111111111112")
+
+        assert pools == ["r1", "r2", "o1"]
+        for adapter in adapters.values():
+            adapter.get_pools_by_token.assert_called_once()
+
+    def test_pools_without_token_skips_rpc(self, market_module):
+        """Test pools() without a token filter does not query adapters"""
+        with patch("dex_adapter_universal.modules.market.ProtocolRegistry") as registry:
+            registry.list.return_value = ["raydium"]
+            assert market_module.pools() == []
+            registry.get.assert_not_called()
+
+    def test_concurrent_pool_lookups_share_one_fetch(self, market_module):
+        """Test concurrent pool() calls for one address issue a single adapter call"""
+        import threading
+        import time
+
+        release = threading.Event()
+        adapter = Mock()
+        adapter.get_pool.side_effect = lambda address: release.wait(5) and "pool"
+
+        results = []
+        with patch("dex_adapter_universal.modules.market.ProtocolRegistry") as registry:
+            registry.get.return_value = adapter
+            threads = [
+                threading.Thread(target=lambda: results.append(market_module.pool("addr", dex="raydium")))
+                for _ in range(4)
+            ]
+            threads[0].start()
+            while adapter.get_pool.call_count == 0:
+                time.sleep(0.001)
+            for t in threads[1:]:
+                t.start()
+            time.sleep(0.2)  # let the followers reach the in-flight request
+            release.set()
+            for t in threads:
+                t.join(5)
+
+        assert results == ["pool"] * 4
+        assert adapter.get_pool.call_count == 1
+        assert len(market_module._pool_requests) == 0
+
+    def test_pool_cache(self, market_module):
+        """Test pool() reuses cached pools until refreshed or invalidated"""
+        adapter = Mock()
+        adapter.get_pool.return_value = "pool"
+
+        with patch("dex_adapter_universal.modules.market.ProtocolRegistry") as registry:
+            registry.get.return_value = adapter
+            assert market_module.pool("addr", dex="raydium") == "pool"
+            assert market_module.pool("addr", dex="raydium") == "pool"
+            assert adapter.get_pool.call_count == 1
+
+            market_module.pool("addr", dex="raydium", refresh=True)
+            assert adapter.get_pool.call_count == 2
+
+            market_module.invalidate()
+            market_module.pool("addr", dex="raydium")
+            assert adapter.get_pool.call_count == 3
+
+    def test_price_address_detection(self, market_module):
+        """Test price() routes base58 addresses to pool() and other strings to pool_by_symbol()"""
+        pool = Mock(price=Decimal("2"))
+        address = "58oQChx4yWmvKdwLLZzBi4ChoCc2fqCUWBkwMihLYQo2"
+        with patch.object(market_module, "pool", return_value=pool) as by_address, \
+                patch.object(market_module, "pool_by_symbol", return_value=pool) as by_symbol:
+            assert market_module.price(address) == Decimal("2")
+            # Long but not base58 (contains "/" and "0"): treated as a symbol
+            assert market_module.price("SOL0000000000000000000000000000000/USDC") == Decimal("2")
+
+        assert by_address.call_args.args[0] == address
+        assert by_symbol.call_args.args[0] == "SOL0000000000000000000000000000000/USDC"
+
+    def test_price_usd_cache(self, market_module):
+        """Test price_usd() reuses a found price and tries stables in order"""
+        pool = Mock(price=Decimal("150"))
+        with patch.object(market_module, "pool_by_symbol", side_effect=[None, pool]) as by_symbol:
+            assert market_module.price_usd("sol") == Decimal("150")
+            assert market_module.price_usd("SOL") == Decimal("150")
+
+        assert [c.args[0] for c in by_symbol.call_args_list] == ["sol/USDC", "sol/USDT"]
+
+        market_module.invalidate()
+        with patch.object(market_module, "pool_by_symbol", return_value=None) as by_symbol:
+            assert market_module.price_usd("SOL") is None
+            assert by_symbol.call_count == 2
+
+    def test_detect_protocol_first_success(self, market_module):
+        """Test _detect_protocol returns the matching protocol without waiting on slow probes"""
+        import threading
+        from dex_adapter_universal.errors import PoolUnavailable
+
+        release = threading.Event()
+        slow = Mock(get_pool=Mock(side_effect=lambda address: release.wait(5)))
+        failing = Mock(get_pool=Mock(side_effect=RuntimeError("not mine")))
+        matching = Mock(get_pool=Mock(return_value="pool"))
+        adapters = {"slow": slow, "failing": failing, "matching": matching}
+        address = "58oQChx4yWmvKdwLLZzBi4ChoCc2fqCUWBkwMihLYQo2"
+
+        try:
+            with patch("dex_adapter_universal.modules.market.ProtocolRegistry") as registry:
+                registry.list.return_value = list(adapters)
+                registry.get.side_effect = lambda name, rpc: adapters[name]
+                assert market_module._detect_protocol(address) == "matching"
+
+                adapters.pop("matching")
+                registry.list.return_value = ["failing"]
+                registry.generation.return_value = 1
+                with pytest.raises(PoolUnavailable, match="failing: not mine"):
+                    market_module._detect_protocol(address)
+
+                # Malformed addresses fail without probing any protocol
+                registry.get.reset_mock()
+                with pytest.raises(PoolUnavailable, match="not a Solana address"):
+                    market_module._detect_protocol("0xabc")
+                registry.get.assert_not_called()
+        finally:
+            release.set()
+
+    def test_adapters_cached_per_module(self, market_module):
+        """Test protocol adapters are created once per module until cleared"""
+        with patch("dex_adapter_universal.modules.market.ProtocolRegistry") as registry:
+            registry.get.side_effect = lambda name, rpc: Mock(get_pool=Mock(return_value=name))
+            market_module.pool("a", dex="raydium")
+            market_module.pool("b", dex="raydium")
+            assert registry.get.call_count == 1
+
+            market_module.clear_adapters()
+            market_module.pool("c", dex="raydium")
+            assert registry.get.call_count == 2
+
 
 def main():
     """Run all market module unit tests"""
@@ -23,6 +23,18 @@ def test_protocol_registry():
     assert "raydium" in protocols
     assert "meteora" in protocols
 
+    # Registry changes bump the generation so cached snapshots refresh
+    generation = ProtocolRegistry.generation()
+    ProtocolRegistry.register("dummy", object)
+    try:
+        assert ProtocolRegistry.generation() > generation
+        assert "dummy" in ProtocolRegistry.list()
+    finally:
+        assert ProtocolRegistry.unregister("dummy")
+    assert "dummy" not in ProtocolRegistry.list()
+    assert not ProtocolRegistry.unregister("dummy")
+    assert ProtocolRegistry.generation() == generation + 2
+
     print("  ProtocolRegistry: PASSED")
 
 
@@ -95,6 +107,8 @@ def test_meteora_math():
     from dex_adapter_universal.protocols.meteora.math import (
         bin_id_to_price,
         price_to_bin_id,
+        bin_ids_to_prices,
+        bin_id_in_range,
         one_bin_range,
     )
 
@@ -112,6 +126,18 @@ def test_meteora_math():
     recovered_bin = price_to_bin_id(price, bin_step, decimals_x, decimals_y)
     assert abs(recovered_bin - bin_id) <= 1
 
+    # Range conversion matches per-bin conversion
+    prices = bin_ids_to_prices(bin_id - 2, bin_id + 2, bin_step, decimals_x, decimals_y)
+    assert len(prices) == 5
+    assert prices[2] == price
+    assert prices == sorted(prices)
+    assert bin_ids_to_prices(bin_id, bin_id - 1, bin_step, decimals_x, decimals_y) == []
+
+    # Valid bin ID bounds
+    assert bin_id_in_range(0)
+    assert bin_id_in_range(-443636) and bin_id_in_range(443636)
+    assert not bin_id_in_range(-443637) and not bin_id_in_range(443637)
+
     # One bin range
     lower, upper = one_bin_range(bin_id)
     assert lower == bin_id
@@ -120,6 +146,58 @@ def test_meteora_math():
     print("  Meteora Math: PASSED")
 
 
+def test_meteora_program_id_bytes():
+    """Test pre-decoded Meteora program IDs match their base58 strings"""
+    from solders.pubkey import Pubkey
+    from dex_adapter_universal.protocols.meteora import constants
+
+    print("Testing Meteora program ID bytes...")
+
+    for name in (
+        "DLMM_PROGRAM_ID",
+        "TOKEN_PROGRAM_ID",
+        "TOKEN_2022_PROGRAM_ID",
+        "ASSOCIATED_TOKEN_PROGRAM_ID",
+        "SYSTEM_PROGRAM_ID",
+        "RENT_SYSVAR_ID",
+        "EVENT_AUTHORITY_ID",
+    ):
+        raw = getattr(constants, name + "_BYTES")
+        assert len(raw) == 32
+        assert raw == bytes(Pubkey.from_string(getattr(constants, name))), name
+
+    # Precomputed event authority matches the PDA derivation
+    event_authority, bump = Pubkey.find_program_address(
+        [constants.EVENT_AUTHORITY_SEED],
+        Pubkey.from_string(constants.DLMM_PROGRAM_ID),
+    )
+    assert str(event_authority) == constants.EVENT_AUTHORITY_ID
+    assert bump == constants.EVENT_AUTHORITY_BUMP
+
+    print("  Meteora program ID bytes: PASSED")
+
+
+def test_meteora_constants_frozen():
+    """Test Meteora strategy/bin-step constants are read-only ints"""
+    import struct
+    from dex_adapter_universal.protocols.meteora.constants import BIN_STEPS, StrategyType
+
+    print("Testing Meteora constants...")
+
+    assert StrategyType.SPOT_BALANCED == 3
+    assert struct.pack("<B", StrategyType.SPOT_BALANCED) == b"\x03"
+    assert StrategyType(6) is StrategyType.SPOT_IMBALANCED
+
+    assert BIN_STEPS[10] == "0.10%"
+    try:
+        BIN_STEPS[10] = "changed"
+        assert False, "BIN_STEPS should be read-only"
+    except TypeError:
+        pass
+
+    print("  Meteora constants: PASSED")
+
+
 def test_jupiter_adapter_init():
     """Test JupiterAdapter initialization"""
     from dex_adapter_universal.protocols.jupiter import JupiterAdapter
@@ -134,6 +212,114 @@ def test_jupiter_adapter_init():
     print("  Jupiter Adapter: PASSED")
 
 
+def test_jupiter_aget_quotes():
+    """Test JupiterAPI.aget_quotes overlaps requests and keeps order"""
+    import asyncio
+    import json
+    from unittest.mock import AsyncMock, Mock, patch
+    import httpx
+    from dex_adapter_universal.protocols.jupiter.api import JupiterAPI
+
+    print("Testing Jupiter aget_quotes...")
+
+    async def fake_get(url, params=None):
+        await asyncio.sleep(0.01)
+        response = Mock()
+        response.raise_for_status = Mock()
+        response.content = json.dumps({
+            "inAmount": params["amount"],
+            "outAmount": str(int(params["amount"]) * 2),
+            "routePlan": [{"swapInfo": {"label": "Raydium"}}],
+        }).encode()
+        return response
+
+    async def run(api):
+        try:
+            return await api.aget_quotes([
+                {"input_mint": "A", "output_mint": "B", "amount": 100},
+                {"input_mint": "A", "output_mint": "C", "amount": 200, "slippage_bps": 100},
+            ])
+        finally:
+            await api.aclose()
+
+    with patch.object(httpx.AsyncClient, "get", new_callable=AsyncMock, side_effect=fake_get) as mock_get:
+        quotes = asyncio.run(run(JupiterAPI()))
+
+    assert mock_get.await_count == 2
+    assert [(q.to_token, q.to_amount) for q in quotes] == [("B", 200), ("C", 400)]
+    assert quotes[0].min_to_amount == 199
+    assert quotes[1].min_to_amount == 396
+    assert quotes[0].route == ["Raydium"]
+
+    print("  Jupiter aget_quotes: PASSED")
+
+
+def test_jupiter_quote_retry():
+    """Test JupiterAPI retries 429/5xx with backoff and raises other 4xx immediately"""
+    import json
+    from unittest.mock import patch
+    import httpx
+    from dex_adapter_universal.protocols.jupiter.api import JupiterAPI
+
+    print("Testing Jupiter quote retry...")
+
+    request = httpx.Request("GET", "https://quote")
+    ok = httpx.Response(200, content=json.dumps({"outAmount": "5"}).encode(), request=request)
+    limited = httpx.Response(429, headers={"Retry-After": "0.25"}, request=request)
+    bad = httpx.Response(400, request=request)
+
+    api = JupiterAPI(max_retries=3)
+    with patch.object(httpx.Client, "get", side_effect=[limited, ok]) as mock_get, \
+            patch("dex_adapter_universal.protocols.jupiter.api.time.sleep") as sleep:
+        assert api.get_quote("A", "B", 10).to_amount == 5
+    assert mock_get.call_count == 2
+    assert sleep.call_args.args[0] >= 0.25
+
+    with patch.object(httpx.Client, "get", side_effect=[bad, ok]) as mock_get, \
+            patch("dex_adapter_universal.protocols.jupiter.api.time.sleep") as sleep:
+        try:
+            api.get_quote("A", "B", 10)
+            assert False, "400 should not be retried"
+        except httpx.HTTPStatusError:
+            pass
+    assert mock_get.call_count == 1
+    sleep.assert_not_called()
+
+    # Retry-After is honored only up to the backoff cap
+    hour = httpx.Response(503, headers={"Retry-After": "3600"}, request=request)
+    with patch.object(httpx.Client, "get", side_effect=[hour, ok]), \
+            patch("dex_adapter_universal.protocols.jupiter.api.time.sleep") as sleep:
+        assert api.get_quote("A", "B", 10).to_amount == 5
+    assert sleep.call_args.args[0] <= 1.5
+    api.close()
+
+    print("  Jupiter quote retry: PASSED")
+
+
+def test_jupiter_async_client_per_loop():
+    """Test JupiterAPI keeps one async client per event loop"""
+    import asyncio
+    from dex_adapter_universal.protocols.jupiter.api import JupiterAPI
+
+    print("Testing Jupiter async client per loop...")
+
+    api = JupiterAPI()
+
+    async def get_twice():
+        first = api._get_async_client()
+        assert api._get_async_client() is first
+        return first
+
+    first = asyncio.run(get_twice())
+    second = asyncio.run(get_twice())
+    assert second is not first
+    assert api._async_client is second
+    api.close()
+    assert api._async_client is None
+
+    print("  Jupiter async client per loop: PASSED")
+
+
 def test_protocol_adapter_interface():
     """Test ProtocolAdapter ABC interface"""
     from dex_adapter_universal.protocols.base import ProtocolAdapter
@@ -172,6 +358,9 @@ def test_protocol_adapter_interface():
         "build_claim_rewards",
         "get_token_info",
         "estimate_fees",
+        "get_positions_batch",  # Loops get_positions by default
+        "is_in_range_batch",  # One get_pool per distinct pool
+        "prefetch_for_open",  # No-op by default
     ]
 
     for method in default_methods:
@@ -180,6 +369,201 @@ def test_protocol_adapter_interface():
     print("  ProtocolAdapter Interface: PASSED")
 
 
+def test_is_in_range_batch():
+    """Test is_in_range_batch prefetches pools once and keeps position order"""
+    from unittest.mock import Mock, patch
+    from dex_adapter_universal.protocols.raydium import RaydiumAdapter
+
+    print("Testing is_in_range_batch...")
+
+    rpc = Mock()
+    adapter = RaydiumAdapter(rpc)
+
+    def position(pool_address, in_range_below):
+        p = Mock()
+        p.pool.address = pool_address
+        p.check_in_range.side_effect = lambda price: price < in_range_below
+        return p
+
+    positions = [position("PoolA", 10), position("PoolB", 10), position("PoolA", 1)]
+    pools = {"PoolA": Mock(price=5), "PoolB": Mock(price=50)}
+
+    with patch.object(RaydiumAdapter, "get_pool", side_effect=lambda address: pools[address]) as get_pool:
+        assert adapter.is_in_range_batch(positions) == [True, False, False]
+        assert adapter.is_in_range_batch([]) == []
+
+    rpc.prefetch_accounts.assert_called_once_with(["PoolA", "PoolB"])
+    assert [c.args[0] for c in get_pool.call_args_list] == ["PoolA", "PoolB"]
+
+    print("  is_in_range_batch: PASSED")
+
+
+def test_meteora_parse_position():
+    """Test Meteora position account parsing from raw data"""
+    import struct
+    from unittest.mock import Mock, patch
+    from solders.pubkey import Pubkey
+    from dex_adapter_universal.protocols.meteora import MeteoraAdapter
+    from dex_adapter_universal.protocols.meteora.constants import (
+        ACCOUNT_DISCRIMINATORS,
+        POSITION_LIQUIDITY_SHARES_OFFSET,
+        POSITION_LOWER_BIN_ID_OFFSET,
+    )
+
+    print("Testing Meteora position parsing...")
+
+    lb_pair = Pubkey.new_unique()
+    owner = Pubkey.new_unique()
+    data = bytearray(POSITION_LOWER_BIN_ID_OFFSET + 16)
+    data[0:8] = ACCOUNT_DISCRIMINATORS["position"]
+    data[8:40] = bytes(lb_pair)
+    data[40:72] = bytes(owner)
+    struct.pack_into("<ii", data, POSITION_LOWER_BIN_ID_OFFSET, 100, 102)
+    # Shares for bins 100..102: 0, 2**64 + 5, 7
+    struct.pack_into("<QQ", data, POSITION_LIQUIDITY_SHARES_OFFSET + 16, 5, 1)
+    struct.pack_into("<QQ", data, POSITION_LIQUIDITY_SHARES_OFFSET + 32, 7, 0)
+
+    adapter = MeteoraAdapter(Mock())
+    pool = Mock(active_bin_id=101)
+    with patch.object(MeteoraAdapter, "get_pool", return_value=pool) as get_pool, \
+            patch.object(MeteoraAdapter, "ticks_to_prices", return_value=(1, 2)):
+        position = adapter._parse_position("PositionAddr", bytes(data))
+
+    get_pool.assert_called_once_with(str(lb_pair))
+    assert position.owner == str(owner)
+    assert (position.lower_bin_id, position.upper_bin_id) == (100, 102)
+    assert position.bin_ids == [101, 102]
+    assert position.liquidity == (1 << 64) + 5 + 7
+    assert position.is_in_range
+
+    print("  Meteora position parsing: PASSED")
+
+
+def test_detect_token_program_cached():
+    """Test token program detection is looked up once per endpoint and mint"""
+    from unittest.mock import Mock
+    from solders.pubkey import Pubkey
+    from dex_adapter_universal.protocols.meteora import instructions as meteora_ix
+    from dex_adapter_universal.protocols.raydium import instructions as raydium_ix
+
+    print("Testing token program detection cache...")
+
+    token_2022 = "TokenzQdBNbLqP5VEhdkAS6EPFLC1PHnBqCXEpPxuEb"
+    # Both instruction builders share one helper (and one cache)
+    assert meteora_ix.detect_token_program_for_mint is raydium_ix.detect_token_program_for_mint
+
+    for module in (meteora_ix, raydium_ix):
+        mint = Pubkey.new_unique()
+        rpc = Mock(endpoint="https://mainnet.example")
+        rpc.get_account_info.return_value = {"owner": token_2022}
+
+        assert str(module.detect_token_program_for_mint(rpc, mint)) == token_2022
+        assert str(module.detect_token_program_for_mint(rpc, mint)) == token_2022
+        assert rpc.get_account_info.call_count == 1
+
+        # The cache is per endpoint: another cluster is asked separately
+        devnet = Mock(endpoint="https://devnet.example")
+        devnet.get_account_info.return_value = None
+        assert str(module.detect_token_program_for_mint(devnet, mint)) != token_2022
+        assert devnet.get_account_info.call_count == 1
+
+        # Failed lookups fall back to Tokenkeg and are retried next time
+        other = Pubkey.new_unique()
+        rpc.get_account_info.side_effect = [RuntimeError("rpc down"), {"owner": token_2022}]
+        assert str(module.detect_token_program_for_mint(rpc, other)) != token_2022
+        assert str(module.detect_token_program_for_mint(rpc, other)) == token_2022
+
+    # A client with no endpoint is never cached (id() can be reused after GC)
+    mint = Pubkey.new_unique()
+    rpc = Mock(spec=["get_account_info"])
+    rpc.get_account_info.return_value = {"owner": token_2022}
+    assert str(raydium_ix.detect_token_program_for_mint(rpc, mint)) == token_2022
+    assert str(raydium_ix.detect_token_program_for_mint(rpc, mint)) == token_2022
+    assert rpc.get_account_info.call_count == 2
+
+    print("  Token program detection cache: PASSED")
+
+
+def test_get_token_info_cached():
+    """Test get_token_info caches found mints (including Token-2022) per adapter"""
+    from unittest.mock import Mock
+    from dex_adapter_universal.protocols.meteora import MeteoraAdapter
+
+    print("Testing get_token_info cache...")
+
+    rpc = Mock()
+    rpc.get_account_info.return_value = {
+        "data": {"program": "spl-token-2022", "parsed": {"info": {"decimals": 6}}},
+    }
+    adapter = MeteoraAdapter(rpc)
+
+    assert adapter._get_token_decimals("MintA") == 6
+    assert adapter.get_token_info("MintA").decimals == 6
+    assert rpc.get_account_info.call_count == 1
+
+    # Missing mints are not cached
+    rpc.get_account_info.return_value = None
+    assert adapter.get_token_info("MintB") is None
+    assert adapter.get_token_info("MintB") is None
+    assert rpc.get_account_info.call_count == 3
+
+    print("  get_token_info cache: PASSED")
+
+
+def test_raydium_positions_batch():
+    """Test Raydium position accounts are loaded with one getMultipleAccounts call"""
+    import base64
+    import struct
+    from unittest.mock import Mock
+    from dex_adapter_universal.protocols.raydium.position_parser import fetch_positions_by_owners
+    from dex_adapter_universal.protocols.raydium.constants import CLMM_PROGRAM_ID, PP_DISCRIMINATORS
+
+    print("Testing Raydium positions batch...")
+
+    try:
+        from solders.pubkey import Pubkey
+    except ImportError:
+        print("  Raydium positions batch: SKIPPED (solders not installed)")
+        return
+
+    pool_a, pool_b = Pubkey.new_unique(), Pubkey.new_unique()
+    mints = [Pubkey.new_unique() for _ in range(3)]
+
+    def nft_account(mint):
+        return {"account": {"data": {"parsed": {"info": {
+            "mint": str(mint),
+            "tokenAmount": {"amount": "1", "decimals": 0},
+        }}}}}
+
+    def position_account(mint, pool):
+        data = (
+            next(iter(PP_DISCRIMINATORS)) + b"\x01" + bytes(mint) + bytes(pool)
+            + struct.pack("<ii", -10, 10) + (7).to_bytes(16, "little") + bytes(48) + bytes(16)
+        )
+        return {"owner": CLMM_PROGRAM_ID, "data": [base64.b64encode(data).decode(), "base64"]}
+
+    rpc = Mock()
+    rpc.get_token_accounts_by_owner.side_effect = lambda owner, program_id: (
+        [nft_account(m) for m in mints] if owner == "owner1" and "Tokenkeg" in program_id else []
+    )
+    rpc.get_multiple_accounts.return_value = [
+        position_account(mints[0], pool_a),
+        None,
+        position_account(mints[2], pool_b),
+    ]
+
+    states = fetch_positions_by_owners(rpc, ["owner1", "owner2"])
+    assert rpc.get_multiple_accounts.call_count == 1
+    assert len(rpc.get_multiple_accounts.call_args.args[0]) == 3
+    assert [s["nft_mint"] for s in states] == [str(mints[0]), str(mints[2])]
+    assert all(s["owner"] == "owner1" and s["liquidity"] == 7 for s in states)
+
+    states = fetch_positions_by_owners(rpc, ["owner1"], [str(pool_b)])
+    assert [s["pool_id"] for s in states] == [str(pool_b)]
+
+    print("  Raydium positions batch: PASSED")
+
+
 def main():
     """Run all protocol tests"""
     print("=" * 60)
@@ -192,8 +576,18 @@ def main():
         test_meteora_adapter_registration,
         test_raydium_math,
         test_meteora_math,
+        test_meteora_program_id_bytes,
+        test_meteora_constants_frozen,
         test_jupiter_adapter_init,
+        test_jupiter_aget_quotes,
+        test_jupiter_quote_retry,
+        test_jupiter_async_client_per_loop,
         test_protocol_adapter_interface,
+        test_is_in_range_batch,
+        test_meteora_parse_position,
+        test_detect_token_program_cached,
+        test_get_token_info_cached,
+        test_raydium_positions_batch,
     ]
 
     passed = 0
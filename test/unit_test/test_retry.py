@@ -10,6 +10,7 @@ from dex_adapter_universal.infra.retry import (
     execute_with_retry,
     execute_swap_with_retry,
     classify_error,
+    jittered_backoff,
     CorrelationContext,
     generate_correlation_id,
     get_correlation_id,
@@ -91,6 +92,23 @@ class TestClassifyError(unittest.TestCase):
         self.assertTrue(is_recoverable)
 
 
+class TestJitteredBackoff(unittest.TestCase):
+    """Tests for full-jitter backoff"""
+
+    def test_delay_within_exponential_bound(self):
+        """Delay should be in [0, base * 2**attempt]"""
+        for attempt in range(3):
+            for _ in range(50):
+                delay = jittered_backoff(attempt, 0.5)
+                self.assertGreaterEqual(delay, 0.0)
+                self.assertLessEqual(delay, 0.5 * 2 ** attempt)
+
+    def test_delay_capped(self):
+        """Delay should never exceed the cap"""
+        for _ in range(50):
+            self.assertLessEqual(jittered_backoff(20, 1.0, cap=2.0), 2.0)
+
+
 class TestExecuteWithRetry(unittest.TestCase):
     """Tests for execute_with_retry function"""
 
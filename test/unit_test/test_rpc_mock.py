@@ -95,11 +95,11 @@ def test_rpc_call_success():
         # Create mock response
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {
+        mock_response.content = json.dumps({
             "jsonrpc": "2.0",
             "id": 1,
             "result": {"blockhash": "test_blockhash", "lastValidBlockHeight": 12345},
-        }
+        }).encode()
         mock_response.raise_for_status = Mock()
 
         # Mock the httpx client
@@ -129,11 +129,11 @@ def test_rpc_call_error():
         # Create mock error response
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {
+        mock_response.content = json.dumps({
             "jsonrpc": "2.0",
             "id": 1,
             "error": {"code": -32600, "message": "Invalid request"},
-        }
+        }).encode()
         mock_response.raise_for_status = Mock()
 
         with patch.object(httpx.Client, 'post', return_value=mock_response):
@@ -166,11 +166,11 @@ def test_rpc_rate_limit():
 
         success_response = Mock()
         success_response.status_code = 200
-        success_response.json.return_value = {
+        success_response.content = json.dumps({
             "jsonrpc": "2.0",
             "id": 1,
             "result": 12345,
-        }
+        }).encode()
         success_response.raise_for_status = Mock()
 
         # First call returns 429, second returns success
@@ -182,6 +182,20 @@ def test_rpc_rate_limit():
             result = client.call("getSlot", [])
             assert result == 12345
 
+        # Retry-After is capped, and the last attempt rotates without sleeping
+        hour = Mock()
+        hour.status_code = 429
+        hour.headers = {"Retry-After": "3600"}
+        with patch.object(httpx.Client, 'post', side_effect=[hour, hour, success_response]), \
+                patch("dex_adapter_universal.infra.rpc.time.sleep") as sleep:
+            config = RpcClientConfig(max_retries=2, retry_delay_seconds=0.01)
+            client = RpcClient(["https://a.example", "https://b.example"], config)
+
+            assert client.call("getSlot", []) == 12345
+            assert client.endpoint == "https://b.example"
+            assert sleep.call_count == 1
+            assert sleep.call_args.args[0] == 8.0
+
         print("  Rate limit handling: PASSED")
 
     except ImportError:
@@ -231,7 +245,7 @@ def test_rpc_endpoint_rotation():
 
         success_response = Mock()
         success_response.status_code = 200
-        success_response.json.return_value = {"jsonrpc": "2.0", "id": 1, "result": 12345}
+        success_response.content = json.dumps({"jsonrpc": "2.0", "id": 1, "result": 12345}).encode()
         success_response.raise_for_status = Mock()
 
         # With max_retries=2, each endpoint gets 2 attempts
@@ -255,6 +269,40 @@ def test_rpc_endpoint_rotation():
         print("  Endpoint rotation: SKIPPED (httpx not installed)")
 
 
+def test_rpc_non_retryable_status():
+    """Test 401/403 responses skip remaining retries on that endpoint"""
+    print("Testing non-retryable HTTP status...")
+
+    try:
+        import httpx
+        from dex_adapter_universal.infra.rpc import RpcClient, RpcClientConfig
+
+        forbidden_response = Mock()
+        forbidden_response.status_code = 403
+        forbidden_response.raise_for_status = Mock(side_effect=httpx.HTTPStatusError("Forbidden", request=Mock(), response=forbidden_response))
+
+        success_response = Mock()
+        success_response.status_code = 200
+        success_response.content = json.dumps({"jsonrpc": "2.0", "id": 1, "result": 12345}).encode()
+        success_response.raise_for_status = Mock()
+
+        with patch.object(httpx.Client, 'post', side_effect=[forbidden_response, success_response]) as mock_post:
+            config = RpcClientConfig(max_retries=3, retry_delay_seconds=0.01)
+            client = RpcClient([
+                "https://forbidden.example.com",
+                "https://working.example.com",
+            ], config)
+
+            assert client.call("getSlot", []) == 12345
+            assert mock_post.call_count == 2
+            assert client.endpoint == "https://working.example.com"
+
+        print("  Non-retryable HTTP status: PASSED")
+
+    except ImportError:
+        print("  Non-retryable HTTP status: SKIPPED (httpx not installed)")
+
+
 def test_get_account_info():
     """Test get_account_info method"""
     print("Testing get_account_info...")
@@ -265,7 +313,7 @@ def test_get_account_info():
 
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {
+        mock_response.content = json.dumps({
             "jsonrpc": "2.0",
             "id": 1,
             "result": {
@@ -276,7 +324,7 @@ def test_get_account_info():
                     "owner": "11111111111111111111111111111111",
                 }
             },
-        }
+        }).encode()
         mock_response.raise_for_status = Mock()
 
         with patch.object(httpx.Client, 'post', return_value=mock_response):
@@ -303,11 +351,11 @@ def test_get_account_info_not_found():
 
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {
+        mock_response.content = json.dumps({
             "jsonrpc": "2.0",
             "id": 1,
             "result": {"value": None},
-        }
+        }).encode()
         mock_response.raise_for_status = Mock()
 
         with patch.object(httpx.Client, 'post', return_value=mock_response):
@@ -322,6 +370,531 @@ def test_get_account_info_not_found():
         print("  get_account_info not found: SKIPPED (httpx not installed)")
 
 
+def test_call_batch():
+    """Test batched RPC calls are matched to requests by id"""
+    print("Testing call_batch...")
+
+    try:
+        import httpx
+        from dex_adapter_universal.infra.rpc import RpcClient
+
+        # Server answers out of order
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.content = json.dumps([
+            {"jsonrpc": "2.0", "id": 2, "result": 200},
+            {"jsonrpc": "2.0", "id": 1, "result": 100},
+        ]).encode()
+        mock_response.raise_for_status = Mock()
+
+        with patch.object(httpx.Client, 'post', return_value=mock_response) as mock_post:
+            client = RpcClient("https://api.mainnet-beta.solana.com")
+            results = client.call_batch([("getSlot", []), ("getBlockHeight", [])])
+
+            assert results == [100, 200]
+            assert mock_post.call_count == 1, "Batch should use a single POST"
+            body = json.loads(mock_post.call_args.kwargs["content"])
+            assert [entry["method"] for entry in body] == ["getSlot", "getBlockHeight"]
+
+        print("  call_batch: PASSED")
+
+    except ImportError:
+        print("  call_batch: SKIPPED (httpx not installed)")
+
+
+def test_call_batch_error():
+    """Test batched RPC call raises when any entry has an error"""
+    print("Testing call_batch error...")
+
+    try:
+        import httpx
+        from dex_adapter_universal.infra.rpc import RpcClient
+        from dex_adapter_universal.errors import RpcError
+
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.content = json.dumps([
+            {"jsonrpc": "2.0", "id": 1, "result": 100},
+            {"jsonrpc": "2.0", "id": 2, "error": {"code": -32602, "message": "Invalid params"}},
+        ]).encode()
+        mock_response.raise_for_status = Mock()
+
+        with patch.object(httpx.Client, 'post', return_value=mock_response):
+            client = RpcClient("https://api.mainnet-beta.solana.com")
+
+            try:
+                client.call_batch([("getSlot", []), ("getBalance", ["bad"])])
+                assert False, "Should raise RpcError"
+            except RpcError as e:
+                assert "Invalid params" in str(e)
+                assert e.details["rpc_error_code"] == -32602
+
+        print("  call_batch error: PASSED")
+
+    except ImportError:
+        print("  call_batch error: SKIPPED (httpx not installed)")
+
+
+def test_prefer_compressed():
+    """Test base64+zstd is requested and returned to callers as base64"""
+    print("Testing prefer_compressed...")
+
+    try:
+        import base64
+        import httpx
+        import zstandard
+        from dex_adapter_universal.infra.rpc import RpcClient, RpcClientConfig
+
+        raw = b"\x07" * 1500
+        compressed = base64.b64encode(zstandard.ZstdCompressor().compress(raw)).decode()
+
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.content = json.dumps({
+            "jsonrpc": "2.0",
+            "id": 1,
+            "result": {"value": {"data": [compressed, "base64+zstd"], "lamports": 1}},
+        }).encode()
+        mock_response.raise_for_status = Mock()
+
+        with patch.object(httpx.Client, 'post', return_value=mock_response) as mock_post:
+            config = RpcClientConfig(prefer_compressed=True, account_info_cache_ttl=0)
+            client = RpcClient("https://api.mainnet-beta.solana.com", config)
+            value = client.get_account_info("addr")
+
+            sent = json.loads(mock_post.call_args.kwargs["content"])
+            assert sent["params"][1]["encoding"] == "base64+zstd"
+            assert value["data"][1] == "base64"
+            assert base64.b64decode(value["data"][0]) == raw
+
+        print("  prefer_compressed: PASSED")
+
+    except ImportError:
+        print("  prefer_compressed: SKIPPED (httpx/zstandard not installed)")
+
+
+def test_get_multiple_accounts_chunked():
+    """Test >100 addresses are split into one batch request in order"""
+    print("Testing get_multiple_accounts chunking...")
+
+    try:
+        import httpx
+        from dex_adapter_universal.infra.rpc import RpcClient
+
+        addresses = [f"addr{i}" for i in range(150)]
+
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.content = json.dumps([
+            {"jsonrpc": "2.0", "id": 2, "result": {"value": [{"i": i} for i in range(100, 150)]}},
+            {"jsonrpc": "2.0", "id": 1, "result": {"value": [{"i": i} for i in range(100)]}},
+        ]).encode()
+        mock_response.raise_for_status = Mock()
+
+        with patch.object(httpx.Client, 'post', return_value=mock_response) as mock_post:
+            client = RpcClient("https://api.mainnet-beta.solana.com")
+            values = client.get_multiple_accounts(addresses)
+
+            assert [v["i"] for v in values] == list(range(150))
+            assert mock_post.call_count == 1
+            body = json.loads(mock_post.call_args.kwargs["content"])
+            assert [len(entry["params"][0]) for entry in body] == [100, 50]
+
+        print("  get_multiple_accounts chunking: PASSED")
+
+    except ImportError:
+        print("  get_multiple_accounts chunking: SKIPPED (httpx not installed)")
+
+
+def test_confirm_transactions():
+    """Test confirming several signatures with one status query"""
+    print("Testing confirm_transactions...")
+
+    try:
+        import httpx
+        from dex_adapter_universal.infra.rpc import RpcClient
+
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.content = json.dumps({
+            "jsonrpc": "2.0",
+            "id": 1,
+            "result": {
+                "value": [
+                    {"confirmationStatus": "confirmed", "err": None},
+                    {"confirmationStatus": "processed", "err": {"InstructionError": [0, "Custom"]}},
+                ]
+            },
+        }).encode()
+        mock_response.raise_for_status = Mock()
+
+        with patch.object(httpx.Client, 'post', return_value=mock_response) as mock_post:
+            client = RpcClient("https://api.mainnet-beta.solana.com")
+            results = client.confirm_transactions(["sig1", "sig2"], timeout_seconds=5.0)
+
+            assert results == [True, False]
+            assert mock_post.call_count == 1
+            assert json.loads(mock_post.call_args.kwargs["content"])["params"] == [["sig1", "sig2"]]
+
+        # Batches over the RPC limit are split into requests of 256
+        def statuses(url, content=None, **kwargs):
+            sigs = json.loads(content)["params"][0]
+            assert len(sigs) <= 256
+            response = Mock()
+            response.status_code = 200
+            response.raise_for_status = Mock()
+            response.content = json.dumps({
+                "jsonrpc": "2.0",
+                "id": 1,
+                "result": {"value": [{"confirmationStatus": "confirmed", "err": None}] * len(sigs)},
+            }).encode()
+            return response
+
+        signatures = [f"sig{i}" for i in range(600)]
+        with patch.object(httpx.Client, 'post', side_effect=statuses) as mock_post:
+            client = RpcClient("https://api.mainnet-beta.solana.com")
+            results = client.confirm_transactions(signatures, timeout_seconds=5.0)
+
+            assert results == [True] * 600
+            assert mock_post.call_count == 3
+            sent = [s for c in mock_post.call_args_list for s in json.loads(c.kwargs["content"])["params"][0]]
+            assert sent == signatures
+
+        print("  confirm_transactions: PASSED")
+
+    except ImportError:
+        print("  confirm_transactions: SKIPPED (httpx not installed)")
+
+
+def test_confirm_transaction_ws():
+    """Test confirmation via signatureSubscribe notification"""
+    print("Testing confirm_transaction over WebSocket...")
+
+    try:
+        import httpx
+        from dex_adapter_universal.infra.rpc import RpcClient, RpcClientConfig
+
+        ws = MagicMock()
+        ws.__enter__.return_value = ws
+        ws.recv.side_effect = [
+            json.dumps({"jsonrpc": "2.0", "id": 1, "result": 7}),
+            json.dumps({
+                "jsonrpc": "2.0",
+                "method": "signatureNotification",
+                "params": {"result": {"context": {"slot": 1}, "value": {"err": None}}, "subscription": 7},
+            }),
+        ]
+
+        status_response = Mock()
+        status_response.status_code = 200
+        status_response.content = json.dumps({
+            "jsonrpc": "2.0", "id": 1, "result": {"value": [None]},
+        }).encode()
+        status_response.raise_for_status = Mock()
+
+        with patch("dex_adapter_universal.infra.rpc._ws_connect", return_value=ws) as mock_connect, \
+                patch.object(httpx.Client, 'post', return_value=status_response):
+            client = RpcClient("https://api.mainnet-beta.solana.com", config=RpcClientConfig(ws_confirm=True))
+            assert client.confirm_transaction("sig1", timeout_seconds=5.0) is True
+            assert mock_connect.call_args.kwargs["open_timeout"] <= 2.0
+            assert mock_connect.call_args.args[0] == "wss://api.mainnet-beta.solana.com"
+            sent = json.loads(ws.send.call_args.args[0])
+            assert sent["method"] == "signatureSubscribe"
+
+        print("  confirm_transaction over WebSocket: PASSED")
+
+    except ImportError:
+        print("  confirm_transaction over WebSocket: SKIPPED (httpx not installed)")
+
+
+def test_confirm_transaction_ws_final_poll():
+    """Test a missed notification is resolved by a last status check"""
+    print("Testing WebSocket confirmation final status poll...")
+
+    try:
+        import httpx
+        from dex_adapter_universal.infra.rpc import RpcClient, RpcClientConfig
+
+        ws = MagicMock()
+        ws.__enter__.return_value = ws
+        ws.recv.side_effect = [
+            json.dumps({"jsonrpc": "2.0", "id": 1, "result": 7}),
+            TimeoutError(),
+        ]
+
+        def status(value):
+            response = Mock()
+            response.status_code = 200
+            response.content = json.dumps({"jsonrpc": "2.0", "id": 1, "result": {"value": [value]}}).encode()
+            response.raise_for_status = Mock()
+            return response
+
+        landed = {"err": None, "confirmationStatus": "confirmed"}
+        with patch("dex_adapter_universal.infra.rpc._ws_connect", return_value=ws), \
+                patch.object(httpx.Client, 'post', side_effect=[status(None), status(landed)]) as mock_post:
+            client = RpcClient("https://api.mainnet-beta.solana.com", config=RpcClientConfig(ws_confirm=True))
+            assert client.confirm_transaction("sig1", timeout_seconds=5.0) is True
+            assert mock_post.call_count == 2
+
+        print("  WebSocket confirmation final status poll: PASSED")
+
+    except ImportError:
+        print("  WebSocket confirmation final status poll: SKIPPED (httpx not installed)")
+
+
+def test_send_and_confirm_ws():
+    """Test subscription is opened before the transaction is sent"""
+    print("Testing send_and_confirm over WebSocket...")
+
+    try:
+        import httpx
+        from dex_adapter_universal.infra.rpc import RpcClient, RpcClientConfig
+
+        events = []
+        ws = MagicMock()
+        ws.__enter__.return_value = ws
+        ws.send.side_effect = lambda msg: events.append(json.loads(msg)["method"])
+        ws.recv.side_effect = [
+            json.dumps({"jsonrpc": "2.0", "id": 1, "result": 7}),
+            json.dumps({
+                "jsonrpc": "2.0",
+                "method": "signatureNotification",
+                "params": {"result": {"context": {"slot": 1}, "value": {"err": None}}, "subscription": 7},
+            }),
+        ]
+
+        send_response = Mock()
+        send_response.status_code = 200
+        send_response.content = json.dumps({"jsonrpc": "2.0", "id": 1, "result": "sig1"}).encode()
+        send_response.raise_for_status = Mock()
+
+        def post(*args, **kwargs):
+            events.append(json.loads(kwargs["content"])["method"])
+            return send_response
+
+        with patch("dex_adapter_universal.infra.rpc._ws_connect", return_value=ws), \
+                patch.object(httpx.Client, 'post', side_effect=post):
+            client = RpcClient("https://api.mainnet-beta.solana.com", config=RpcClientConfig(ws_confirm=True))
+            signature, confirmed = client.send_and_confirm(b"\x01" + b"\x00" * 100, timeout_seconds=5.0)
+
+            assert (signature, confirmed) == ("sig1", True)
+            assert events == ["signatureSubscribe", "sendTransaction"]
+
+        print("  send_and_confirm over WebSocket: PASSED")
+
+    except ImportError:
+        print("  send_and_confirm over WebSocket: SKIPPED (httpx not installed)")
+
+
+def test_send_and_confirm_ws_stalled_ack():
+    """Test a stalled subscription does not hold back the send"""
+    print("Testing send_and_confirm with stalled WebSocket ack...")
+
+    try:
+        import httpx
+        from dex_adapter_universal.infra.rpc import RpcClient, RpcClientConfig
+
+        ws = MagicMock()
+        ws.__enter__.return_value = ws
+        ws.recv.side_effect = TimeoutError()
+
+        def response(result):
+            r = Mock()
+            r.status_code = 200
+            r.content = json.dumps({"jsonrpc": "2.0", "id": 1, "result": result}).encode()
+            r.raise_for_status = Mock()
+            return r
+
+        landed = {"value": [{"err": None, "confirmationStatus": "confirmed"}]}
+        with patch("dex_adapter_universal.infra.rpc._ws_connect", return_value=ws), \
+                patch.object(httpx.Client, 'post', side_effect=[response("sig1"), response(landed)]):
+            client = RpcClient("https://api.mainnet-beta.solana.com", config=RpcClientConfig(ws_confirm=True))
+            signature, confirmed = client.send_and_confirm(b"\x01" + b"\x00" * 100, timeout_seconds=30.0)
+
+            assert (signature, confirmed) == ("sig1", True)
+            # The ack wait is bounded by the connect budget, not the confirmation timeout
+            assert ws.recv.call_args.kwargs["timeout"] <= 2.0
+
+        print("  send_and_confirm with stalled WebSocket ack: PASSED")
+
+    except ImportError:
+        print("  send_and_confirm with stalled WebSocket ack: SKIPPED (httpx not installed)")
+
+
+def test_acall_success():
+    """Test async RPC call"""
+    print("Testing acall success...")
+
+    try:
+        import asyncio
+        import httpx
+        from unittest.mock import AsyncMock
+        from dex_adapter_universal.infra.rpc import RpcClient
+
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.content = json.dumps({"jsonrpc": "2.0", "id": 1, "result": {"value": 5000}}).encode()
+        mock_response.raise_for_status = Mock()
+
+        async def run():
+            client = RpcClient("https://api.mainnet-beta.solana.com")
+            try:
+                return await asyncio.gather(
+                    client.aget_balance("AddressA"),
+                    client.aget_balance("AddressB"),
+                )
+            finally:
+                await client.aclose()
+
+        with patch.object(httpx.AsyncClient, 'post', new_callable=AsyncMock, return_value=mock_response) as mock_post:
+            balances = asyncio.run(run())
+
+            assert balances == [5000, 5000]
+            assert mock_post.await_count == 2
+
+        # Async token account reads share the sync read cache
+        client = RpcClient("https://api.mainnet-beta.solana.com")
+        accounts_response = Mock()
+        accounts_response.status_code = 200
+        accounts_response.content = json.dumps(
+            {"jsonrpc": "2.0", "id": 1, "result": {"value": [{"pubkey": "Acc1"}]}}
+        ).encode()
+        accounts_response.raise_for_status = Mock()
+        with patch.object(httpx.AsyncClient, 'post', new_callable=AsyncMock, return_value=accounts_response) as mock_post, \
+                patch.object(httpx.Client, 'post') as mock_sync_post:
+            accounts = asyncio.run(client.aget_token_accounts_by_owner("Owner"))
+            assert accounts == [{"pubkey": "Acc1"}]
+            assert client.get_token_accounts_by_owner("Owner") == accounts
+            assert mock_post.await_count == 1
+            mock_sync_post.assert_not_called()
+        client.close()
+
+        print("  acall success: PASSED")
+
+    except ImportError:
+        print("  acall success: SKIPPED (httpx not installed)")
+
+
+def test_read_cache():
+    """Test idempotent reads are cached and invalidated by sends"""
+    print("Testing read cache...")
+
+    try:
+        import httpx
+        from dex_adapter_universal.infra.rpc import RpcClient, RpcClientConfig
+
+        blockhash_response = Mock()
+        blockhash_response.status_code = 200
+        blockhash_response.content = json.dumps({
+            "jsonrpc": "2.0",
+            "id": 1,
+            "result": {"value": {"blockhash": "hash1", "lastValidBlockHeight": 1}},
+        }).encode()
+        blockhash_response.raise_for_status = Mock()
+
+        account_response = Mock()
+        account_response.status_code = 200
+        account_response.content = json.dumps({
+            "jsonrpc": "2.0",
+            "id": 1,
+            "result": {"value": {"data": ["", "base64"], "lamports": 1}},
+        }).encode()
+        account_response.raise_for_status = Mock()
+
+        send_response = Mock()
+        send_response.status_code = 200
+        send_response.content = json.dumps({"jsonrpc": "2.0", "id": 1, "result": "sig"}).encode()
+        send_response.raise_for_status = Mock()
+
+        responses = [blockhash_response, account_response, send_response, account_response, blockhash_response]
+        with patch.object(httpx.Client, 'post', side_effect=responses) as mock_post:
+            config = RpcClientConfig(blockhash_cache_ttl=60.0, account_info_cache_ttl=60.0)
+            client = RpcClient("https://api.mainnet-beta.solana.com", config)
+
+            assert client.get_latest_blockhash()["blockhash"] == "hash1"
+            client.get_account_info("addr")
+            assert client.get_latest_blockhash()["blockhash"] == "hash1"
+            client.get_account_info("addr")
+            assert mock_post.call_count == 2, "Repeated reads should hit the cache"
+
+            client.send_transaction(b"\x00" * 8)
+            client.get_account_info("addr")
+            assert mock_post.call_count == 4, "Send should invalidate account reads"
+            client.get_latest_blockhash()
+            assert mock_post.call_count == 4, "Send should keep the cached blockhash"
+
+            client.invalidate_blockhash()
+            client.get_latest_blockhash()
+            assert mock_post.call_count == 5
+
+        print("  Read cache: PASSED")
+
+    except ImportError:
+        print("  Read cache: SKIPPED (httpx not installed)")
+
+
+def test_prefetch_accounts():
+    """Test prefetch_accounts fills the get_account_info cache in one call"""
+    print("Testing prefetch_accounts...")
+
+    try:
+        import httpx
+        from dex_adapter_universal.infra.rpc import RpcClient, RpcClientConfig
+
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.content = json.dumps({
+            "jsonrpc": "2.0",
+            "id": 1,
+            "result": {"value": [{"lamports": 1}, None]},
+        }).encode()
+        mock_response.raise_for_status = Mock()
+
+        with patch.object(httpx.Client, 'post', return_value=mock_response) as mock_post:
+            config = RpcClientConfig(account_info_cache_ttl=60.0)
+            client = RpcClient("https://api.mainnet-beta.solana.com", config)
+
+            client.prefetch_accounts(["a", "b", "a"])
+            assert mock_post.call_count == 1
+            body = json.loads(mock_post.call_args.kwargs["content"])
+            assert body["method"] == "getMultipleAccounts"
+            assert body["params"][0] == ["a", "b"]
+
+            assert client.get_account_info("a") == {"lamports": 1}
+            assert client.get_account_info("b") is None
+            client.prefetch_accounts(["b", "a"])
+            assert mock_post.call_count == 1, "Cached accounts should not be fetched again"
+
+        print("  prefetch_accounts: PASSED")
+
+    except ImportError:
+        print("  prefetch_accounts: SKIPPED (httpx not installed)")
+
+
+def test_decode_account_data():
+    """Test batch decoding of base64 account payloads"""
+    print("Testing decode_account_data...")
+
+    try:
+        import base64
+        from dex_adapter_universal.infra.rpc import RpcClient
+
+        values = [
+            {"data": [base64.b64encode(b"abc").decode(), "base64"]},
+            None,
+            {"data": base64.b64encode(b"\x01\x02").decode()},
+        ]
+        assert RpcClient.decode_account_data(values) == [b"abc", None, b"\x01\x02"]
+
+        accounts = [{"pubkey": "pk1", "account": {"data": [base64.b64encode(b"xyz").decode(), "base64"]}}]
+        assert RpcClient.decode_program_accounts(accounts) == [("pk1", b"xyz")]
+
+        print("  decode_account_data: PASSED")
+
+    except ImportError:
+        print("  decode_account_data: SKIPPED (httpx not installed)")
+
+
 def main():
     """Run all RPC mock tests"""
     print("=" * 60)
@@ -337,8 +910,22 @@ def main():
         test_rpc_rate_limit,
         test_rpc_timeout,
         test_rpc_endpoint_rotation,
+        test_rpc_non_retryable_status,
         test_get_account_info,
         test_get_account_info_not_found,
+        test_call_batch,
+        test_call_batch_error,
+        test_prefer_compressed,
+        test_get_multiple_accounts_chunked,
+        test_confirm_transactions,
+        test_confirm_transaction_ws,
+        test_confirm_transaction_ws_final_poll,
+        test_send_and_confirm_ws,
+        test_send_and_confirm_ws_stalled_ack,
+        test_acall_success,
+        test_read_cache,
+        test_prefetch_accounts,
+        test_decode_account_data,
     ]
 
     passed = 0
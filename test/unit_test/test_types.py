@@ -200,6 +200,25 @@ def test_quote_result():
     print("  QuoteResult: PASSED")
 
 
+def test_resolve_token_mint_runtime_registration():
+    """Test resolve_token_mint sees tokens registered after a lookup"""
+    from dex_adapter_universal.types.solana_tokens import resolve_token_mint
+
+    print("Testing resolve_token_mint registration...")
+
+    mint = "NewTokenMint1111111111111111111111111111111"
+    assert resolve_token_mint("NEWTKN") == "NEWTKN"
+    SOLANA_TOKEN_MINTS["NEWTKN"] = mint
+    try:
+        assert resolve_token_mint("newtkn") == mint
+        assert resolve_token_mint(" NEWTKN ") == mint
+    finally:
+        del SOLANA_TOKEN_MINTS["NEWTKN"]
+    assert resolve_token_mint("NEWTKN") == "NEWTKN"
+
+    print("  resolve_token_mint registration: PASSED")
+
+
 def main():
     """Run all type tests"""
     print("=" * 60)
@@ -213,6 +232,7 @@ def main():
         test_price_range,
         test_tx_result,
         test_quote_result,
+        test_resolve_token_mint_runtime_registration,
     ]
 
     passed = 0
@@ -8,14 +8,14 @@ Tests the multi-chain WalletModule API (Solana, ETH, BSC).
 import sys
 from pathlib import Path
 from decimal import Decimal
-from unittest.mock import Mock, MagicMock, patch
+from unittest.mock import AsyncMock, Mock, MagicMock, patch
 
 import pytest
 
 # Add parent to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
-from dex_adapter_universal.modules.wallet import WalletModule, TokenAccount, Chain
+from dex_adapter_universal.modules.wallet import WalletModule, AsyncWalletModule, TokenAccount, Chain
 from dex_adapter_universal.types.solana_tokens import SOLANA_TOKEN_MINTS
 
 
@@ -139,6 +139,19 @@ class TestWalletModuleSolana:
         """Test wallet.address returns client.pubkey"""
         assert wallet.address == "SolanaWalletAddress123"
 
+    def test_refresh_rereads_address(self, wallet, mock_client):
+        """Test refresh() picks up a changed client pubkey and RPC"""
+        mock_client.pubkey = "OtherWalletAddress456"
+        mock_client.rpc = Mock()
+        mock_client.rpc.get_balance.return_value = 1_000_000_000
+        assert wallet.address == "SolanaWalletAddress123"
+
+        wallet.refresh()
+
+        assert wallet.address == "OtherWalletAddress456"
+        assert wallet.balance("SOL", chain="sol") == Decimal("1")
+        mock_client.rpc.get_balance.assert_called_once_with("OtherWalletAddress456")
+
     def test_balance_sol(self, wallet, mock_client):
         """Test balance('SOL', chain='sol') returns native SOL balance"""
         mock_client.rpc.get_balance.return_value = 2_000_000_000
@@ -293,6 +306,29 @@ class TestWalletModuleSolana:
         assert SOLANA_TOKEN_MINTS["USDC"] in balances
         assert balances[SOLANA_TOKEN_MINTS["USDC"]] == Decimal("5")
 
+    def test_balances_fetches_concurrently(self, wallet, mock_client):
+        """Test balances() overlaps the SOL balance and token account reads"""
+        import threading
+
+        accounts_started = threading.Event()
+
+        def get_balance(address):
+            # Only returns if the token account read is already in flight
+            assert accounts_started.wait(5)
+            return 2_000_000_000
+
+        def get_token_accounts(owner, mint=None):
+            accounts_started.set()
+            return []
+
+        mock_client.rpc.get_balance.side_effect = get_balance
+        mock_client.rpc.get_token_accounts_by_owner.side_effect = get_token_accounts
+
+        try:
+            assert wallet.balances() == {WalletModule.WRAPPED_SOL: Decimal("2")}
+        finally:
+            wallet.close()
+
     def test_token_accounts(self, wallet, mock_client):
         """Test token_accounts returns list of TokenAccount objects"""
         mock_client.rpc.get_token_accounts_by_owner.return_value = [
@@ -334,6 +370,31 @@ class TestWalletModuleSolana:
 
         assert accounts == []
 
+    def test_token_accounts_without_token_amount(self, wallet, mock_client):
+        """Test accounts missing tokenAmount are still listed with a zero balance"""
+        mock_client.rpc.get_token_accounts_by_owner.return_value = [
+            {
+                "pubkey": "TokenAccountAddr",
+                "account": {
+                    "data": {
+                        "parsed": {
+                            "info": {
+                                "mint": SOLANA_TOKEN_MINTS["USDC"],
+                                "owner": "SolanaWalletAddress123",
+                            }
+                        }
+                    }
+                },
+            }
+        ]
+
+        accounts = wallet.token_accounts()
+
+        assert len(accounts) == 1
+        assert accounts[0].address == "TokenAccountAddr"
+        assert accounts[0].balance == Decimal(0)
+        assert accounts[0].decimals == 0
+
     def test_get_token_account(self, wallet, mock_client):
         """Test get_token_account returns account address"""
         mock_client.rpc.get_token_accounts_by_owner.return_value = [
@@ -352,6 +413,90 @@ class TestWalletModuleSolana:
 
         assert account is None
 
+    def test_get_token_account_prefers_ata(self, mock_client):
+        """Test get_token_account checks the associated token account before scanning"""
+        from solders.pubkey import Pubkey
+        from dex_adapter_universal.protocols.raydium.instructions import get_associated_token_address
+
+        owner = "9WzDXwBbmkg8ZTbNMqUxvQRAyrZzDsGYdLVL9zYtAWWM"
+        mint = SOLANA_TOKEN_MINTS["USDC"]
+        ata = str(get_associated_token_address(Pubkey.from_string(owner), Pubkey.from_string(mint)))
+
+        mock_client.pubkey = owner
+        wallet = WalletModule(mock_client)
+
+        mock_client.rpc.get_account_info.return_value = {"owner": "TokenkegQfeZyiNwAJbNbGKPFXCWuBvf9Ss623VQ5DA"}
+        assert wallet.get_token_account("USDC") == ata
+        mock_client.rpc.get_account_info.assert_called_once_with(ata)
+        mock_client.rpc.get_token_accounts_by_owner.assert_not_called()
+
+        # No ATA: fall back to scanning the owner's accounts for the mint
+        mock_client.rpc.get_account_info.return_value = None
+        mock_client.rpc.get_token_accounts_by_owner.return_value = [{"pubkey": "AuxAccount"}]
+        assert wallet.get_token_account("USDC") == "AuxAccount"
+        mock_client.rpc.get_token_accounts_by_owner.assert_called_once_with(owner, mint=mint)
+
+    def test_balances_for_reads_atas_in_one_call(self, mock_client):
+        """Test balances_for batches ATA reads and scans only tokens without one"""
+        owner = "9WzDXwBbmkg8ZTbNMqUxvQRAyrZzDsGYdLVL9zYtAWWM"
+        mock_client.pubkey = owner
+        wallet = WalletModule(mock_client)
+
+        mock_client.rpc.get_balance.return_value = 2_000_000_000
+        mock_client.rpc.get_multiple_accounts.return_value = [
+            {"data": {"parsed": {"info": {"tokenAmount": {"amount": "1500000", "decimals": 6}}}}},
+            None,
+        ]
+        mock_client.rpc.get_token_accounts_by_owner.return_value = [
+            {"account": {"data": {"parsed": {"info": {"tokenAmount": {"amount": "3000000", "decimals": 6}}}}}},
+        ]
+
+        balances = wallet.balances_for(["SOL", "USDC", "USDT", "usdc"])
+
+        assert balances == {
+            "SOL": Decimal("2"),
+            "USDC": Decimal("1.5"),
+            "USDT": Decimal("3"),
+            "usdc": Decimal("1.5"),
+        }
+        assert mock_client.rpc.get_multiple_accounts.call_count == 1
+        assert len(mock_client.rpc.get_multiple_accounts.call_args.args[0]) == 2
+        # Only the token without an ATA is scanned
+        mock_client.rpc.get_token_accounts_by_owner.assert_called_once_with(
+            owner, mint=SOLANA_TOKEN_MINTS["USDT"]
+        )
+
+        # ATA-only reads report 0 for tokens without one
+        mock_client.rpc.get_token_accounts_by_owner.reset_mock()
+        balances = wallet.balances_for(["USDC", "USDT"], all_accounts=False)
+        assert balances == {"USDC": Decimal("1.5"), "USDT": Decimal("0")}
+        mock_client.rpc.get_token_accounts_by_owner.assert_not_called()
+
+    def test_balances_for_token_2022_mint(self, mock_client):
+        """Test a Token-2022 mint (no classic ATA) reports its real balance"""
+        owner = "9WzDXwBbmkg8ZTbNMqUxvQRAyrZzDsGYdLVL9zYtAWWM"
+        mint_2022 = "2b1kV6DkPAnxd5ixfnxCpjxmKwqjjaYmCZfHsFu24GXo"  # PYUSD (Token-2022)
+        mock_client.pubkey = owner
+        wallet = WalletModule(mock_client)
+
+        # The classic-program ATA does not exist for a Token-2022 mint
+        mock_client.rpc.get_multiple_accounts.return_value = [None]
+        mock_client.rpc.get_token_accounts_by_owner.return_value = [
+            {
+                "pubkey": "Token2022Account",
+                "account": {
+                    "owner": "TokenzQdBNbLqP5VEhdkAS6EPFLC1PHnBqCXEpPxuEb",
+                    "data": {"parsed": {"info": {
+                        "mint": mint_2022,
+                        "tokenAmount": {"amount": "4200000", "decimals": 6},
+                    }}},
+                },
+            },
+        ]
+
+        assert wallet.balances_for([mint_2022]) == {mint_2022: Decimal("4.2")}
+        mock_client.rpc.get_token_accounts_by_owner.assert_called_once_with(owner, mint=mint_2022)
+
     def test_has_token_account_true(self, wallet, mock_client):
         """Test has_token_account returns True when account exists"""
         mock_client.rpc.get_token_accounts_by_owner.return_value = [
@@ -370,6 +515,53 @@ class TestWalletModuleSolana:
 
         assert result is False
 
+    def test_concurrent_token_account_reads_coalesced(self, wallet, mock_client):
+        """Test concurrent reads for the same mint share one RPC call"""
+        import threading
+        import time
+        from concurrent.futures import ThreadPoolExecutor
+
+        release = threading.Event()
+
+        def slow_fetch(owner, mint=None):
+            release.wait(5)
+            return [{"pubkey": "TokenAccountAddr"}]
+
+        mock_client.rpc.get_token_accounts_by_owner.side_effect = slow_fetch
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = [executor.submit(wallet.get_token_account, "USDC") for _ in range(4)]
+            time.sleep(0.1)
+            release.set()
+            results = [f.result() for f in futures]
+
+        assert results == ["TokenAccountAddr"] * 4
+        assert mock_client.rpc.get_token_accounts_by_owner.call_count == 1
+        mock_client.rpc.get_token_accounts_by_owner.assert_called_with(
+            "SolanaWalletAddress123", mint=SOLANA_TOKEN_MINTS["USDC"]
+        )
+
+    def test_balance_sees_runtime_registered_token(self, wallet, mock_client):
+        """Test a symbol added to the registry after a lookup resolves to its mint"""
+        mint = "NewTokenMint1111111111111111111111111111111"
+        mock_client.rpc.get_token_accounts_by_owner.return_value = []
+
+        wallet.balance("NEWTKN", chain="sol")
+        SOLANA_TOKEN_MINTS["NEWTKN"] = mint
+        try:
+            wallet.balance("NEWTKN", chain="sol")
+        finally:
+            del SOLANA_TOKEN_MINTS["NEWTKN"]
+
+        mints = [c.kwargs["mint"] for c in mock_client.rpc.get_token_accounts_by_owner.call_args_list]
+        assert mints == ["NEWTKN", mint]
+
+    def test_invalidate(self, wallet, mock_client):
+        """Test invalidate() clears the RPC read cache"""
+        wallet.invalidate()
+
+        mock_client.rpc.invalidate_cache.assert_called_once_with()
+
 
 class TestWalletModuleEVM:
     """Tests for WalletModule EVM operations"""
@@ -558,6 +750,57 @@ class TestWalletModuleClose:
         # Context manager should exit cleanly
 
 
+class TestAsyncWalletModule:
+    """Tests for AsyncWalletModule"""
+
+    @staticmethod
+    def _client():
+        client = Mock()
+        client.pubkey = "SolanaWalletAddress123"
+        client.rpc = Mock()
+        client.rpc.aget_balance = AsyncMock(return_value=1_500_000_000)
+        client.rpc.aget_token_accounts_by_owner = AsyncMock(return_value=[
+            {
+                "pubkey": "TokenAccount1",
+                "account": {
+                    "data": {
+                        "parsed": {
+                            "info": {
+                                "mint": SOLANA_TOKEN_MINTS["USDC"],
+                                "tokenAmount": {"amount": "2500000", "decimals": 6},
+                            }
+                        }
+                    }
+                },
+            },
+        ])
+        return client
+
+    def test_balances(self):
+        """Test balances() gathers SOL and token accounts"""
+        import asyncio
+
+        client = self._client()
+        balances = asyncio.run(AsyncWalletModule(client).balances())
+
+        assert balances[WalletModule.WRAPPED_SOL] == Decimal("1.5")
+        assert balances[SOLANA_TOKEN_MINTS["USDC"]] == Decimal("2.5")
+        client.rpc.aget_token_accounts_by_owner.assert_awaited_once_with("SolanaWalletAddress123")
+
+    def test_balance(self):
+        """Test balance() for SOL and an SPL token"""
+        import asyncio
+
+        client = self._client()
+        wallet = AsyncWalletModule(client)
+
+        assert asyncio.run(wallet.balance("SOL")) == Decimal("1.5")
+        assert asyncio.run(wallet.balance("USDC")) == Decimal("2.5")
+        client.rpc.aget_token_accounts_by_owner.assert_awaited_once_with(
+            "SolanaWalletAddress123", mint=SOLANA_TOKEN_MINTS["USDC"]
+        )
+
+
 def run_tests():
     """Run all unit tests"""
     import traceback
@@ -570,6 +813,7 @@ def run_tests():
         TestWalletModuleChainResolution,
         TestWalletModuleConstants,
         TestWalletModuleClose,
+        TestAsyncWalletModule,
     ]
 
     passed = 0